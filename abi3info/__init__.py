@@ -1,60 +1,246 @@
 """
 The abi3info APIs.
+
+Each of the top-level tables (e.g. `FUNCTIONS`) is an immutable mapping, loaded
+lazily the first time it's accessed. This means that `from abi3info import FUNCTIONS`
+only pays for loading `FUNCTIONS`, and not for any of the other tables.
+
+Within each table, the individual models (e.g. each `Function`) are also only
+built the first time they're accessed.
+
+The tables are safe to read concurrently from multiple threads without any
+locking, including on free-threaded builds of CPython: loading is idempotent,
+and every thread sees the same table and the same model objects.
+
+For cheap membership checks that don't need the full models, see `abi3info.names`.
+
+Applications that fork worker processes after importing `abi3info` (e.g. with
+`multiprocessing`'s `fork` start method) should call `prepare_for_fork` in the
+parent before forking, so that the workers can share the tables' memory.
 """
 
 from __future__ import annotations
 
-from typing import Final
+import gc
+import importlib
 
-from abi3info._internal import (
-    _DATAS,
-    _FEATURE_MACROS,
-    _FUNCTIONS,
-    _MACROS,
-    _STRUCTS,
-    _TYPEDEFS,
-)
-from abi3info.models import (
-    Data,
-    FeatureMacro,
-    Function,
-    Macro,
-    Struct,
-    Symbol,
-    Typedef,
-)
+# NOTE: We avoid importing `typing` (and `abi3info.models`) at runtime, so that
+# importing `abi3info` itself (e.g. on the way to `abi3info.names`) stays cheap.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from typing import Any, Final
+
+    from abi3info.models import (
+        Data,
+        FeatureMacro,
+        Function,
+        Macro,
+        PartialStruct,
+        Struct,
+        Symbol,
+        Typedef,
+    )
 
 __version__ = "2025.11.29"
 """
 The current version of abi3info.
 """
 
-DATAS: Final[dict[Symbol, Data]] = _DATAS
+# Each lazily loaded table, and the `abi3info._snapshot` loader that builds it.
+_TABLES: Final[dict[str, str]] = {
+    "DATAS": "datas",
+    "FEATURE_MACROS": "feature_macros",
+    "FUNCTIONS": "functions",
+    "MACROS": "macros",
+    "STRUCTS": "structs",
+    "STRUCT_MEMBERS": "struct_members",
+    "TYPEDEFS": "typedefs",
+    "LINUX_SYMBOLS": "linux_symbols",
+    "MACOS_SYMBOLS": "macos_symbols",
+    "WINDOWS_SYMBOLS": "windows_symbols",
+    "WINDOWS_IMPORT_SYMBOLS": "windows_import_symbols",
+}
+
+# Models that were historically importable from `abi3info` directly,
+# and are now loaded (from `abi3info.models`) on first access.
+_MODELS: Final[frozenset[str]] = frozenset(
+    {"Data", "FeatureMacro", "Function", "Macro", "Struct", "Symbol", "Typedef"}
+)
+
+# NOTE: `from abi3info import *` only sees the lazily loaded tables and models
+# (which aren't in this module's globals until they're loaded) through `__all__`.
+__all__ = [
+    *_TABLES,
+    *sorted(_MODELS),
+    "lookup_function",
+    "lookup_data",
+    "prepare_for_fork",
+]
+
+# NOTE: The tables below are declared but not assigned, so that accesses
+# fall through to the module-level `__getattr__` below.
+
+DATAS: Mapping[Symbol, Data]
 """
 Data object members of the limited API and stable ABI.
 """
 
-FEATURE_MACROS: Final[dict[str, FeatureMacro]] = _FEATURE_MACROS
+FEATURE_MACROS: Mapping[str, FeatureMacro]
 """
 Feature macros that control the availability of limited API members.
 """
 
-FUNCTIONS: Final[dict[Symbol, Function]] = _FUNCTIONS
+FUNCTIONS: Mapping[Symbol, Function]
 """
 Function members of the limited API and stable ABI.
 """
 
-MACROS: Final[dict[str, Macro]] = _MACROS
+MACROS: Mapping[str, Macro]
 """
 Macro members of the limited API.
 """
 
-STRUCTS: Final[dict[str, Struct]] = _STRUCTS
+STRUCTS: Mapping[str, Struct]
 """
 Struct members of the limited API.
 """
 
-TYPEDEFS: Final[dict[str, Typedef]] = _TYPEDEFS
+STRUCT_MEMBERS: Mapping[str, tuple[PartialStruct, ...]]
+"""
+The stable members of partial structs in the stable ABI (see `PartialStruct`),
+mapped to the structs that they're members of, e.g. `ob_refcnt` to `PyObject`.
+"""
+
+TYPEDEFS: Mapping[str, Typedef]
 """
 Typedef members of the limited API.
 """
+
+LINUX_SYMBOLS: Mapping[str, Function | Data]
+"""
+Function and data object members of the stable ABI, by their Linux symbol names
+(see `Symbol.linux`).
+
+Like the other symbol tables below, this shares its entries with `FUNCTIONS`
+and `DATAS`, and doesn't store any mangled names of its own.
+"""
+
+MACOS_SYMBOLS: Mapping[str, Function | Data]
+"""
+Function and data object members of the stable ABI, by their macOS symbol names
+(see `Symbol.macos`), e.g. `_Py_Initialize`.
+"""
+
+WINDOWS_SYMBOLS: Mapping[str, Function | Data]
+"""
+Function and data object members of the stable ABI, by their Windows DLL export
+names (see `Symbol.windows`).
+"""
+
+WINDOWS_IMPORT_SYMBOLS: Mapping[str, Function | Data]
+"""
+Function and data object members of the stable ABI, by their Windows import
+library names (see `Symbol.windows_import`), e.g. `__imp_Py_Initialize`.
+"""
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Loads the requested table on first access, and caches it on this module
+    so that subsequent accesses don't go through `__getattr__` again.
+    """
+    if name in _TABLES:
+        snapshot = importlib.import_module("abi3info._snapshot")
+        value = getattr(snapshot, _TABLES[name])()
+    elif name in _MODELS:
+        value = getattr(importlib.import_module("abi3info.models"), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # NOTE: If several threads race to load the same attribute, only the
+    # first one to finish is kept, and all of them return it.
+    return globals().setdefault(name, value)
+
+
+def _load_table(name: str) -> Any:
+    """
+    Returns the named table, loading it if necessary.
+    """
+    try:
+        return globals()[name]
+    except KeyError:
+        return __getattr__(name)
+
+
+def lookup_function(name: str | bytes | Symbol) -> Function | None:
+    """
+    Returns the `Function` for the symbol named `name`, or `None` if there isn't one.
+
+    This is equivalent to `FUNCTIONS.get(Symbol(name))`, but doesn't construct
+    a `Symbol`. `name` may also be `bytes` (e.g. as read from a binary's symbol
+    table), which is decoded as UTF-8, or a `Symbol`, which is looked up by its
+    `Symbol.name`.
+
+    `name` is the bare symbol name, i.e. `Symbol.name`; to look up
+    a platform-mangled name, use e.g. `MACOS_SYMBOLS`.
+    """
+    return _load_table("FUNCTIONS")._get_name(name)  # type: ignore[no-any-return]
+
+
+def lookup_data(name: str | bytes | Symbol) -> Data | None:
+    """
+    Returns the `Data` for the symbol named `name`, or `None` if there isn't one.
+
+    See `lookup_function`.
+    """
+    return _load_table("DATAS")._get_name(name)  # type: ignore[no-any-return]
+
+
+def prepare_for_fork() -> None:
+    """
+    Prepares `abi3info` for sharing with forked child processes.
+
+    This eagerly loads every table (as well as `abi3info.names`), builds (and
+    hashes) every model in them, and builds the indexes used by `abi3info.surface` and
+    `abi3info.search`, so that nothing in `abi3info` is lazily populated after
+    a fork. It then moves all currently tracked objects into the garbage
+    collector's permanent generation with `gc.freeze()`, so that collections in
+    the children don't write to them either.
+
+    Together, these keep the pages holding the tables from being copied into
+    each child on write. Call this in the parent process, immediately before
+    forking; it's safe (but unnecessary) to call more than once.
+
+    Note that reading objects still updates their reference counts on builds of
+    CPython without immortal objects, which can dirty some pages regardless.
+    """
+    importlib.import_module("abi3info.names")
+    for name in _TABLES:
+        _load_table(name)._build_all()
+
+    # NOTE: `Function`s and `Data`s cache their hashes on first use.
+    for name in ("FUNCTIONS", "DATAS"):
+        for value in _load_table(name).values():
+            hash(value)
+
+    snapshot = importlib.import_module("abi3info._snapshot")
+    for loader in snapshot._VERSIONED_LOADERS:
+        snapshot.version_index(loader)._values()
+    snapshot.symbol_versions()
+    snapshot.symbol_ids()
+    snapshot.version_masks()
+    snapshot.feature_macro_masks()
+    snapshot.name_index()
+
+    # NOTE: Collect first, so that any garbage from loading doesn't get frozen
+    # (and leaked) along with everything else.
+    gc.collect()
+    gc.freeze()
+
+
+def __dir__() -> list[str]:
+    """
+    Returns this module's attributes, including tables that haven't been loaded yet.
+    """
+    return sorted({*globals(), *_TABLES, *_MODELS})
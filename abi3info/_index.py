@@ -0,0 +1,150 @@
+"""
+Sorted indexes over the rows of tables.
+
+These are kept apart from `abi3info._table`, and only imported when an index is
+first built, so that the first table lookup doesn't pay for their imports.
+
+This module should not be used directly; it is not a public API.
+"""
+
+from __future__ import annotations
+
+import bisect
+import fnmatch
+import re
+import sys
+from collections.abc import Iterator, Sequence
+from typing import Any, Generic, TypeVar
+
+from abi3info._table import Table, _Immutable
+from abi3info.models import PyVersion
+
+V = TypeVar("V")
+
+
+class VersionIndex(_Immutable, Generic[V]):
+    """
+    An index of a table's rows, sorted by the version that each row was added in.
+
+    The index is built from the table's `added` column (as `PY_VERSION_HEX`-style
+    integers; see `PyVersion.to_hex`), so building it doesn't build any of the
+    table's values. The first query builds all of them, in sorted order, after
+    which each query is a bisection and a slice.
+    """
+
+    __slots__ = ("_table", "_codes", "_rows", "_sorted")
+
+    _table: Table[Any, V]
+    _codes: tuple[int, ...]
+    _rows: tuple[int, ...]
+    _sorted: dict[None, tuple[V, ...]]
+
+    def __init__(self, table: Table[Any, V], added: Sequence[int]) -> None:
+        """
+        Creates a new `VersionIndex` over `table`, where `added[idx]` is the
+        version that row `idx` was added in.
+        """
+        # NOTE: `sorted` is stable, so rows added in the same version stay in table order.
+        rows = tuple(sorted(range(len(table)), key=added.__getitem__))
+        _set = object.__setattr__
+        _set(self, "_table", table)
+        _set(self, "_codes", tuple(added[row] for row in rows))
+        _set(self, "_rows", rows)
+        _set(self, "_sorted", {})
+
+    def _values(self) -> tuple[V, ...]:
+        """
+        Returns every value in the table, in index order, building them if necessary.
+        """
+        try:
+            return self._sorted[None]
+        except KeyError:
+            values = tuple(map(self._table._value, self._rows))
+            return self._sorted.setdefault(None, values)
+
+    def at(self, version: PyVersion) -> tuple[V, ...]:
+        """
+        Returns the values that were added in or before `version`, in the order
+        that they were added.
+        """
+        return self._values()[: bisect.bisect_right(self._codes, version.to_hex())]
+
+    def between(self, start: PyVersion, end: PyVersion) -> tuple[V, ...]:
+        """
+        Returns the values that were added after `start`, up to and including
+        `end`, in the order that they were added.
+        """
+        codes = self._codes
+        return self._values()[
+            bisect.bisect_right(codes, start.to_hex()) : bisect.bisect_right(codes, end.to_hex())
+        ]
+
+
+class NameIndex(_Immutable, Generic[V]):
+    """
+    An index of the rows of one or more tables, sorted by name.
+
+    Queries bisect the sorted names for the range of rows that can match, and
+    then lazily build (and, for `glob`, filter) the values in that range only.
+    Building the index doesn't build any of the tables' values.
+    """
+
+    __slots__ = ("_names", "_tables", "_rows")
+
+    _names: tuple[str, ...]
+    _tables: tuple[Table[Any, V], ...]
+    _rows: tuple[int, ...]
+
+    def __init__(self, tables: tuple[Table[Any, V], ...]) -> None:
+        """
+        Creates a new `NameIndex` over `tables`.
+
+        Rows with the same name (in different tables) are ordered by table.
+        """
+        entries = sorted(
+            (name, pos, idx)
+            for pos, table in enumerate(tables)
+            for idx, name in enumerate(table._names)
+        )
+        _set = object.__setattr__
+        _set(self, "_names", tuple(name for name, _, _ in entries))
+        _set(self, "_tables", tuple(tables[pos] for _, pos, _ in entries))
+        _set(self, "_rows", tuple(idx for _, _, idx in entries))
+
+    def _range(self, prefix: str) -> range:
+        """
+        Returns the range of positions in the index whose names start with `prefix`.
+        """
+        names = self._names
+        start = bisect.bisect_left(names, prefix)
+        # NOTE: Every name starting with `prefix` sorts before `prefix` with its
+        # last character incremented (ignoring any that can't be incremented).
+        stop = len(names)
+        bound = prefix.rstrip(chr(sys.maxunicode))
+        if bound:
+            stop = bisect.bisect_left(names, bound[:-1] + chr(ord(bound[-1]) + 1), start)
+        return range(start, stop)
+
+    def _value(self, pos: int) -> V:
+        """
+        Returns the value at the given position in the index, building it if necessary.
+        """
+        return self._tables[pos]._value(self._rows[pos])
+
+    def prefix(self, prefix: str) -> Iterator[V]:
+        """
+        Returns an iterator over the values whose names start with `prefix`, in
+        name order.
+        """
+        return map(self._value, self._range(prefix))
+
+    def glob(self, pattern: str) -> Iterator[V]:
+        """
+        Returns an iterator over the values whose names match the shell-style
+        (case-sensitive) `pattern`, in name order; see `fnmatch.fnmatchcase`.
+        """
+        # NOTE: Only names starting with the pattern's literal prefix can match.
+        literal = re.split(r"[*?[]", pattern, maxsplit=1)[0]
+        match = re.compile(fnmatch.translate(pattern)).match
+        names = self._names
+        return (self._value(pos) for pos in self._range(literal) if match(names[pos]))
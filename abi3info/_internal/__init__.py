@@ -0,0 +1,7 @@
+"""
+Generated definitions and data structures for abi3info.
+
+This module should not be used directly; it is not a public API.
+"""
+
+from __future__ import annotations
@@ -0,0 +1,874 @@
+"""
+Generated data object definitions for abi3info.
+
+This module should not be used directly; it is not a public API.
+"""
+
+from __future__ import annotations
+
+from typing import Final
+
+from abi3info._internal._feature_macros import _FEATURE_MACROS
+from abi3info.models import Data, PyVersion, Symbol
+
+# this file was generated; do not modify it by hand!
+_DATAS: Final[dict[Symbol, Data]] = {
+    Symbol(name="PyBaseObject_Type", visibility=None): Data(
+        symbol=Symbol(name="PyBaseObject_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyBool_Type", visibility=None): Data(
+        symbol=Symbol(name="PyBool_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyByteArrayIter_Type", visibility=None): Data(
+        symbol=Symbol(name="PyByteArrayIter_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyByteArray_Type", visibility=None): Data(
+        symbol=Symbol(name="PyByteArray_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyBytesIter_Type", visibility=None): Data(
+        symbol=Symbol(name="PyBytesIter_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyBytes_Type", visibility=None): Data(
+        symbol=Symbol(name="PyBytes_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyCFunction_Type", visibility=None): Data(
+        symbol=Symbol(name="PyCFunction_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyCallIter_Type", visibility=None): Data(
+        symbol=Symbol(name="PyCallIter_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyCapsule_Type", visibility=None): Data(
+        symbol=Symbol(name="PyCapsule_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyClassMethodDescr_Type", visibility=None): Data(
+        symbol=Symbol(name="PyClassMethodDescr_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyComplex_Type", visibility=None): Data(
+        symbol=Symbol(name="PyComplex_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyDictItems_Type", visibility=None): Data(
+        symbol=Symbol(name="PyDictItems_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyDictIterItem_Type", visibility=None): Data(
+        symbol=Symbol(name="PyDictIterItem_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyDictIterKey_Type", visibility=None): Data(
+        symbol=Symbol(name="PyDictIterKey_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyDictIterValue_Type", visibility=None): Data(
+        symbol=Symbol(name="PyDictIterValue_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyDictKeys_Type", visibility=None): Data(
+        symbol=Symbol(name="PyDictKeys_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyDictProxy_Type", visibility=None): Data(
+        symbol=Symbol(name="PyDictProxy_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyDictValues_Type", visibility=None): Data(
+        symbol=Symbol(name="PyDictValues_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyDict_Type", visibility=None): Data(
+        symbol=Symbol(name="PyDict_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyEllipsis_Type", visibility=None): Data(
+        symbol=Symbol(name="PyEllipsis_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyEnum_Type", visibility=None): Data(
+        symbol=Symbol(name="PyEnum_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_ArithmeticError", visibility=None): Data(
+        symbol=Symbol(name="PyExc_ArithmeticError", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_AssertionError", visibility=None): Data(
+        symbol=Symbol(name="PyExc_AssertionError", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_AttributeError", visibility=None): Data(
+        symbol=Symbol(name="PyExc_AttributeError", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_BaseException", visibility=None): Data(
+        symbol=Symbol(name="PyExc_BaseException", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_BaseExceptionGroup", visibility=None): Data(
+        symbol=Symbol(name="PyExc_BaseExceptionGroup", visibility=None),
+        added=PyVersion.intern(major=3, minor=11),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_BufferError", visibility=None): Data(
+        symbol=Symbol(name="PyExc_BufferError", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_BytesWarning", visibility=None): Data(
+        symbol=Symbol(name="PyExc_BytesWarning", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_DeprecationWarning", visibility=None): Data(
+        symbol=Symbol(name="PyExc_DeprecationWarning", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_EOFError", visibility=None): Data(
+        symbol=Symbol(name="PyExc_EOFError", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_EnvironmentError", visibility=None): Data(
+        symbol=Symbol(name="PyExc_EnvironmentError", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_Exception", visibility=None): Data(
+        symbol=Symbol(name="PyExc_Exception", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_FloatingPointError", visibility=None): Data(
+        symbol=Symbol(name="PyExc_FloatingPointError", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_FutureWarning", visibility=None): Data(
+        symbol=Symbol(name="PyExc_FutureWarning", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_GeneratorExit", visibility=None): Data(
+        symbol=Symbol(name="PyExc_GeneratorExit", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_IOError", visibility=None): Data(
+        symbol=Symbol(name="PyExc_IOError", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_ImportError", visibility=None): Data(
+        symbol=Symbol(name="PyExc_ImportError", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_ImportWarning", visibility=None): Data(
+        symbol=Symbol(name="PyExc_ImportWarning", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_IndentationError", visibility=None): Data(
+        symbol=Symbol(name="PyExc_IndentationError", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_IndexError", visibility=None): Data(
+        symbol=Symbol(name="PyExc_IndexError", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_KeyError", visibility=None): Data(
+        symbol=Symbol(name="PyExc_KeyError", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_KeyboardInterrupt", visibility=None): Data(
+        symbol=Symbol(name="PyExc_KeyboardInterrupt", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_LookupError", visibility=None): Data(
+        symbol=Symbol(name="PyExc_LookupError", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_MemoryError", visibility=None): Data(
+        symbol=Symbol(name="PyExc_MemoryError", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_NameError", visibility=None): Data(
+        symbol=Symbol(name="PyExc_NameError", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_NotImplementedError", visibility=None): Data(
+        symbol=Symbol(name="PyExc_NotImplementedError", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_OSError", visibility=None): Data(
+        symbol=Symbol(name="PyExc_OSError", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_OverflowError", visibility=None): Data(
+        symbol=Symbol(name="PyExc_OverflowError", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_PendingDeprecationWarning", visibility=None): Data(
+        symbol=Symbol(name="PyExc_PendingDeprecationWarning", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_ReferenceError", visibility=None): Data(
+        symbol=Symbol(name="PyExc_ReferenceError", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_RuntimeError", visibility=None): Data(
+        symbol=Symbol(name="PyExc_RuntimeError", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_RuntimeWarning", visibility=None): Data(
+        symbol=Symbol(name="PyExc_RuntimeWarning", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_StopIteration", visibility=None): Data(
+        symbol=Symbol(name="PyExc_StopIteration", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_SyntaxError", visibility=None): Data(
+        symbol=Symbol(name="PyExc_SyntaxError", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_SyntaxWarning", visibility=None): Data(
+        symbol=Symbol(name="PyExc_SyntaxWarning", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_SystemError", visibility=None): Data(
+        symbol=Symbol(name="PyExc_SystemError", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_SystemExit", visibility=None): Data(
+        symbol=Symbol(name="PyExc_SystemExit", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_TabError", visibility=None): Data(
+        symbol=Symbol(name="PyExc_TabError", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_TypeError", visibility=None): Data(
+        symbol=Symbol(name="PyExc_TypeError", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_UnboundLocalError", visibility=None): Data(
+        symbol=Symbol(name="PyExc_UnboundLocalError", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_UnicodeDecodeError", visibility=None): Data(
+        symbol=Symbol(name="PyExc_UnicodeDecodeError", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_UnicodeEncodeError", visibility=None): Data(
+        symbol=Symbol(name="PyExc_UnicodeEncodeError", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_UnicodeError", visibility=None): Data(
+        symbol=Symbol(name="PyExc_UnicodeError", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_UnicodeTranslateError", visibility=None): Data(
+        symbol=Symbol(name="PyExc_UnicodeTranslateError", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_UnicodeWarning", visibility=None): Data(
+        symbol=Symbol(name="PyExc_UnicodeWarning", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_UserWarning", visibility=None): Data(
+        symbol=Symbol(name="PyExc_UserWarning", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_ValueError", visibility=None): Data(
+        symbol=Symbol(name="PyExc_ValueError", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_Warning", visibility=None): Data(
+        symbol=Symbol(name="PyExc_Warning", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_ZeroDivisionError", visibility=None): Data(
+        symbol=Symbol(name="PyExc_ZeroDivisionError", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyFilter_Type", visibility=None): Data(
+        symbol=Symbol(name="PyFilter_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyFloat_Type", visibility=None): Data(
+        symbol=Symbol(name="PyFloat_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyFrozenSet_Type", visibility=None): Data(
+        symbol=Symbol(name="PyFrozenSet_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyGetSetDescr_Type", visibility=None): Data(
+        symbol=Symbol(name="PyGetSetDescr_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyListIter_Type", visibility=None): Data(
+        symbol=Symbol(name="PyListIter_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyListRevIter_Type", visibility=None): Data(
+        symbol=Symbol(name="PyListRevIter_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyList_Type", visibility=None): Data(
+        symbol=Symbol(name="PyList_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyLongRangeIter_Type", visibility=None): Data(
+        symbol=Symbol(name="PyLongRangeIter_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyLong_Type", visibility=None): Data(
+        symbol=Symbol(name="PyLong_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyMap_Type", visibility=None): Data(
+        symbol=Symbol(name="PyMap_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyMemberDescr_Type", visibility=None): Data(
+        symbol=Symbol(name="PyMemberDescr_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyMemoryView_Type", visibility=None): Data(
+        symbol=Symbol(name="PyMemoryView_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyMethodDescr_Type", visibility=None): Data(
+        symbol=Symbol(name="PyMethodDescr_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyModule_Type", visibility=None): Data(
+        symbol=Symbol(name="PyModule_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyOS_InputHook", visibility=None): Data(
+        symbol=Symbol(name="PyOS_InputHook", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyProperty_Type", visibility=None): Data(
+        symbol=Symbol(name="PyProperty_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyRangeIter_Type", visibility=None): Data(
+        symbol=Symbol(name="PyRangeIter_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyRange_Type", visibility=None): Data(
+        symbol=Symbol(name="PyRange_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyReversed_Type", visibility=None): Data(
+        symbol=Symbol(name="PyReversed_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PySeqIter_Type", visibility=None): Data(
+        symbol=Symbol(name="PySeqIter_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PySetIter_Type", visibility=None): Data(
+        symbol=Symbol(name="PySetIter_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PySet_Type", visibility=None): Data(
+        symbol=Symbol(name="PySet_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PySlice_Type", visibility=None): Data(
+        symbol=Symbol(name="PySlice_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PySuper_Type", visibility=None): Data(
+        symbol=Symbol(name="PySuper_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyTraceBack_Type", visibility=None): Data(
+        symbol=Symbol(name="PyTraceBack_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyTupleIter_Type", visibility=None): Data(
+        symbol=Symbol(name="PyTupleIter_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyTuple_Type", visibility=None): Data(
+        symbol=Symbol(name="PyTuple_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyType_Type", visibility=None): Data(
+        symbol=Symbol(name="PyType_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyUnicodeIter_Type", visibility=None): Data(
+        symbol=Symbol(name="PyUnicodeIter_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyUnicode_Type", visibility=None): Data(
+        symbol=Symbol(name="PyUnicode_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyWrapperDescr_Type", visibility=None): Data(
+        symbol=Symbol(name="PyWrapperDescr_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyZip_Type", visibility=None): Data(
+        symbol=Symbol(name="PyZip_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="Py_FileSystemDefaultEncoding", visibility=None): Data(
+        symbol=Symbol(name="Py_FileSystemDefaultEncoding", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="Py_HasFileSystemDefaultEncoding", visibility=None): Data(
+        symbol=Symbol(name="Py_HasFileSystemDefaultEncoding", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="_PyWeakref_CallableProxyType", visibility=None): Data(
+        symbol=Symbol(name="_PyWeakref_CallableProxyType", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=True,
+    ),
+    Symbol(name="_PyWeakref_ProxyType", visibility=None): Data(
+        symbol=Symbol(name="_PyWeakref_ProxyType", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=True,
+    ),
+    Symbol(name="_PyWeakref_RefType", visibility=None): Data(
+        symbol=Symbol(name="_PyWeakref_RefType", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=True,
+    ),
+    Symbol(name="_Py_EllipsisObject", visibility=None): Data(
+        symbol=Symbol(name="_Py_EllipsisObject", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=True,
+    ),
+    Symbol(name="_Py_FalseStruct", visibility=None): Data(
+        symbol=Symbol(name="_Py_FalseStruct", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=True,
+    ),
+    Symbol(name="_Py_NoneStruct", visibility=None): Data(
+        symbol=Symbol(name="_Py_NoneStruct", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=True,
+    ),
+    Symbol(name="_Py_NotImplementedStruct", visibility=None): Data(
+        symbol=Symbol(name="_Py_NotImplementedStruct", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=True,
+    ),
+    Symbol(name="_Py_SwappedOp", visibility=None): Data(
+        symbol=Symbol(name="_Py_SwappedOp", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=True,
+    ),
+    Symbol(name="_Py_TrueStruct", visibility=None): Data(
+        symbol=Symbol(name="_Py_TrueStruct", visibility=None),
+        added=PyVersion.intern(major=3, minor=2),
+        ifdef=None,
+        abi_only=True,
+    ),
+    Symbol(name="PyModuleDef_Type", visibility=None): Data(
+        symbol=Symbol(name="PyModuleDef_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=5),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_ModuleNotFoundError", visibility=None): Data(
+        symbol=Symbol(name="PyExc_ModuleNotFoundError", visibility=None),
+        added=PyVersion.intern(major=3, minor=6),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_BlockingIOError", visibility=None): Data(
+        symbol=Symbol(name="PyExc_BlockingIOError", visibility=None),
+        added=PyVersion.intern(major=3, minor=7),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_BrokenPipeError", visibility=None): Data(
+        symbol=Symbol(name="PyExc_BrokenPipeError", visibility=None),
+        added=PyVersion.intern(major=3, minor=7),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_ChildProcessError", visibility=None): Data(
+        symbol=Symbol(name="PyExc_ChildProcessError", visibility=None),
+        added=PyVersion.intern(major=3, minor=7),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_ConnectionAbortedError", visibility=None): Data(
+        symbol=Symbol(name="PyExc_ConnectionAbortedError", visibility=None),
+        added=PyVersion.intern(major=3, minor=7),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_ConnectionError", visibility=None): Data(
+        symbol=Symbol(name="PyExc_ConnectionError", visibility=None),
+        added=PyVersion.intern(major=3, minor=7),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_ConnectionRefusedError", visibility=None): Data(
+        symbol=Symbol(name="PyExc_ConnectionRefusedError", visibility=None),
+        added=PyVersion.intern(major=3, minor=7),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_ConnectionResetError", visibility=None): Data(
+        symbol=Symbol(name="PyExc_ConnectionResetError", visibility=None),
+        added=PyVersion.intern(major=3, minor=7),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_FileExistsError", visibility=None): Data(
+        symbol=Symbol(name="PyExc_FileExistsError", visibility=None),
+        added=PyVersion.intern(major=3, minor=7),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_FileNotFoundError", visibility=None): Data(
+        symbol=Symbol(name="PyExc_FileNotFoundError", visibility=None),
+        added=PyVersion.intern(major=3, minor=7),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_InterruptedError", visibility=None): Data(
+        symbol=Symbol(name="PyExc_InterruptedError", visibility=None),
+        added=PyVersion.intern(major=3, minor=7),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_IsADirectoryError", visibility=None): Data(
+        symbol=Symbol(name="PyExc_IsADirectoryError", visibility=None),
+        added=PyVersion.intern(major=3, minor=7),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_NotADirectoryError", visibility=None): Data(
+        symbol=Symbol(name="PyExc_NotADirectoryError", visibility=None),
+        added=PyVersion.intern(major=3, minor=7),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_PermissionError", visibility=None): Data(
+        symbol=Symbol(name="PyExc_PermissionError", visibility=None),
+        added=PyVersion.intern(major=3, minor=7),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_ProcessLookupError", visibility=None): Data(
+        symbol=Symbol(name="PyExc_ProcessLookupError", visibility=None),
+        added=PyVersion.intern(major=3, minor=7),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_RecursionError", visibility=None): Data(
+        symbol=Symbol(name="PyExc_RecursionError", visibility=None),
+        added=PyVersion.intern(major=3, minor=7),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_ResourceWarning", visibility=None): Data(
+        symbol=Symbol(name="PyExc_ResourceWarning", visibility=None),
+        added=PyVersion.intern(major=3, minor=7),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_StopAsyncIteration", visibility=None): Data(
+        symbol=Symbol(name="PyExc_StopAsyncIteration", visibility=None),
+        added=PyVersion.intern(major=3, minor=7),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_TimeoutError", visibility=None): Data(
+        symbol=Symbol(name="PyExc_TimeoutError", visibility=None),
+        added=PyVersion.intern(major=3, minor=7),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_WindowsError", visibility=None): Data(
+        symbol=Symbol(name="PyExc_WindowsError", visibility=None),
+        added=PyVersion.intern(major=3, minor=7),
+        ifdef=_FEATURE_MACROS["MS_WINDOWS"],
+        abi_only=False,
+    ),
+    Symbol(name="Py_UTF8Mode", visibility=None): Data(
+        symbol=Symbol(name="Py_UTF8Mode", visibility=None),
+        added=PyVersion.intern(major=3, minor=8),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyDictRevIterItem_Type", visibility=None): Data(
+        symbol=Symbol(name="PyDictRevIterItem_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=8),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyDictRevIterKey_Type", visibility=None): Data(
+        symbol=Symbol(name="PyDictRevIterKey_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=8),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyDictRevIterValue_Type", visibility=None): Data(
+        symbol=Symbol(name="PyDictRevIterValue_Type", visibility=None),
+        added=PyVersion.intern(major=3, minor=8),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="Py_GenericAliasType", visibility=None): Data(
+        symbol=Symbol(name="Py_GenericAliasType", visibility=None),
+        added=PyVersion.intern(major=3, minor=9),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="Py_FileSystemDefaultEncodeErrors", visibility=None): Data(
+        symbol=Symbol(name="Py_FileSystemDefaultEncodeErrors", visibility=None),
+        added=PyVersion.intern(major=3, minor=10),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="PyExc_EncodingWarning", visibility=None): Data(
+        symbol=Symbol(name="PyExc_EncodingWarning", visibility=None),
+        added=PyVersion.intern(major=3, minor=10),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="_Py_RefTotal", visibility=None): Data(
+        symbol=Symbol(name="_Py_RefTotal", visibility=None),
+        added=PyVersion.intern(major=3, minor=10),
+        ifdef=_FEATURE_MACROS["Py_REF_DEBUG"],
+        abi_only=True,
+    ),
+    Symbol(name="PyStructSequence_UnnamedField", visibility=None): Data(
+        symbol=Symbol(name="PyStructSequence_UnnamedField", visibility=None),
+        added=PyVersion.intern(major=3, minor=11),
+        ifdef=None,
+        abi_only=False,
+    ),
+    Symbol(name="Py_Version", visibility=None): Data(
+        symbol=Symbol(name="Py_Version", visibility=None),
+        added=PyVersion.intern(major=3, minor=11),
+        ifdef=None,
+        abi_only=False,
+    ),
+}
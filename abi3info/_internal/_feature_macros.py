@@ -0,0 +1,31 @@
+"""
+Generated feature macro definitions for abi3info.
+
+This module should not be used directly; it is not a public API.
+"""
+
+from __future__ import annotations
+
+from typing import Final
+
+from abi3info.models import FeatureMacro
+
+# this file was generated; do not modify it by hand!
+_FEATURE_MACROS: Final[dict[str, FeatureMacro]] = {
+    "MS_WINDOWS": FeatureMacro(name="MS_WINDOWS", doc="on Windows", windows=True),
+    "HAVE_FORK": FeatureMacro(name="HAVE_FORK", doc="on platforms with fork()", windows=False),
+    "USE_STACKCHECK": FeatureMacro(
+        name="USE_STACKCHECK", doc="on platforms with USE_STACKCHECK", windows="maybe"
+    ),
+    "PY_HAVE_THREAD_NATIVE_ID": FeatureMacro(
+        name="PY_HAVE_THREAD_NATIVE_ID", doc="on platforms with native thread IDs", windows=True
+    ),
+    "Py_REF_DEBUG": FeatureMacro(
+        name="Py_REF_DEBUG",
+        doc="when Python is compiled in debug mode (with Py_REF_DEBUG)",
+        windows="maybe",
+    ),
+    "Py_TRACE_REFS": FeatureMacro(
+        name="Py_TRACE_REFS", doc="when Python is compiled with Py_TRACE_REFS", windows="maybe"
+    ),
+}
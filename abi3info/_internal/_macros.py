@@ -0,0 +1,275 @@
+"""
+Generated macro definitions for abi3info.
+
+This module should not be used directly; it is not a public API.
+"""
+
+from __future__ import annotations
+
+from typing import Final
+
+from abi3info.models import Macro, PyVersion
+
+# this file was generated; do not modify it by hand!
+_MACROS: Final[dict[str, Macro]] = {
+    "Py_tp_dealloc": Macro(name="Py_tp_dealloc", added=PyVersion.intern(major=3, minor=2)),
+    "Py_tp_getattr": Macro(name="Py_tp_getattr", added=PyVersion.intern(major=3, minor=2)),
+    "Py_tp_setattr": Macro(name="Py_tp_setattr", added=PyVersion.intern(major=3, minor=2)),
+    "Py_tp_repr": Macro(name="Py_tp_repr", added=PyVersion.intern(major=3, minor=2)),
+    "Py_tp_hash": Macro(name="Py_tp_hash", added=PyVersion.intern(major=3, minor=2)),
+    "Py_tp_call": Macro(name="Py_tp_call", added=PyVersion.intern(major=3, minor=2)),
+    "Py_tp_str": Macro(name="Py_tp_str", added=PyVersion.intern(major=3, minor=2)),
+    "Py_tp_getattro": Macro(name="Py_tp_getattro", added=PyVersion.intern(major=3, minor=2)),
+    "Py_tp_setattro": Macro(name="Py_tp_setattro", added=PyVersion.intern(major=3, minor=2)),
+    "Py_tp_doc": Macro(name="Py_tp_doc", added=PyVersion.intern(major=3, minor=2)),
+    "Py_tp_traverse": Macro(name="Py_tp_traverse", added=PyVersion.intern(major=3, minor=2)),
+    "Py_tp_clear": Macro(name="Py_tp_clear", added=PyVersion.intern(major=3, minor=2)),
+    "Py_tp_richcompare": Macro(name="Py_tp_richcompare", added=PyVersion.intern(major=3, minor=2)),
+    "Py_tp_iter": Macro(name="Py_tp_iter", added=PyVersion.intern(major=3, minor=2)),
+    "Py_tp_iternext": Macro(name="Py_tp_iternext", added=PyVersion.intern(major=3, minor=2)),
+    "Py_tp_methods": Macro(name="Py_tp_methods", added=PyVersion.intern(major=3, minor=2)),
+    "Py_tp_base": Macro(name="Py_tp_base", added=PyVersion.intern(major=3, minor=2)),
+    "Py_tp_descr_get": Macro(name="Py_tp_descr_get", added=PyVersion.intern(major=3, minor=2)),
+    "Py_tp_descr_set": Macro(name="Py_tp_descr_set", added=PyVersion.intern(major=3, minor=2)),
+    "Py_tp_init": Macro(name="Py_tp_init", added=PyVersion.intern(major=3, minor=2)),
+    "Py_tp_alloc": Macro(name="Py_tp_alloc", added=PyVersion.intern(major=3, minor=2)),
+    "Py_tp_new": Macro(name="Py_tp_new", added=PyVersion.intern(major=3, minor=2)),
+    "Py_tp_members": Macro(name="Py_tp_members", added=PyVersion.intern(major=3, minor=2)),
+    "Py_tp_getset": Macro(name="Py_tp_getset", added=PyVersion.intern(major=3, minor=2)),
+    "Py_tp_free": Macro(name="Py_tp_free", added=PyVersion.intern(major=3, minor=2)),
+    "Py_tp_is_gc": Macro(name="Py_tp_is_gc", added=PyVersion.intern(major=3, minor=2)),
+    "Py_tp_bases": Macro(name="Py_tp_bases", added=PyVersion.intern(major=3, minor=2)),
+    "Py_tp_del": Macro(name="Py_tp_del", added=PyVersion.intern(major=3, minor=2)),
+    "Py_nb_add": Macro(name="Py_nb_add", added=PyVersion.intern(major=3, minor=2)),
+    "Py_nb_subtract": Macro(name="Py_nb_subtract", added=PyVersion.intern(major=3, minor=2)),
+    "Py_nb_multiply": Macro(name="Py_nb_multiply", added=PyVersion.intern(major=3, minor=2)),
+    "Py_nb_remainder": Macro(name="Py_nb_remainder", added=PyVersion.intern(major=3, minor=2)),
+    "Py_nb_divmod": Macro(name="Py_nb_divmod", added=PyVersion.intern(major=3, minor=2)),
+    "Py_nb_power": Macro(name="Py_nb_power", added=PyVersion.intern(major=3, minor=2)),
+    "Py_nb_negative": Macro(name="Py_nb_negative", added=PyVersion.intern(major=3, minor=2)),
+    "Py_nb_positive": Macro(name="Py_nb_positive", added=PyVersion.intern(major=3, minor=2)),
+    "Py_nb_absolute": Macro(name="Py_nb_absolute", added=PyVersion.intern(major=3, minor=2)),
+    "Py_nb_bool": Macro(name="Py_nb_bool", added=PyVersion.intern(major=3, minor=2)),
+    "Py_nb_invert": Macro(name="Py_nb_invert", added=PyVersion.intern(major=3, minor=2)),
+    "Py_nb_lshift": Macro(name="Py_nb_lshift", added=PyVersion.intern(major=3, minor=2)),
+    "Py_nb_rshift": Macro(name="Py_nb_rshift", added=PyVersion.intern(major=3, minor=2)),
+    "Py_nb_and": Macro(name="Py_nb_and", added=PyVersion.intern(major=3, minor=2)),
+    "Py_nb_xor": Macro(name="Py_nb_xor", added=PyVersion.intern(major=3, minor=2)),
+    "Py_nb_or": Macro(name="Py_nb_or", added=PyVersion.intern(major=3, minor=2)),
+    "Py_nb_int": Macro(name="Py_nb_int", added=PyVersion.intern(major=3, minor=2)),
+    "Py_nb_float": Macro(name="Py_nb_float", added=PyVersion.intern(major=3, minor=2)),
+    "Py_nb_inplace_add": Macro(name="Py_nb_inplace_add", added=PyVersion.intern(major=3, minor=2)),
+    "Py_nb_inplace_subtract": Macro(
+        name="Py_nb_inplace_subtract", added=PyVersion.intern(major=3, minor=2)
+    ),
+    "Py_nb_inplace_multiply": Macro(
+        name="Py_nb_inplace_multiply", added=PyVersion.intern(major=3, minor=2)
+    ),
+    "Py_nb_inplace_remainder": Macro(
+        name="Py_nb_inplace_remainder", added=PyVersion.intern(major=3, minor=2)
+    ),
+    "Py_nb_inplace_power": Macro(
+        name="Py_nb_inplace_power", added=PyVersion.intern(major=3, minor=2)
+    ),
+    "Py_nb_inplace_lshift": Macro(
+        name="Py_nb_inplace_lshift", added=PyVersion.intern(major=3, minor=2)
+    ),
+    "Py_nb_inplace_rshift": Macro(
+        name="Py_nb_inplace_rshift", added=PyVersion.intern(major=3, minor=2)
+    ),
+    "Py_nb_inplace_and": Macro(name="Py_nb_inplace_and", added=PyVersion.intern(major=3, minor=2)),
+    "Py_nb_inplace_xor": Macro(name="Py_nb_inplace_xor", added=PyVersion.intern(major=3, minor=2)),
+    "Py_nb_inplace_or": Macro(name="Py_nb_inplace_or", added=PyVersion.intern(major=3, minor=2)),
+    "Py_nb_floor_divide": Macro(
+        name="Py_nb_floor_divide", added=PyVersion.intern(major=3, minor=2)
+    ),
+    "Py_nb_true_divide": Macro(name="Py_nb_true_divide", added=PyVersion.intern(major=3, minor=2)),
+    "Py_nb_inplace_floor_divide": Macro(
+        name="Py_nb_inplace_floor_divide", added=PyVersion.intern(major=3, minor=2)
+    ),
+    "Py_nb_inplace_true_divide": Macro(
+        name="Py_nb_inplace_true_divide", added=PyVersion.intern(major=3, minor=2)
+    ),
+    "Py_nb_index": Macro(name="Py_nb_index", added=PyVersion.intern(major=3, minor=2)),
+    "Py_sq_length": Macro(name="Py_sq_length", added=PyVersion.intern(major=3, minor=2)),
+    "Py_sq_concat": Macro(name="Py_sq_concat", added=PyVersion.intern(major=3, minor=2)),
+    "Py_sq_repeat": Macro(name="Py_sq_repeat", added=PyVersion.intern(major=3, minor=2)),
+    "Py_sq_item": Macro(name="Py_sq_item", added=PyVersion.intern(major=3, minor=2)),
+    "Py_sq_ass_item": Macro(name="Py_sq_ass_item", added=PyVersion.intern(major=3, minor=2)),
+    "Py_sq_contains": Macro(name="Py_sq_contains", added=PyVersion.intern(major=3, minor=2)),
+    "Py_sq_inplace_concat": Macro(
+        name="Py_sq_inplace_concat", added=PyVersion.intern(major=3, minor=2)
+    ),
+    "Py_sq_inplace_repeat": Macro(
+        name="Py_sq_inplace_repeat", added=PyVersion.intern(major=3, minor=2)
+    ),
+    "Py_mp_length": Macro(name="Py_mp_length", added=PyVersion.intern(major=3, minor=2)),
+    "Py_mp_subscript": Macro(name="Py_mp_subscript", added=PyVersion.intern(major=3, minor=2)),
+    "Py_mp_ass_subscript": Macro(
+        name="Py_mp_ass_subscript", added=PyVersion.intern(major=3, minor=2)
+    ),
+    "Py_TPFLAGS_DEFAULT": Macro(
+        name="Py_TPFLAGS_DEFAULT", added=PyVersion.intern(major=3, minor=2)
+    ),
+    "Py_TPFLAGS_BASETYPE": Macro(
+        name="Py_TPFLAGS_BASETYPE", added=PyVersion.intern(major=3, minor=2)
+    ),
+    "Py_TPFLAGS_HAVE_GC": Macro(
+        name="Py_TPFLAGS_HAVE_GC", added=PyVersion.intern(major=3, minor=2)
+    ),
+    "METH_VARARGS": Macro(name="METH_VARARGS", added=PyVersion.intern(major=3, minor=2)),
+    "METH_NOARGS": Macro(name="METH_NOARGS", added=PyVersion.intern(major=3, minor=2)),
+    "METH_O": Macro(name="METH_O", added=PyVersion.intern(major=3, minor=2)),
+    "METH_CLASS": Macro(name="METH_CLASS", added=PyVersion.intern(major=3, minor=2)),
+    "METH_STATIC": Macro(name="METH_STATIC", added=PyVersion.intern(major=3, minor=2)),
+    "METH_COEXIST": Macro(name="METH_COEXIST", added=PyVersion.intern(major=3, minor=2)),
+    "Py_mod_create": Macro(name="Py_mod_create", added=PyVersion.intern(major=3, minor=5)),
+    "Py_mod_exec": Macro(name="Py_mod_exec", added=PyVersion.intern(major=3, minor=5)),
+    "Py_nb_matrix_multiply": Macro(
+        name="Py_nb_matrix_multiply", added=PyVersion.intern(major=3, minor=5)
+    ),
+    "Py_nb_inplace_matrix_multiply": Macro(
+        name="Py_nb_inplace_matrix_multiply", added=PyVersion.intern(major=3, minor=5)
+    ),
+    "Py_am_await": Macro(name="Py_am_await", added=PyVersion.intern(major=3, minor=5)),
+    "Py_am_aiter": Macro(name="Py_am_aiter", added=PyVersion.intern(major=3, minor=5)),
+    "Py_am_anext": Macro(name="Py_am_anext", added=PyVersion.intern(major=3, minor=5)),
+    "Py_tp_finalize": Macro(name="Py_tp_finalize", added=PyVersion.intern(major=3, minor=5)),
+    "METH_FASTCALL": Macro(name="METH_FASTCALL", added=PyVersion.intern(major=3, minor=7)),
+    "METH_METHOD": Macro(name="METH_METHOD", added=PyVersion.intern(major=3, minor=7)),
+    "Py_TPFLAGS_METHOD_DESCRIPTOR": Macro(
+        name="Py_TPFLAGS_METHOD_DESCRIPTOR", added=PyVersion.intern(major=3, minor=8)
+    ),
+    "Py_am_send": Macro(name="Py_am_send", added=PyVersion.intern(major=3, minor=10)),
+    "Py_bf_getbuffer": Macro(name="Py_bf_getbuffer", added=PyVersion.intern(major=3, minor=11)),
+    "Py_bf_releasebuffer": Macro(
+        name="Py_bf_releasebuffer", added=PyVersion.intern(major=3, minor=11)
+    ),
+    "PyBUF_MAX_NDIM": Macro(name="PyBUF_MAX_NDIM", added=PyVersion.intern(major=3, minor=11)),
+    "PyBUF_SIMPLE": Macro(name="PyBUF_SIMPLE", added=PyVersion.intern(major=3, minor=11)),
+    "PyBUF_WRITABLE": Macro(name="PyBUF_WRITABLE", added=PyVersion.intern(major=3, minor=11)),
+    "PyBUF_FORMAT": Macro(name="PyBUF_FORMAT", added=PyVersion.intern(major=3, minor=11)),
+    "PyBUF_ND": Macro(name="PyBUF_ND", added=PyVersion.intern(major=3, minor=11)),
+    "PyBUF_STRIDES": Macro(name="PyBUF_STRIDES", added=PyVersion.intern(major=3, minor=11)),
+    "PyBUF_C_CONTIGUOUS": Macro(
+        name="PyBUF_C_CONTIGUOUS", added=PyVersion.intern(major=3, minor=11)
+    ),
+    "PyBUF_F_CONTIGUOUS": Macro(
+        name="PyBUF_F_CONTIGUOUS", added=PyVersion.intern(major=3, minor=11)
+    ),
+    "PyBUF_ANY_CONTIGUOUS": Macro(
+        name="PyBUF_ANY_CONTIGUOUS", added=PyVersion.intern(major=3, minor=11)
+    ),
+    "PyBUF_INDIRECT": Macro(name="PyBUF_INDIRECT", added=PyVersion.intern(major=3, minor=11)),
+    "PyBUF_CONTIG": Macro(name="PyBUF_CONTIG", added=PyVersion.intern(major=3, minor=11)),
+    "PyBUF_CONTIG_RO": Macro(name="PyBUF_CONTIG_RO", added=PyVersion.intern(major=3, minor=11)),
+    "PyBUF_STRIDED": Macro(name="PyBUF_STRIDED", added=PyVersion.intern(major=3, minor=11)),
+    "PyBUF_STRIDED_RO": Macro(name="PyBUF_STRIDED_RO", added=PyVersion.intern(major=3, minor=11)),
+    "PyBUF_RECORDS": Macro(name="PyBUF_RECORDS", added=PyVersion.intern(major=3, minor=11)),
+    "PyBUF_RECORDS_RO": Macro(name="PyBUF_RECORDS_RO", added=PyVersion.intern(major=3, minor=11)),
+    "PyBUF_FULL": Macro(name="PyBUF_FULL", added=PyVersion.intern(major=3, minor=11)),
+    "PyBUF_FULL_RO": Macro(name="PyBUF_FULL_RO", added=PyVersion.intern(major=3, minor=11)),
+    "PyBUF_READ": Macro(name="PyBUF_READ", added=PyVersion.intern(major=3, minor=11)),
+    "PyBUF_WRITE": Macro(name="PyBUF_WRITE", added=PyVersion.intern(major=3, minor=11)),
+    "Py_TPFLAGS_HAVE_VECTORCALL": Macro(
+        name="Py_TPFLAGS_HAVE_VECTORCALL", added=PyVersion.intern(major=3, minor=12)
+    ),
+    "Py_T_BYTE": Macro(name="Py_T_BYTE", added=PyVersion.intern(major=3, minor=12)),
+    "Py_T_SHORT": Macro(name="Py_T_SHORT", added=PyVersion.intern(major=3, minor=12)),
+    "Py_T_INT": Macro(name="Py_T_INT", added=PyVersion.intern(major=3, minor=12)),
+    "Py_T_LONG": Macro(name="Py_T_LONG", added=PyVersion.intern(major=3, minor=12)),
+    "Py_T_LONGLONG": Macro(name="Py_T_LONGLONG", added=PyVersion.intern(major=3, minor=12)),
+    "Py_T_UBYTE": Macro(name="Py_T_UBYTE", added=PyVersion.intern(major=3, minor=12)),
+    "Py_T_UINT": Macro(name="Py_T_UINT", added=PyVersion.intern(major=3, minor=12)),
+    "Py_T_USHORT": Macro(name="Py_T_USHORT", added=PyVersion.intern(major=3, minor=12)),
+    "Py_T_ULONG": Macro(name="Py_T_ULONG", added=PyVersion.intern(major=3, minor=12)),
+    "Py_T_ULONGLONG": Macro(name="Py_T_ULONGLONG", added=PyVersion.intern(major=3, minor=12)),
+    "Py_T_PYSSIZET": Macro(name="Py_T_PYSSIZET", added=PyVersion.intern(major=3, minor=12)),
+    "Py_T_FLOAT": Macro(name="Py_T_FLOAT", added=PyVersion.intern(major=3, minor=12)),
+    "Py_T_DOUBLE": Macro(name="Py_T_DOUBLE", added=PyVersion.intern(major=3, minor=12)),
+    "Py_T_BOOL": Macro(name="Py_T_BOOL", added=PyVersion.intern(major=3, minor=12)),
+    "Py_T_STRING": Macro(name="Py_T_STRING", added=PyVersion.intern(major=3, minor=12)),
+    "Py_T_STRING_INPLACE": Macro(
+        name="Py_T_STRING_INPLACE", added=PyVersion.intern(major=3, minor=12)
+    ),
+    "Py_T_CHAR": Macro(name="Py_T_CHAR", added=PyVersion.intern(major=3, minor=12)),
+    "Py_T_OBJECT_EX": Macro(name="Py_T_OBJECT_EX", added=PyVersion.intern(major=3, minor=12)),
+    "Py_READONLY": Macro(name="Py_READONLY", added=PyVersion.intern(major=3, minor=12)),
+    "Py_AUDIT_READ": Macro(name="Py_AUDIT_READ", added=PyVersion.intern(major=3, minor=12)),
+    "Py_RELATIVE_OFFSET": Macro(
+        name="Py_RELATIVE_OFFSET", added=PyVersion.intern(major=3, minor=12)
+    ),
+    "Py_TPFLAGS_ITEMS_AT_END": Macro(
+        name="Py_TPFLAGS_ITEMS_AT_END", added=PyVersion.intern(major=3, minor=12)
+    ),
+    "Py_mod_multiple_interpreters": Macro(
+        name="Py_mod_multiple_interpreters", added=PyVersion.intern(major=3, minor=12)
+    ),
+    "Py_mod_gil": Macro(name="Py_mod_gil", added=PyVersion.intern(major=3, minor=13)),
+    "Py_ASNATIVEBYTES_DEFAULTS": Macro(
+        name="Py_ASNATIVEBYTES_DEFAULTS", added=PyVersion.intern(major=3, minor=14)
+    ),
+    "Py_ASNATIVEBYTES_BIG_ENDIAN": Macro(
+        name="Py_ASNATIVEBYTES_BIG_ENDIAN", added=PyVersion.intern(major=3, minor=14)
+    ),
+    "Py_ASNATIVEBYTES_LITTLE_ENDIAN": Macro(
+        name="Py_ASNATIVEBYTES_LITTLE_ENDIAN", added=PyVersion.intern(major=3, minor=14)
+    ),
+    "Py_ASNATIVEBYTES_NATIVE_ENDIAN": Macro(
+        name="Py_ASNATIVEBYTES_NATIVE_ENDIAN", added=PyVersion.intern(major=3, minor=14)
+    ),
+    "Py_ASNATIVEBYTES_UNSIGNED_BUFFER": Macro(
+        name="Py_ASNATIVEBYTES_UNSIGNED_BUFFER", added=PyVersion.intern(major=3, minor=14)
+    ),
+    "Py_ASNATIVEBYTES_REJECT_NEGATIVE": Macro(
+        name="Py_ASNATIVEBYTES_REJECT_NEGATIVE", added=PyVersion.intern(major=3, minor=14)
+    ),
+    "Py_ASNATIVEBYTES_ALLOW_INDEX": Macro(
+        name="Py_ASNATIVEBYTES_ALLOW_INDEX", added=PyVersion.intern(major=3, minor=14)
+    ),
+    "Py_tp_vectorcall": Macro(name="Py_tp_vectorcall", added=PyVersion.intern(major=3, minor=14)),
+    "Py_tp_token": Macro(name="Py_tp_token", added=PyVersion.intern(major=3, minor=14)),
+    "Py_TP_USE_SPEC": Macro(name="Py_TP_USE_SPEC", added=PyVersion.intern(major=3, minor=14)),
+    "Py_mod_abi": Macro(name="Py_mod_abi", added=PyVersion.intern(major=3, minor=15)),
+    "PyABIInfo_DEFAULT_ABI_VERSION": Macro(
+        name="PyABIInfo_DEFAULT_ABI_VERSION", added=PyVersion.intern(major=3, minor=15)
+    ),
+    "PyABIInfo_DEFAULT_FLAGS": Macro(
+        name="PyABIInfo_DEFAULT_FLAGS", added=PyVersion.intern(major=3, minor=15)
+    ),
+    "PyABIInfo_STABLE": Macro(name="PyABIInfo_STABLE", added=PyVersion.intern(major=3, minor=15)),
+    "PyABIInfo_FREETHREADED": Macro(
+        name="PyABIInfo_FREETHREADED", added=PyVersion.intern(major=3, minor=15)
+    ),
+    "PyABIInfo_GIL": Macro(name="PyABIInfo_GIL", added=PyVersion.intern(major=3, minor=15)),
+    "PyABIInfo_FREETHREADING_AGNOSTIC": Macro(
+        name="PyABIInfo_FREETHREADING_AGNOSTIC", added=PyVersion.intern(major=3, minor=15)
+    ),
+    "Py_mod_name": Macro(name="Py_mod_name", added=PyVersion.intern(major=3, minor=15)),
+    "Py_mod_doc": Macro(name="Py_mod_doc", added=PyVersion.intern(major=3, minor=15)),
+    "Py_mod_state_size": Macro(name="Py_mod_state_size", added=PyVersion.intern(major=3, minor=15)),
+    "Py_mod_methods": Macro(name="Py_mod_methods", added=PyVersion.intern(major=3, minor=15)),
+    "Py_mod_state_traverse": Macro(
+        name="Py_mod_state_traverse", added=PyVersion.intern(major=3, minor=15)
+    ),
+    "Py_mod_state_clear": Macro(
+        name="Py_mod_state_clear", added=PyVersion.intern(major=3, minor=15)
+    ),
+    "Py_mod_state_free": Macro(name="Py_mod_state_free", added=PyVersion.intern(major=3, minor=15)),
+    "Py_mod_token": Macro(name="Py_mod_token", added=PyVersion.intern(major=3, minor=15)),
+    "Py_BEGIN_ALLOW_THREADS": Macro(
+        name="Py_BEGIN_ALLOW_THREADS", added=PyVersion.intern(major=3, minor=2)
+    ),
+    "Py_BLOCK_THREADS": Macro(name="Py_BLOCK_THREADS", added=PyVersion.intern(major=3, minor=2)),
+    "Py_UNBLOCK_THREADS": Macro(
+        name="Py_UNBLOCK_THREADS", added=PyVersion.intern(major=3, minor=2)
+    ),
+    "Py_END_ALLOW_THREADS": Macro(
+        name="Py_END_ALLOW_THREADS", added=PyVersion.intern(major=3, minor=2)
+    ),
+    "PY_VECTORCALL_ARGUMENTS_OFFSET": Macro(
+        name="PY_VECTORCALL_ARGUMENTS_OFFSET", added=PyVersion.intern(major=3, minor=12)
+    ),
+    "PyABIInfo_VAR": Macro(name="PyABIInfo_VAR", added=PyVersion.intern(major=3, minor=15)),
+    "PyMODEXPORT_FUNC": Macro(name="PyMODEXPORT_FUNC", added=PyVersion.intern(major=3, minor=15)),
+}
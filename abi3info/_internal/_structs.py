@@ -0,0 +1,55 @@
+"""
+Generated struct definitions for abi3info.
+
+This module should not be used directly; it is not a public API.
+"""
+
+from __future__ import annotations
+
+from typing import Final
+
+from abi3info.models import FullStruct, OpaqueStruct, PartialStruct, PyVersion, Struct
+
+# this file was generated; do not modify it by hand!
+_STRUCTS: Final[dict[str, Struct]] = {
+    "PyObject": PartialStruct(
+        name="PyObject", added=PyVersion.intern(major=3, minor=2), members=("ob_refcnt", "ob_type")
+    ),
+    "PyVarObject": PartialStruct(
+        name="PyVarObject", added=PyVersion.intern(major=3, minor=2), members=("ob_base", "ob_size")
+    ),
+    "PyMethodDef": FullStruct(name="PyMethodDef", added=PyVersion.intern(major=3, minor=2)),
+    "PyMemberDef": FullStruct(name="PyMemberDef", added=PyVersion.intern(major=3, minor=2)),
+    "PyGetSetDef": FullStruct(name="PyGetSetDef", added=PyVersion.intern(major=3, minor=2)),
+    "PyModuleDef_Base": FullStruct(
+        name="PyModuleDef_Base", added=PyVersion.intern(major=3, minor=2)
+    ),
+    "PyModuleDef": FullStruct(name="PyModuleDef", added=PyVersion.intern(major=3, minor=2)),
+    "PyStructSequence_Field": FullStruct(
+        name="PyStructSequence_Field", added=PyVersion.intern(major=3, minor=2)
+    ),
+    "PyStructSequence_Desc": FullStruct(
+        name="PyStructSequence_Desc", added=PyVersion.intern(major=3, minor=2)
+    ),
+    "PyType_Slot": FullStruct(name="PyType_Slot", added=PyVersion.intern(major=3, minor=2)),
+    "PyType_Spec": FullStruct(name="PyType_Spec", added=PyVersion.intern(major=3, minor=2)),
+    "PyThreadState": OpaqueStruct(name="PyThreadState", added=PyVersion.intern(major=3, minor=2)),
+    "PyInterpreterState": OpaqueStruct(
+        name="PyInterpreterState", added=PyVersion.intern(major=3, minor=2)
+    ),
+    "PyFrameObject": OpaqueStruct(name="PyFrameObject", added=PyVersion.intern(major=3, minor=2)),
+    "symtable": OpaqueStruct(name="symtable", added=PyVersion.intern(major=3, minor=2)),
+    "PyWeakReference": OpaqueStruct(
+        name="PyWeakReference", added=PyVersion.intern(major=3, minor=2)
+    ),
+    "PyLongObject": OpaqueStruct(name="PyLongObject", added=PyVersion.intern(major=3, minor=2)),
+    "PyTypeObject": OpaqueStruct(name="PyTypeObject", added=PyVersion.intern(major=3, minor=2)),
+    "PyModuleDef_Slot": FullStruct(
+        name="PyModuleDef_Slot", added=PyVersion.intern(major=3, minor=5)
+    ),
+    "Py_buffer": FullStruct(name="Py_buffer", added=PyVersion.intern(major=3, minor=11)),
+    "PyABIInfo": FullStruct(name="PyABIInfo", added=PyVersion.intern(major=3, minor=15)),
+    "PyLongWriter": OpaqueStruct(name="PyLongWriter", added=PyVersion.intern(major=3, minor=15)),
+    "PyLongLayout": FullStruct(name="PyLongLayout", added=PyVersion.intern(major=3, minor=15)),
+    "PyLongExport": FullStruct(name="PyLongExport", added=PyVersion.intern(major=3, minor=15)),
+}
@@ -0,0 +1,73 @@
+"""
+Generated typedef definitions for abi3info.
+
+This module should not be used directly; it is not a public API.
+"""
+
+from __future__ import annotations
+
+from typing import Final
+
+from abi3info.models import PyVersion, Typedef
+
+# this file was generated; do not modify it by hand!
+_TYPEDEFS: Final[dict[str, Typedef]] = {
+    "Py_uintptr_t": Typedef(name="Py_uintptr_t", added=PyVersion.intern(major=3, minor=2)),
+    "Py_intptr_t": Typedef(name="Py_intptr_t", added=PyVersion.intern(major=3, minor=2)),
+    "Py_ssize_t": Typedef(name="Py_ssize_t", added=PyVersion.intern(major=3, minor=2)),
+    "unaryfunc": Typedef(name="unaryfunc", added=PyVersion.intern(major=3, minor=2)),
+    "binaryfunc": Typedef(name="binaryfunc", added=PyVersion.intern(major=3, minor=2)),
+    "ternaryfunc": Typedef(name="ternaryfunc", added=PyVersion.intern(major=3, minor=2)),
+    "inquiry": Typedef(name="inquiry", added=PyVersion.intern(major=3, minor=2)),
+    "lenfunc": Typedef(name="lenfunc", added=PyVersion.intern(major=3, minor=2)),
+    "ssizeargfunc": Typedef(name="ssizeargfunc", added=PyVersion.intern(major=3, minor=2)),
+    "ssizessizeargfunc": Typedef(
+        name="ssizessizeargfunc", added=PyVersion.intern(major=3, minor=2)
+    ),
+    "ssizeobjargproc": Typedef(name="ssizeobjargproc", added=PyVersion.intern(major=3, minor=2)),
+    "ssizessizeobjargproc": Typedef(
+        name="ssizessizeobjargproc", added=PyVersion.intern(major=3, minor=2)
+    ),
+    "objobjargproc": Typedef(name="objobjargproc", added=PyVersion.intern(major=3, minor=2)),
+    "objobjproc": Typedef(name="objobjproc", added=PyVersion.intern(major=3, minor=2)),
+    "visitproc": Typedef(name="visitproc", added=PyVersion.intern(major=3, minor=2)),
+    "traverseproc": Typedef(name="traverseproc", added=PyVersion.intern(major=3, minor=2)),
+    "destructor": Typedef(name="destructor", added=PyVersion.intern(major=3, minor=2)),
+    "getattrfunc": Typedef(name="getattrfunc", added=PyVersion.intern(major=3, minor=2)),
+    "getattrofunc": Typedef(name="getattrofunc", added=PyVersion.intern(major=3, minor=2)),
+    "setattrfunc": Typedef(name="setattrfunc", added=PyVersion.intern(major=3, minor=2)),
+    "setattrofunc": Typedef(name="setattrofunc", added=PyVersion.intern(major=3, minor=2)),
+    "reprfunc": Typedef(name="reprfunc", added=PyVersion.intern(major=3, minor=2)),
+    "hashfunc": Typedef(name="hashfunc", added=PyVersion.intern(major=3, minor=2)),
+    "richcmpfunc": Typedef(name="richcmpfunc", added=PyVersion.intern(major=3, minor=2)),
+    "getiterfunc": Typedef(name="getiterfunc", added=PyVersion.intern(major=3, minor=2)),
+    "iternextfunc": Typedef(name="iternextfunc", added=PyVersion.intern(major=3, minor=2)),
+    "descrgetfunc": Typedef(name="descrgetfunc", added=PyVersion.intern(major=3, minor=2)),
+    "descrsetfunc": Typedef(name="descrsetfunc", added=PyVersion.intern(major=3, minor=2)),
+    "initproc": Typedef(name="initproc", added=PyVersion.intern(major=3, minor=2)),
+    "newfunc": Typedef(name="newfunc", added=PyVersion.intern(major=3, minor=2)),
+    "allocfunc": Typedef(name="allocfunc", added=PyVersion.intern(major=3, minor=2)),
+    "PyCFunction": Typedef(name="PyCFunction", added=PyVersion.intern(major=3, minor=2)),
+    "PyCFunctionWithKeywords": Typedef(
+        name="PyCFunctionWithKeywords", added=PyVersion.intern(major=3, minor=2)
+    ),
+    "PyCapsule_Destructor": Typedef(
+        name="PyCapsule_Destructor", added=PyVersion.intern(major=3, minor=2)
+    ),
+    "getter": Typedef(name="getter", added=PyVersion.intern(major=3, minor=2)),
+    "setter": Typedef(name="setter", added=PyVersion.intern(major=3, minor=2)),
+    "PyOS_sighandler_t": Typedef(
+        name="PyOS_sighandler_t", added=PyVersion.intern(major=3, minor=2)
+    ),
+    "PyGILState_STATE": Typedef(name="PyGILState_STATE", added=PyVersion.intern(major=3, minor=2)),
+    "Py_UCS4": Typedef(name="Py_UCS4", added=PyVersion.intern(major=3, minor=2)),
+    "vectorcallfunc": Typedef(name="vectorcallfunc", added=PyVersion.intern(major=3, minor=12)),
+    "getbufferproc": Typedef(name="getbufferproc", added=PyVersion.intern(major=3, minor=12)),
+    "releasebufferproc": Typedef(
+        name="releasebufferproc", added=PyVersion.intern(major=3, minor=12)
+    ),
+    "PyCFunctionFast": Typedef(name="PyCFunctionFast", added=PyVersion.intern(major=3, minor=13)),
+    "PyCFunctionFastWithKeywords": Typedef(
+        name="PyCFunctionFastWithKeywords", added=PyVersion.intern(major=3, minor=13)
+    ),
+}
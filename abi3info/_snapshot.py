@@ -0,0 +1,545 @@
+"""
+Loaders for the binary snapshot of the limited API and stable ABI tables.
+
+The snapshot (`_snapshot.bin`) is generated by `codegen/codegen.py` alongside
+the `abi3info._internal` modules. It's a read-only file with a fixed layout,
+which we `mmap` so that processes on the same host share its pages:
+
+* A header (`_HEADER`): a magic number, the format version, the number of
+  tables, and the offset of the string pool
+* A directory: for each table, a `_TABLE` entry (its name, number of rows,
+  and number of columns) followed by a `_COLUMN` entry for each of its columns
+  (its name, `struct` format code, and offset)
+* The columns themselves: fixed-width, little-endian arrays with one value
+  per row. String columns (format code `S`) are arrays of (offset, length)
+  pairs into the string pool
+* The string pool: UTF-8 encoded strings, each followed by a NUL. Each string
+  column's strings are stored contiguously and in row order, so that a whole
+  column can be decoded at once
+
+Each loader wraps a table's columns in a `Table`, which only builds the
+models for each row when they're actually accessed.
+
+This module should not be used directly; it is not a public API.
+"""
+
+from __future__ import annotations
+
+import functools
+import mmap
+import os
+import struct
+from collections.abc import Callable, Iterator
+from typing import TYPE_CHECKING, Any, Final, Literal, TypeVar
+
+from abi3info._table import MangledTable, SymbolTable, Table
+from abi3info.models import (
+    Data,
+    FeatureMacro,
+    FullStruct,
+    Function,
+    Macro,
+    OpaqueStruct,
+    PartialStruct,
+    PyVersion,
+    Struct,
+    Symbol,
+    Typedef,
+)
+
+if TYPE_CHECKING:
+    from abi3info._index import NameIndex, VersionIndex
+
+_F = TypeVar("_F", Function, Data)
+_T = TypeVar("_T")
+
+_SNAPSHOT: Final[str] = "_snapshot.bin"
+
+_MAGIC: Final[bytes] = b"abi3info"
+_VERSION: Final[int] = 1
+
+_HEADER: Final[struct.Struct] = struct.Struct("<8sHHI")
+_TABLE: Final[struct.Struct] = struct.Struct("<16sIH")
+_COLUMN: Final[struct.Struct] = struct.Struct("<16scxI")
+_STRING: Final[struct.Struct] = struct.Struct("<II")
+
+# The encodings of `FeatureMacro.windows` and of each struct's kind, by index.
+_WINDOWS: Final[tuple[bool | Literal["maybe"], ...]] = (False, True, "maybe")
+_STRUCT_KINDS: Final[tuple[str, ...]] = ("opaque", "full-abi", "members")
+
+# The loaders whose tables have an `added` column; see `version_index`.
+_VERSIONED_LOADERS: Final[tuple[str, ...]] = ("functions", "datas", "macros", "typedefs", "structs")
+
+# The loaders whose tables contain (picklable) model entries; see `_entry`.
+_ENTRY_LOADERS: Final[frozenset[str]] = frozenset(
+    {"datas", "feature_macros", "functions", "macros", "structs", "typedefs"}
+)
+
+
+class _Column:
+    """
+    A fixed-width column in the snapshot.
+    """
+
+    def __init__(self, buf: bytes | mmap.mmap, offset: int, count: int, fmt: str) -> None:
+        """
+        Creates a new `_Column` of `count` values in the given `struct` format,
+        starting at `offset`.
+        """
+        layout = struct.Struct(f"<{fmt}")
+        self._buf = buf
+        self._offset = offset
+        self._count = count
+        self._fmt = fmt
+        self._size = layout.size
+        self._unpack = layout.unpack_from
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Returns an iterator over every value in this column.
+
+        This decodes the whole column at once, rather than value-by-value, so
+        loaders should decode each column they need into a tuple up front.
+        """
+        return iter(struct.unpack_from(f"<{self._count}{self._fmt}", self._buf, self._offset))
+
+
+class _StringColumn(_Column):
+    """
+    A column of strings in the snapshot.
+    """
+
+    def __init__(self, buf: bytes | mmap.mmap, offset: int, count: int, pool: int) -> None:
+        """
+        Creates a new `_StringColumn` of `count` strings, starting at `offset`,
+        that refers into the string pool at `pool`.
+        """
+        super().__init__(buf, offset, count, "II")
+        self._pool = pool
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Returns an iterator over every string in this column.
+
+        This decodes the whole column at once, rather than string-by-string.
+        """
+        first, _ = self._unpack(self._buf, self._offset)
+        last, length = self._unpack(self._buf, self._offset + (self._count - 1) * self._size)
+        strings = str(self._buf[self._pool + first : self._pool + last + length], "utf-8")
+        return iter(strings.split("\0"))
+
+
+# Results of `_cached` functions, by function name.
+_CACHE: dict[str, Any] = {}
+
+# The names of the `_cached` functions; see `_restore`.
+_LOADERS: set[str] = set()
+
+
+def _cached(func: Callable[[], _T]) -> Callable[[], _T]:
+    """
+    Caches the result of `func`, which takes no arguments.
+
+    Unlike with `functools.cache`, concurrent first calls all return the same
+    result (even if `func` itself runs more than once). This keeps the objects
+    we cache canonical, even on free-threaded builds.
+    """
+    key = func.__name__
+    _LOADERS.add(key)
+
+    @functools.wraps(func)
+    def wrapper() -> _T:
+        """
+        Returns the cached result of `func`, calling it if necessary.
+        """
+        try:
+            return _CACHE[key]  # type: ignore[no-any-return]
+        except KeyError:
+            return _CACHE.setdefault(key, func())  # type: ignore[no-any-return]
+
+    return wrapper
+
+
+def _is_entry(loader: str, name: str, value: object) -> bool:
+    """
+    Returns whether `value` is the canonical entry for `name` in the table
+    loaded by `loader`, without loading the table.
+    """
+    table = _CACHE.get(loader)
+    return table is not None and table._is_value(name, value)
+
+
+def _entry(loader: str, name: str) -> Any:
+    """
+    Returns the canonical entry for `name` in the table loaded by `loader`,
+    loading it if necessary.
+
+    This is how table entries are unpickled; see `abi3info.models._TableEntry`.
+    """
+    if loader not in _ENTRY_LOADERS:
+        raise ValueError(f"not a table: {loader!r}")
+    table = globals()[loader]()
+    return table._value(table._index[name])
+
+
+def _cached_key(value: object) -> str | None:
+    """
+    Returns the key that `value` is cached under, or `None` if it isn't cached.
+    """
+    for key, cached in list(_CACHE.items()):
+        if cached is value:
+            return key
+    return None
+
+
+def _restore(key: str) -> Any:
+    """
+    Returns the object cached under `key`, loading it if necessary.
+
+    This is how tables (and indexes over them) are unpickled; see
+    `abi3info._table._Immutable`.
+    """
+    loader, by_version, rest = key.partition("_by_version")
+    if by_version and not rest and loader in _VERSIONED_LOADERS:
+        return version_index(loader)
+    if key not in _LOADERS or key.startswith("_"):
+        raise ValueError(f"not a table: {key!r}")
+    return globals()[key]()
+
+
+def _open() -> bytes | mmap.mmap:
+    """
+    Opens the snapshot.
+
+    When installed on a filesystem (the common case), we map the snapshot into
+    memory directly. Otherwise (e.g. under zipimport), we fall back to reading it
+    into memory via `importlib.resources`.
+
+    NOTE: We don't go through `importlib.resources` unconditionally, since it's
+    (relatively) expensive to import and we're on the cold start path.
+    """
+    try:
+        with open(os.path.join(os.path.dirname(__file__), _SNAPSHOT), "rb") as io:
+            return mmap.mmap(io.fileno(), 0, access=mmap.ACCESS_READ)
+    except OSError:
+        from importlib import resources
+
+        return resources.files(__package__).joinpath(_SNAPSHOT).read_bytes()
+
+
+@_cached
+def _load() -> dict[str, dict[str, Any]]:
+    """
+    Opens the snapshot and reads its directory, returning each table's columns
+    (either `_Column`s or `_StringColumn`s) by name.
+    """
+    buf = _open()
+    magic, version, ntables, pool = _HEADER.unpack_from(buf, 0)
+    if magic != _MAGIC or version != _VERSION:
+        raise ValueError(f"unsupported snapshot: {magic!r} v{version}")
+
+    tables: dict[str, dict[str, Any]] = {}
+    offset = _HEADER.size
+    for _ in range(ntables):
+        table, count, ncolumns = _TABLE.unpack_from(buf, offset)
+        offset += _TABLE.size
+
+        columns = tables[table.rstrip(b"\0").decode()] = {}
+        for _ in range(ncolumns):
+            name, fmt, column_offset = _COLUMN.unpack_from(buf, offset)
+            offset += _COLUMN.size
+
+            columns[name.rstrip(b"\0").decode()] = (
+                _StringColumn(buf, column_offset, count, pool)
+                if fmt == b"S"
+                else _Column(buf, column_offset, count, fmt.decode())
+            )
+
+    return tables
+
+
+@_cached
+def feature_macros() -> Table[str, FeatureMacro]:
+    """
+    Loads the feature macro table from the snapshot.
+
+    The table is only loaded once: the `ifdef` of every `Function` and `Data`
+    refers to one of its (canonical) `FeatureMacro`s, rather than a copy.
+    """
+    columns = _load()["feature_macros"]
+    doc, windows = tuple(columns["doc"]), tuple(columns["windows"])
+    return Table(
+        tuple(columns["names"]),
+        lambda idx, name: FeatureMacro.from_row((name, doc[idx], _WINDOWS[windows[idx]])),
+    )
+
+
+@_cached
+def structs() -> Table[str, Struct]:
+    """
+    Loads the struct table from the snapshot.
+
+    The table is only loaded once, so that `struct_members` shares its entries.
+    """
+    columns = _load()["structs"]
+    kind, added, members = (
+        tuple(columns["kind"]),
+        tuple(columns["added"]),
+        tuple(columns["members"]),
+    )
+
+    def build(idx: int, name: str) -> Struct:
+        """
+        Builds the appropriate kind of struct for the given row.
+        """
+        struct_kind = _STRUCT_KINDS[kind[idx]]
+        version = PyVersion.decode_version(added[idx])
+        if struct_kind == "members":
+            return PartialStruct.from_row((name, version, members[idx].split()))
+        elif struct_kind == "opaque":
+            return OpaqueStruct.from_row((name, version))
+        else:
+            return FullStruct.from_row((name, version))
+
+    return Table(tuple(columns["names"]), build)
+
+
+def _symbols(columns: dict[str, Any], model: type[_F]) -> SymbolTable[_F]:
+    """
+    Loads a table of `Function`s or `Data`s from its columns.
+    """
+    added, ifdef, abi_only = (
+        tuple(columns["added"]),
+        tuple(columns["ifdef"]),
+        tuple(columns["abi_only"]),
+    )
+    ifdefs = feature_macros()
+
+    def build(idx: int, symbol: Symbol) -> _F:
+        """
+        Builds the `Function` or `Data` for the given row.
+        """
+        feature_macro = ifdef[idx]
+        return model.from_row(
+            (
+                symbol,
+                PyVersion.decode_version(added[idx]),
+                ifdefs._value(feature_macro) if feature_macro >= 0 else None,
+                abi_only[idx],
+            )
+        )
+
+    return SymbolTable(tuple(columns["names"]), build)
+
+
+@_cached
+def struct_members() -> Table[str, tuple[PartialStruct, ...]]:
+    """
+    Creates the index from each stable struct member's name to the (partial)
+    structs that it's a member of.
+
+    The index is built from the snapshot's member column, so only the structs
+    for the members that are actually looked up get built.
+    """
+    rows: dict[str, list[int]] = {}
+    for idx, members in enumerate(_load()["structs"]["members"]):
+        for member in members.split():
+            rows.setdefault(member, []).append(idx)
+
+    # NOTE: Only partial structs have members, so every row here is one.
+    table = structs()
+    return Table(
+        tuple(rows),
+        lambda idx, member: tuple(table._value(row) for row in rows[member]),  # type: ignore[misc]
+    )
+
+
+@_cached
+def functions() -> SymbolTable[Function]:
+    """
+    Loads the function table from the snapshot.
+
+    The table is only loaded once, so that the mangled symbol tables below
+    share its entries.
+    """
+    return _symbols(_load()["functions"], Function)
+
+
+@_cached
+def macros() -> Table[str, Macro]:
+    """
+    Loads the macro table from the snapshot.
+    """
+    columns = _load()["macros"]
+    added = tuple(columns["added"])
+    return Table(
+        tuple(columns["names"]),
+        lambda idx, name: Macro.from_row((name, PyVersion.decode_version(added[idx]))),
+    )
+
+
+@_cached
+def datas() -> SymbolTable[Data]:
+    """
+    Loads the data object table from the snapshot.
+
+    Like `functions`, the table is only loaded once.
+    """
+    return _symbols(_load()["datas"], Data)
+
+
+@_cached
+def typedefs() -> Table[str, Typedef]:
+    """
+    Loads the typedef table from the snapshot.
+    """
+    columns = _load()["typedefs"]
+    added = tuple(columns["added"])
+    return Table(
+        tuple(columns["names"]),
+        lambda idx, name: Typedef.from_row((name, PyVersion.decode_version(added[idx]))),
+    )
+
+
+def _mangled(platform: str) -> MangledTable[Function | Data]:
+    """
+    Creates a table of functions and data objects, keyed by their symbols as
+    mangled for `platform`.
+    """
+    tables: tuple[SymbolTable[Any], ...] = (functions(), datas())
+    return MangledTable(platform, tables)
+
+
+@_cached
+def linux_symbols() -> MangledTable[Function | Data]:
+    """
+    Creates the table of functions and data objects by Linux symbol.
+    """
+    return _mangled("linux")
+
+
+@_cached
+def macos_symbols() -> MangledTable[Function | Data]:
+    """
+    Creates the table of functions and data objects by macOS symbol.
+    """
+    return _mangled("macos")
+
+
+@_cached
+def windows_symbols() -> MangledTable[Function | Data]:
+    """
+    Creates the table of functions and data objects by Windows (DLL export) symbol.
+    """
+    return _mangled("windows")
+
+
+@_cached
+def windows_import_symbols() -> MangledTable[Function | Data]:
+    """
+    Creates the table of functions and data objects by Windows import library
+    (`__imp_`) symbol.
+    """
+    return _mangled("windows_import")
+
+
+def _symbol_rows() -> Iterator[tuple[str, int, int]]:
+    """
+    Yields the name, added version and feature macro row (or -1) of each function
+    and then each data object in the snapshot, in symbol ID order (see `symbol_names`).
+    """
+    for loader in ("functions", "datas"):
+        columns = _load()[loader]
+        yield from zip(columns["names"], columns["added"], columns["ifdef"])
+
+
+@_cached
+def symbol_versions() -> dict[str, int]:
+    """
+    Creates the index from each function and data object's symbol name to the
+    version that it was added in, as a `PY_VERSION_HEX`-style integer.
+
+    The index is built from the snapshot's columns, so it doesn't build any
+    `Function`s or `Data`s.
+    """
+    return {name: added for name, added, _ in _symbol_rows()}
+
+
+@_cached
+def symbol_names() -> tuple[str, ...]:
+    """
+    Returns the symbol name of each function and then each data object, in table
+    order. Each symbol's position in this tuple is its (dense) symbol ID.
+    """
+    return tuple(name for name, _, _ in _symbol_rows())
+
+
+@_cached
+def symbol_ids() -> dict[str, int]:
+    """
+    Creates the index from each symbol name to its symbol ID; see `symbol_names`.
+    """
+    return {name: idx for idx, name in enumerate(symbol_names())}
+
+
+@_cached
+def version_masks() -> tuple[tuple[int, ...], tuple[int, ...]]:
+    """
+    Creates the bitmask of the symbols available in each version that any symbol
+    was added in, where bit `n` is set for symbol ID `n`.
+
+    Returns the sorted (`PY_VERSION_HEX`-style) versions, and each one's mask.
+    """
+    added: dict[int, int] = {}
+    for idx, (_, version, _) in enumerate(_symbol_rows()):
+        added[version] = added.get(version, 0) | 1 << idx
+
+    versions = tuple(sorted(added))
+    masks: list[int] = []
+    mask = 0
+    for version in versions:
+        mask |= added[version]
+        masks.append(mask)
+    return versions, tuple(masks)
+
+
+@_cached
+def feature_macro_masks() -> dict[str, int]:
+    """
+    Creates the bitmask of the symbols that each feature macro gates (see
+    `version_masks`), by feature macro name.
+    """
+    names = tuple(_load()["feature_macros"]["names"])
+    masks = dict.fromkeys(names, 0)
+    for idx, (_, _, ifdef) in enumerate(_symbol_rows()):
+        if ifdef >= 0:
+            masks[names[ifdef]] |= 1 << idx
+    return masks
+
+
+def version_index(loader: str) -> VersionIndex[Any]:
+    """
+    Returns the index of the table loaded by `loader`, sorted by the version that
+    each entry was added in, building it if necessary.
+    """
+    key = f"{loader}_by_version"
+    try:
+        return _CACHE[key]  # type: ignore[no-any-return]
+    except KeyError:
+        # NOTE: Imported here, since the indexes aren't needed for plain lookups.
+        from abi3info._index import VersionIndex
+
+        table = globals()[loader]()
+        index = VersionIndex(table, tuple(_load()[loader]["added"]))
+        return _CACHE.setdefault(key, index)  # type: ignore[no-any-return]
+
+
+@_cached
+def name_index() -> NameIndex[Any]:
+    """
+    Creates the index of the functions, data objects, macros, typedefs and structs,
+    sorted by name.
+    """
+    from abi3info._index import NameIndex
+
+    return NameIndex(tuple(globals()[loader]() for loader in _VERSIONED_LOADERS))
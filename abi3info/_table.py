@@ -0,0 +1,375 @@
+"""
+Read-only table views over columnar data.
+
+This module should not be used directly; it is not a public API.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, ItemsView, Iterator, Mapping, ValuesView
+from typing import Any, TypeVar
+
+from abi3info.models import Symbol, _Frozen
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+def _symbol_name(symbol: str | bytes | Symbol) -> str:
+    """
+    Returns the name of `symbol`, decoding it as UTF-8 if it's `bytes`.
+    """
+    if isinstance(symbol, Symbol):
+        return symbol.name
+    elif isinstance(symbol, bytes):
+        return symbol.decode("utf-8", "replace")
+    return symbol
+
+
+class _Immutable(_Frozen):
+    """
+    A mixin that forbids setting or deleting attributes after construction.
+
+    Subclasses must set their attributes with `object.__setattr__`. Like the
+    models, immutable objects are never copied, and the ones loaded by
+    `abi3info` are pickled as references to their loader.
+    """
+
+    __slots__ = ()
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """
+        Reduces this object to a reference to the loader that cached it.
+
+        Raises `TypeError` if this object wasn't loaded by `abi3info`.
+        """
+        from abi3info import _snapshot
+
+        key = _snapshot._cached_key(self)
+        if key is None:
+            raise TypeError(f"cannot pickle a {type(self).__name__} not loaded by abi3info")
+        return (_snapshot._restore, (key,))
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """
+        Raises `AttributeError`, since this object is immutable.
+        """
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        """
+        Raises `AttributeError`, since this object is immutable.
+        """
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+
+class Table(_Immutable, Mapping[K, V]):
+    """
+    An immutable mapping over a table's columns.
+
+    Each table is backed by a tuple of names (the table's keys), plus
+    whatever other columns `build` needs to construct the value for a row.
+    Values are only built the first time they're accessed, and are then
+    cached for subsequent accesses.
+
+    Tables can't be modified once created, and are safe to read from multiple
+    threads without locking (including on free-threaded builds of CPython).
+    If several threads race to build the same value, they may each build it,
+    but only the first one to be cached is ever returned.
+    """
+
+    __slots__ = ("_names", "_index", "_build", "_values")
+
+    _names: tuple[str, ...]
+    _index: dict[str, int]
+    _build: Callable[[int, K], V]
+    _values: dict[int, V]
+
+    def __init__(self, names: tuple[str, ...], build: Callable[[int, K], V]) -> None:
+        """
+        Creates a new `Table` with the given `names`, using `build` to construct
+        the value for each row from its index and key.
+        """
+        _set = object.__setattr__
+        _set(self, "_names", names)
+        _set(self, "_index", {name: idx for idx, name in enumerate(names)})
+        _set(self, "_build", build)
+        _set(self, "_values", {})
+
+    def _lookup(self, key: object) -> int:
+        """
+        Returns the row index for `key`, or raises `KeyError`.
+        """
+        return self._index[key]  # type: ignore[index]
+
+    def _key(self, idx: int) -> K:
+        """
+        Returns the key for the given row.
+        """
+        return self._names[idx]  # type: ignore[return-value]
+
+    def _value(self, idx: int) -> V:
+        """
+        Returns the value for the given row, building it if necessary.
+        """
+        # NOTE: `dict.setdefault` is atomic, so concurrent builders of the
+        # same value all end up returning whichever one was cached first.
+        try:
+            return self._values[idx]
+        except KeyError:
+            return self._values.setdefault(idx, self._build(idx, self._key(idx)))
+
+    def _get_name(self, name: str | bytes | Symbol) -> V | None:
+        """
+        Returns the value for the row named `name`, or `None` if there isn't one.
+
+        Unlike `SymbolTable.__getitem__`, this doesn't require a `Symbol` to look
+        up (but accepts one). `bytes` names (e.g. as read from a binary) are
+        decoded as UTF-8.
+        """
+        if not isinstance(name, str):
+            name = _symbol_name(name)
+        idx = self._index.get(name)
+        return None if idx is None else self._value(idx)
+
+    def _is_value(self, name: str, value: object) -> bool:
+        """
+        Returns whether `value` is the (already built) value for the row named `name`.
+        """
+        idx = self._index.get(name)
+        return idx is not None and self._values.get(idx) is value
+
+    def _build_all(self) -> None:
+        """
+        Eagerly builds every key and value in this table, so that subsequent
+        reads never need to populate the table's caches.
+        """
+        for idx in range(len(self._names)):
+            self._key(idx)
+            self._value(idx)
+
+    def __getitem__(self, key: K) -> V:
+        """
+        Returns the value for `key`, building it if necessary.
+        """
+        return self._value(self._lookup(key))
+
+    def __contains__(self, key: object) -> bool:
+        """
+        Returns whether `key` is in this table, without building its value.
+        """
+        try:
+            self._lookup(key)
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self) -> Iterator[K]:
+        """
+        Returns an iterator over this table's keys, in table order.
+        """
+        return map(self._key, range(len(self._names)))
+
+    def __len__(self) -> int:
+        """
+        Returns the number of rows in this table.
+        """
+        return len(self._names)
+
+    def items(self) -> ItemsView[K, V]:
+        """
+        Returns a view of this table's `(key, value)` pairs, in table order.
+        """
+        return _TableItems(self)
+
+    def values(self) -> ValuesView[V]:
+        """
+        Returns a view of this table's values, in table order.
+        """
+        return _TableValues(self)
+
+    def __repr__(self) -> str:
+        """
+        Returns a `dict`-style representation of this table.
+        """
+        return f"{type(self).__name__}({dict(self)!r})"
+
+
+class _TableItems(ItemsView[K, V]):
+    """
+    A view of a `Table`'s `(key, value)` pairs.
+
+    Unlike the generic `ItemsView`, this iterates by row rather than by key, so
+    iterating doesn't look each key back up (which, for a `SymbolTable`, means
+    building each row's `Symbol` twice).
+    """
+
+    __slots__ = ()
+
+    _mapping: Table[K, V]
+
+    def __iter__(self) -> Iterator[tuple[K, V]]:
+        """
+        Returns an iterator over the table's `(key, value)` pairs, in table order.
+        """
+        table = self._mapping
+        rows = range(len(table))
+        return zip(map(table._key, rows), map(table._value, rows))
+
+
+class _TableValues(ValuesView[V]):
+    """
+    A view of a `Table`'s values, which (like `_TableItems`) iterates by row.
+    """
+
+    __slots__ = ()
+
+    _mapping: Table[Any, V]
+
+    def __iter__(self) -> Iterator[V]:
+        """
+        Returns an iterator over the table's values, in table order.
+        """
+        table = self._mapping
+        return map(table._value, range(len(table)))
+
+
+class SymbolTable(Table[Symbol, V]):
+    """
+    A `Table` keyed by `Symbol`s rather than names.
+
+    Each row's `Symbol` is built once, on first use, and then shared between
+    the table's key and its value.
+    """
+
+    __slots__ = ("_symbols",)
+
+    _symbols: dict[int, Symbol]
+
+    def __init__(self, names: tuple[str, ...], build: Callable[[int, Symbol], V]) -> None:
+        """
+        Creates a new `SymbolTable`; see `Table`.
+        """
+        super().__init__(names, build)
+        object.__setattr__(self, "_symbols", {})
+
+    def _lookup(self, key: object) -> int:
+        """
+        Returns the row index for `key`, or raises `KeyError`.
+        """
+        if not isinstance(key, Symbol):
+            raise KeyError(key)
+        return self._index[key.name]
+
+    def _key(self, idx: int) -> Symbol:
+        """
+        Returns the `Symbol` for the given row, building it if necessary.
+        """
+        try:
+            return self._symbols[idx]
+        except KeyError:
+            return self._symbols.setdefault(idx, Symbol.from_row((self._names[idx], None)))
+
+
+class MangledTable(_Immutable, Mapping[str, V]):
+    """
+    An immutable mapping from platform-mangled symbol names (e.g. `_Py_Initialize`
+    on macOS) to the values of one or more `SymbolTable`s.
+
+    The first lookup builds a reverse index for each table, from each row's
+    mangled name to its row index. The mangled names are taken from each row's
+    `Symbol` (e.g. `Symbol.macos`), and the row indices from the table's own
+    name index, so the reverse indexes share their keys and values with those.
+
+    Each value that's looked up is then also cached by its mangled name, so that
+    repeated lookups are a single dictionary probe that allocates nothing.
+    """
+
+    __slots__ = ("_platform", "_tables", "_indexes", "_entries")
+
+    _platform: str
+    _tables: tuple[SymbolTable[V], ...]
+    _indexes: dict[None, tuple[dict[str, int], ...]]
+    _entries: dict[str, V]
+
+    def __init__(self, platform: str, tables: tuple[SymbolTable[V], ...]) -> None:
+        """
+        Creates a new `MangledTable` over `tables`, for the names given by the
+        `platform` property of `Symbol`.
+        """
+        _set = object.__setattr__
+        _set(self, "_platform", platform)
+        _set(self, "_tables", tables)
+        _set(self, "_indexes", {})
+        _set(self, "_entries", {})
+
+    def _reverse(self) -> tuple[dict[str, int], ...]:
+        """
+        Returns the reverse index for each table, building them if necessary.
+        """
+        try:
+            return self._indexes[None]
+        except KeyError:
+            platform = self._platform
+            indexes = tuple(
+                {getattr(table._key(idx), platform): idx for idx in table._index.values()}
+                for table in self._tables
+            )
+            return self._indexes.setdefault(None, indexes)
+
+    def _resolve(self, key: str) -> V:
+        """
+        Returns the value for the mangled name `key` from the reverse indexes,
+        building it if necessary, or raises `KeyError`.
+        """
+        for table, index in zip(self._tables, self._reverse()):
+            idx = index.get(key)
+            if idx is not None:
+                return table._value(idx)
+        raise KeyError(key)
+
+    def _build_all(self) -> None:
+        """
+        Eagerly builds every key and value in the underlying tables, along with
+        the reverse indexes (and so each key's mangled name) and every cached entry.
+        """
+        for table in self._tables:
+            table._build_all()
+        for key in self:
+            self[key]
+
+    def __getitem__(self, key: str) -> V:
+        """
+        Returns the value for the mangled name `key`.
+        """
+        # NOTE: As in `Table._value`, racing threads all return whichever value
+        # was cached first (which is the same canonical value regardless).
+        try:
+            return self._entries[key]
+        except KeyError:
+            return self._entries.setdefault(key, self._resolve(key))
+
+    def __contains__(self, key: object) -> bool:
+        """
+        Returns whether `key` is in this table, without building its value.
+        """
+        return key in self._entries or any(key in index for index in self._reverse())
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Returns an iterator over the mangled names, in table order.
+        """
+        for index in self._reverse():
+            yield from index
+
+    def __len__(self) -> int:
+        """
+        Returns the number of entries across all of the underlying tables.
+        """
+        return sum(map(len, self._tables))
+
+    def __repr__(self) -> str:
+        """
+        Returns a `dict`-style representation of this table.
+        """
+        return f"{type(self).__name__}({dict(self)!r})"
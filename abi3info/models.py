@@ -1,18 +1,151 @@
 """
 Data models for the CPython limited API and stable ABI.
+
+Each model can also be built from a row of its fields, in field order, with its
+`from_row` classmethod, e.g. `Macro.from_row(("Py_False", PyVersion(3, 2)))`.
+This is equivalent to calling the model (e.g. `Macro(*row)`), but skips the
+frozen dataclass `__init__`, making it much faster for loaders that build many
+models at once (e.g. from a TOML file or a database).
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Literal
+import dataclasses
+import functools
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any, ClassVar, Literal, SupportsIndex, TypeVar
 
 # a best-effort taxonomy for shared object file symbols across all platforms.
 Visibility = Literal["local", "global", "weak"]
 
+# The canonical (interned) `PyVersion` for each (major, minor) pair.
+# See `PyVersion.intern`.
+_PY_VERSIONS: dict[tuple[int, int], PyVersion] = {}
+
+# The maximum number of distinct inputs that each `PyVersion` parser caches.
+# See `PyVersion.parser_cache_info`.
+_PARSER_CACHE_SIZE = 512
+
+
+_M = TypeVar("_M")
+
+# Sets a single slot on an instance; see `_slot_setter`.
+_Setter = Callable[[Any, Any], None]
+
+
+def _slot_setter(cls: type, name: str) -> _Setter:
+    """
+    Returns the setter for the slot `name`, declared directly on `cls`.
+    """
+    return vars(cls)[name].__set__  # type: ignore[no-any-return]
+
+
+def _slot_setters(cls: type) -> tuple[_Setter, ...]:
+    """
+    Returns a setter for each of the given (slotted) dataclass's fields, in
+    field order, for use by its `from_row` constructor.
+
+    Calling a slot's setter directly is much cheaper than going through the frozen
+    dataclass `__init__`, which calls `object.__setattr__` (and so looks up the
+    slot by name) for every field.
+    """
+    return tuple(_slot_setter(cls, f.name) for f in dataclasses.fields(cls))
+
+
+class _Frozen:
+    """
+    A mixin for immutable models, which are never copied: `copy.copy` and
+    `copy.deepcopy` both return the original object.
+    """
+
+    __slots__ = ()
+
+    def __copy__(self: _M) -> _M:
+        """
+        Returns this object, since it's immutable.
+        """
+        return self
+
+    def __deepcopy__(self: _M, memo: dict[int, Any]) -> _M:
+        """
+        Returns this object, since it (and everything it refers to) is immutable.
+        """
+        return self
+
+
+class _TableEntry(_Frozen):
+    """
+    A mixin for models that are entries in one of the tables in `abi3info`.
+
+    NOTE: Each entry model defines `__eq__` by hand, rather than using the
+    dataclass-generated one, so that comparing an entry against itself
+    short-circuits on identity instead of comparing every (nested) field.
+
+    The canonical entries (i.e. the objects in the tables themselves) are pickled
+    and copied by reference to their table and key, rather than by value: they
+    unpickle to the receiving process's own canonical entry, and pickles stay
+    small since they don't include the entry's (nested) fields.
+
+    Entries constructed directly are pickled and copied by value, as usual.
+    """
+
+    __slots__ = ()
+
+    _TABLE: ClassVar[str]
+    """
+    The name of the `abi3info._snapshot` loader for this model's table.
+    """
+
+    def _table_key(self) -> str:
+        """
+        Returns this entry's key (i.e. its name) in its table.
+        """
+        return self.name  # type: ignore[attr-defined, no-any-return]
 
-@dataclass(frozen=True, eq=False, unsafe_hash=True)
-class Symbol:
+    def __reduce_ex__(self, protocol: SupportsIndex) -> str | tuple[Any, ...]:
+        """
+        Reduces canonical table entries to a reference to their table and key.
+        """
+        from abi3info import _snapshot
+
+        key = self._table_key()
+        if _snapshot._is_entry(self._TABLE, key, self):
+            return (_snapshot._entry, (self._TABLE, key))
+        return super().__reduce_ex__(protocol)
+
+
+class _HashedEntry(_TableEntry):
+    """
+    A mixin for table entries that cache their hash on first use.
+
+    Like `Symbol`'s caches, the cache is a slot declared here rather than a
+    dataclass field. It's unset until the entry is first hashed.
+    """
+
+    __slots__ = ("_hash",)
+
+    _hash: int
+
+
+class _SymbolCaches(_Frozen):
+    """
+    The slots in which a `Symbol` caches values derived from its name.
+
+    These are declared here, rather than as dataclass fields on `Symbol`, so that
+    they stay out of `dataclasses.fields` (and so out of `asdict`, `astuple`,
+    the repr and comparisons).
+    """
+
+    __slots__ = ("_hash", "_macos", "_windows_import")
+
+    _hash: int
+    _macos: str
+    _windows_import: str
+
+
+@dataclass(frozen=True, eq=False, slots=True)
+class Symbol(_SymbolCaches):
     """
     Represents a linker symbol, which may or may not point to some kind of object
     (function, struct, constant, etc.).
@@ -27,7 +160,7 @@ class Symbol:
     The symbol's underlying name. This may not correspond to an actual symbol
     in a binary without platform-specific normalization.
     """
-    visibility: Visibility | None = field(default=None, hash=False)
+    visibility: Visibility | None = None
     """
     The symbol's visibility in the shared object file, or None if it could not
     be determined.
@@ -38,7 +171,14 @@ class Symbol:
         """
         Returns a macOS-style symbol for the underlying symbol.
         """
-        return f"_{self.name}"
+        # NOTE: The mangled names that differ from `name` are built on first use,
+        # and then cached; racing threads build equal strings, so no locking is needed.
+        try:
+            return self._macos
+        except AttributeError:
+            macos = f"_{self.name}"
+            object.__setattr__(self, "_macos", macos)
+            return macos
 
     @property
     def linux(self) -> str:
@@ -47,6 +187,30 @@ class Symbol:
         """
         return self.name
 
+    @property
+    def windows(self) -> str:
+        """
+        Returns a Windows-style symbol for the underlying symbol, as exported
+        from the DLL.
+        """
+        return self.name
+
+    @property
+    def windows_import(self) -> str:
+        """
+        Returns a Windows import library-style symbol for the underlying symbol,
+        i.e. the `__imp_`-prefixed pointer that calls through the DLL's import table.
+
+        This is the x64 and ARM64 form; 32-bit x86 additionally prefixes the name
+        with an underscore (e.g. `__imp__Py_Initialize`).
+        """
+        try:
+            return self._windows_import
+        except AttributeError:
+            windows_import = f"__imp_{self.name}"
+            object.__setattr__(self, "_windows_import", windows_import)
+            return windows_import
+
     # NOTE: Manually defined to make the typing stronger here;
     # the automatic __eq__ implementation from dataclasses allows comparison
     # against flexible types as long as they match the inner fields.
@@ -54,18 +218,88 @@ class Symbol:
         """
         Checks the equality of this `Symbol` against another.
         """
+        if self is other:
+            return True
         if not isinstance(other, Symbol):
             raise TypeError("Symbol instances can only be compared against other Symbol instances")
 
         return self.name == other.name
 
+    # NOTE: The hash is computed on first use and then cached (`Symbol.from_row`
+    # precomputes it instead, for table keys). It's the hash of a tuple (as with
+    # the dataclass-generated hash), rather than of the name itself, so that
+    # `Symbol`s and `str`s never collide when probing a `str`-keyed mapping
+    # (which would compare them, and so raise `TypeError`).
+    def __hash__(self) -> int:
+        """
+        Returns this `Symbol`'s (cached) hash.
+        """
+        # NOTE: Racing threads compute the same value, so the cache needs no locking.
+        try:
+            return self._hash
+        except AttributeError:
+            value = hash((self.name,))
+            object.__setattr__(self, "_hash", value)
+            return value
+
+    def __reduce__(self) -> tuple[type[Symbol], tuple[str, Visibility | None]]:
+        """
+        Pickles this `Symbol` by its fields, so that its hash is recomputed
+        (rather than restored) when unpickling.
+        """
+        return (type(self), (self.name, self.visibility))
+
+    _SETTERS: ClassVar[tuple[_Setter, ...]]
+
+    @classmethod
+    def from_row(cls, row: tuple[str, Visibility | None]) -> Symbol:
+        """
+        Builds a `Symbol` from a `(name, visibility)` row.
+
+        This is equivalent to `Symbol(*row)`, but faster when building many
+        `Symbol`s at once (e.g. when loading a table).
+        """
+        self = object.__new__(cls)
+        name, visibility = cls._SETTERS
+        name(self, row[0])
+        visibility(self, row[1])
+        _set_symbol_hash(self, hash((row[0],)))
+        return self
 
-@dataclass(frozen=True, order=True)
-class PyVersion:
+
+_set_symbol_hash = _slot_setter(_SymbolCaches, "_hash")
+
+
+class _VersionKey(_Frozen):
+    """
+    The slot in which a `PyVersion` stores its integer encoding.
+
+    Like `Symbol`'s caches, this is declared here rather than as a dataclass
+    field, so that it stays out of `dataclasses.fields` (and `astuple`).
+    """
+
+    __slots__ = ("_hex",)
+
+    _hex: int
+
+
+@dataclass(frozen=True, slots=True)
+class PyVersion(_VersionKey):
     """
     Represents a (major, minor) version of Python.
 
     Patch and other version metadata is not included.
+
+    `PyVersion`s returned by the parsing and decoding methods below (and by the
+    tables in `abi3info`) are interned: identical versions are represented by
+    a single shared object. See `PyVersion.intern` for details.
+
+    The parsing and decoding methods are also memoized, with a bounded cache
+    per method; see `PyVersion.parser_cache_info`.
+
+    Each `PyVersion` also carries a precomputed `PY_VERSION_HEX`-style integer
+    (see `PyVersion.to_hex`), which is used for ordering and hashing. As in
+    `PY_VERSION_HEX`, the major and minor versions must each be in `0..255`.
     """
 
     major: int
@@ -78,7 +312,61 @@ class PyVersion:
     The minor version.
     """
 
+    def __post_init__(self) -> None:
+        """
+        Checks this `PyVersion`'s range, and precomputes its integer encoding.
+        """
+        # NOTE: Out-of-range versions would overlap in the encoding, and so
+        # compare (and hash) equal to other versions.
+        if not (0 <= self.major <= 0xFF and 0 <= self.minor <= 0xFF):
+            raise ValueError(f"version out of range: {self.major}.{self.minor}")
+        object.__setattr__(self, "_hex", (self.major << 24) | (self.minor << 16))
+
+    @classmethod
+    def intern(cls, major: int, minor: int) -> PyVersion:
+        """
+        Returns the canonical `PyVersion` for the given major and minor versions.
+
+        Repeated calls with the same arguments return the same object, meaning
+        that interned versions can be compared by identity. Versions constructed
+        directly (e.g. `PyVersion(3, 2)`) are *not* interned, but still compare
+        equal to their interned counterparts.
+        """
+        version = _PY_VERSIONS.get((major, minor))
+        if version is None:
+            version = _PY_VERSIONS.setdefault((major, minor), cls(major=major, minor=minor))
+        return version
+
+    @classmethod
+    def parser_cache_info(cls) -> dict[str, functools._CacheInfo]:
+        """
+        Returns the hit and miss statistics for each memoized parsing method,
+        keyed by method name.
+
+        Each method caches the results for up to 512 distinct inputs, discarding
+        the least recently used inputs once full. Inputs that fail to parse are
+        not cached.
+        """
+        return {
+            "decode_version": cls.decode_version.cache_info(),
+            "parse_dotted": cls.parse_dotted.cache_info(),
+            "parse_python_tag": cls.parse_python_tag.cache_info(),
+        }
+
+    @classmethod
+    def parser_cache_clear(cls) -> None:
+        """
+        Clears the caches (and statistics) of each memoized parsing method.
+
+        This doesn't affect interning: parsing the same input again after
+        clearing still returns the same `PyVersion` object.
+        """
+        cls.decode_version.cache_clear()
+        cls.parse_dotted.cache_clear()
+        cls.parse_python_tag.cache_clear()
+
     @classmethod
+    @functools.lru_cache(maxsize=_PARSER_CACHE_SIZE)
     def decode_version(cls, val: int) -> PyVersion:
         """
         Attempts to decode a `PyVersion` from the given integer, which
@@ -90,9 +378,29 @@ class PyVersion:
         """
         major = val >> 24
         minor = (val >> 16) & 0x00FF
-        return cls(major=major, minor=minor)
+        return cls.intern(major, minor)
 
     @classmethod
+    def from_hex(cls, val: int) -> PyVersion:
+        """
+        Returns the `PyVersion` for the given `PY_VERSION_HEX`-style integer.
+
+        This is the inverse of `PyVersion.to_hex`, and is equivalent to
+        `PyVersion.decode_version`.
+        """
+        return cls.decode_version(val)
+
+    def to_hex(self) -> int:
+        """
+        Returns this `PyVersion` as a `PY_VERSION_HEX`-style integer.
+
+        The patch ("micro"), release, and serial versions are all zero, e.g.
+        `PyVersion(3, 10).to_hex() == 0x030A0000`.
+        """
+        return self._hex
+
+    @classmethod
+    @functools.lru_cache(maxsize=_PARSER_CACHE_SIZE)
     def parse_dotted(cls, val: str) -> PyVersion:
         """
         Attempts to parse a `PyVersion` version from the given string.
@@ -101,9 +409,10 @@ class PyVersion:
         formats are not supported.
         """
         major, minor = val.split(".", 1)
-        return cls(major=int(major), minor=int(minor))
+        return cls.intern(int(major), int(minor))
 
     @classmethod
+    @functools.lru_cache(maxsize=_PARSER_CACHE_SIZE)
     def parse_python_tag(cls, val: str) -> PyVersion:
         """
         Attempts to parse a `PyVersion` from a PEP 425-style "Python tag".
@@ -114,6 +423,9 @@ class PyVersion:
         * Only CPython tags (e.g. `cp310`) are supported
         * Underscores are not handled, because CPython tags don't use them
         * "Major-version-only" tags (e.g. `cp3`) are not supported
+
+        See `abi3info.tags.parse_wheel_tags` for parsing many tags (including
+        compressed tag sets and underscored tags) at once.
         """
         if not val.startswith("cp"):
             raise ValueError("expected CPython tag")
@@ -123,7 +435,67 @@ class PyVersion:
             raise ValueError("unexpected _ in Python tag; not implemented")
 
         major, minor = body[0], body[1:]
-        return cls(major=int(major), minor=int(minor))
+        return cls.intern(int(major), int(minor))
+
+    # NOTE: The comparison methods below are manually defined so that they
+    # compare a single integer, rather than building and comparing tuples.
+    # Equality also short-circuits on identity, for interned versions.
+    def __eq__(self, other: object) -> bool:
+        """
+        Checks the equality of this `PyVersion` against another.
+        """
+        if self is other:
+            return True
+        if not isinstance(other, PyVersion):
+            return NotImplemented
+        return self._hex == other._hex
+
+    def __lt__(self, other: PyVersion) -> bool:
+        """
+        Checks whether this `PyVersion` is older than another.
+        """
+        if not isinstance(other, PyVersion):
+            return NotImplemented
+        return self._hex < other._hex
+
+    def __le__(self, other: PyVersion) -> bool:
+        """
+        Checks whether this `PyVersion` is older than or equal to another.
+        """
+        if not isinstance(other, PyVersion):
+            return NotImplemented
+        return self._hex <= other._hex
+
+    def __gt__(self, other: PyVersion) -> bool:
+        """
+        Checks whether this `PyVersion` is newer than another.
+        """
+        if not isinstance(other, PyVersion):
+            return NotImplemented
+        return self._hex > other._hex
+
+    def __ge__(self, other: PyVersion) -> bool:
+        """
+        Checks whether this `PyVersion` is newer than or equal to another.
+        """
+        if not isinstance(other, PyVersion):
+            return NotImplemented
+        return self._hex >= other._hex
+
+    def __hash__(self) -> int:
+        """
+        Returns this `PyVersion`'s hash, which is its integer encoding's hash.
+        """
+        return hash(self._hex)
+
+    def __reduce__(self) -> tuple[Any, tuple[int, int]]:
+        """
+        Pickles this `PyVersion` by its fields, so that interned versions
+        unpickle to the receiving process's interned versions.
+        """
+        if _PY_VERSIONS.get((self.major, self.minor)) is self:
+            return (PyVersion.intern, (self.major, self.minor))
+        return (type(self), (self.major, self.minor))
 
     def __str__(self) -> str:
         """
@@ -132,8 +504,8 @@ class PyVersion:
         return f"{self.major}.{self.minor}"
 
 
-@dataclass(frozen=True)
-class Macro:
+@dataclass(frozen=True, slots=True)
+class Macro(_TableEntry):
     """
     Represents a C/C++ macro in the context of the limited API.
 
@@ -144,6 +516,8 @@ class Macro:
     "const" and "macro".
     """
 
+    _TABLE: ClassVar[str] = "macros"
+
     name: str
     """
     The macro's name.
@@ -154,15 +528,43 @@ class Macro:
     When this macro was added to the limited API.
     """
 
+    def __eq__(self, other: object) -> bool:
+        """
+        Checks the equality of this `Macro` against another.
+        """
+        if self is other:
+            return True
+        if not isinstance(other, Macro):
+            return NotImplemented
+        return (self.name, self.added) == (other.name, other.added)
+
+    _SETTERS: ClassVar[tuple[_Setter, ...]]
 
-@dataclass(frozen=True)
-class OpaqueStruct:
+    @classmethod
+    def from_row(cls, row: tuple[str, PyVersion]) -> Macro:
+        """
+        Builds a `Macro` from a `(name, added)` row.
+
+        This is equivalent to `Macro(*row)`, but faster when building many
+        `Macro`s at once (e.g. when loading a table).
+        """
+        self = object.__new__(cls)
+        name, added = cls._SETTERS
+        name(self, row[0])
+        added(self, row[1])
+        return self
+
+
+@dataclass(frozen=True, slots=True)
+class OpaqueStruct(_TableEntry):
     """
     Represents a struct defined by the limited API but considered "opaque"
     in the stable ABI, meaning that it is only referenced via pointers
     and not with respect to its members.
     """
 
+    _TABLE: ClassVar[str] = "structs"
+
     name: str
     """
     The struct's name.
@@ -173,42 +575,137 @@ class OpaqueStruct:
     When this struct was added to the limited API.
     """
 
+    def __eq__(self, other: object) -> bool:
+        """
+        Checks the equality of this `OpaqueStruct` against another.
+        """
+        if self is other:
+            return True
+        if not isinstance(other, OpaqueStruct):
+            return NotImplemented
+        return (self.name, self.added) == (other.name, other.added)
+
+    _SETTERS: ClassVar[tuple[_Setter, ...]]
+
+    @classmethod
+    def from_row(cls, row: tuple[str, PyVersion]) -> OpaqueStruct:
+        """
+        Builds a `OpaqueStruct` from a `(name, added)` row.
+
+        This is equivalent to `OpaqueStruct(*row)`, but faster when building many
+        `OpaqueStruct`s at once (e.g. when loading a table).
+        """
+        self = object.__new__(cls)
+        name, added = cls._SETTERS
+        name(self, row[0])
+        added(self, row[1])
+        return self
+
 
-@dataclass(frozen=True)
-class PartialStruct:
+@dataclass(frozen=True, slots=True)
+class PartialStruct(_TableEntry):
     """
     Represents a struct defined by the limited API but considered "partial"
     in the stable ABI, meaning that only the members listed are guaranteed
     not to change.
     """
 
+    _TABLE: ClassVar[str] = "structs"
+
     name: str
     added: PyVersion
-    members: list[str]
+    members: tuple[str, ...]
+
+    def __post_init__(self) -> None:
+        """
+        Stores `members` as a tuple, even if given as some other iterable (e.g. a list),
+        so that this `PartialStruct` stays immutable and hashable.
+        """
+        # NOTE: `tuple` returns tuples (e.g. those from `from_row`) as-is.
+        if self.members is not None:
+            object.__setattr__(self, "members", tuple(self.members))
 
+    def __eq__(self, other: object) -> bool:
+        """
+        Checks the equality of this `PartialStruct` against another.
+        """
+        if self is other:
+            return True
+        if not isinstance(other, PartialStruct):
+            return NotImplemented
+        return (self.name, self.added, self.members) == (other.name, other.added, other.members)
 
-@dataclass(frozen=True)
-class FullStruct:
+    _SETTERS: ClassVar[tuple[_Setter, ...]]
+
+    @classmethod
+    def from_row(cls, row: tuple[str, PyVersion, Iterable[str]]) -> PartialStruct:
+        """
+        Builds a `PartialStruct` from a `(name, added, members)` row.
+
+        This is equivalent to `PartialStruct(*row)`, but faster when building many
+        `PartialStruct`s at once (e.g. when loading a table).
+        """
+        self = object.__new__(cls)
+        name, added, members = cls._SETTERS
+        name(self, row[0])
+        added(self, row[1])
+        # NOTE: As in `__post_init__`, e.g. for rows with a list of members.
+        members(self, tuple(row[2]))
+        return self
+
+
+@dataclass(frozen=True, slots=True)
+class FullStruct(_TableEntry):
     """
     Represents a struct defined by the limited API that is considered "full"
     in the stable ABI, meaning that its members and layout are guaranteed
     not to change.
     """
 
+    _TABLE: ClassVar[str] = "structs"
+
     name: str
     added: PyVersion
 
+    def __eq__(self, other: object) -> bool:
+        """
+        Checks the equality of this `FullStruct` against another.
+        """
+        if self is other:
+            return True
+        if not isinstance(other, FullStruct):
+            return NotImplemented
+        return (self.name, self.added) == (other.name, other.added)
+
+    _SETTERS: ClassVar[tuple[_Setter, ...]]
+
+    @classmethod
+    def from_row(cls, row: tuple[str, PyVersion]) -> FullStruct:
+        """
+        Builds a `FullStruct` from a `(name, added)` row.
+
+        This is equivalent to `FullStruct(*row)`, but faster when building many
+        `FullStruct`s at once (e.g. when loading a table).
+        """
+        self = object.__new__(cls)
+        name, added = cls._SETTERS
+        name(self, row[0])
+        added(self, row[1])
+        return self
+
 
 Struct = OpaqueStruct | PartialStruct | FullStruct
 
 
-@dataclass(frozen=True)
-class FeatureMacro:
+@dataclass(frozen=True, slots=True)
+class FeatureMacro(_TableEntry):
     """
     Represents a C/C++ macro that controls the availability of other
     components of the limited API and/or stable ABI.
     """
 
+    _TABLE: ClassVar[str] = "feature_macros"
+
     name: str
     """
     The feature macro's name.
@@ -227,9 +724,36 @@ class FeatureMacro:
     builds but is not necessarily defined, unlike `True`.
     """
 
+    def __eq__(self, other: object) -> bool:
+        """
+        Checks the equality of this `FeatureMacro` against another.
+        """
+        if self is other:
+            return True
+        if not isinstance(other, FeatureMacro):
+            return NotImplemented
+        return (self.name, self.doc, self.windows) == (other.name, other.doc, other.windows)
+
+    _SETTERS: ClassVar[tuple[_Setter, ...]]
 
-@dataclass(frozen=True)
-class Function:
+    @classmethod
+    def from_row(cls, row: tuple[str, str, bool | Literal["maybe"]]) -> FeatureMacro:
+        """
+        Builds a `FeatureMacro` from a `(name, doc, windows)` row.
+
+        This is equivalent to `FeatureMacro(*row)`, but faster when building many
+        `FeatureMacro`s at once (e.g. when loading a table).
+        """
+        self = object.__new__(cls)
+        name, doc, windows = cls._SETTERS
+        name(self, row[0])
+        doc(self, row[1])
+        windows(self, row[2])
+        return self
+
+
+@dataclass(frozen=True, slots=True)
+class Function(_HashedEntry):
     """
     Represents a function defined in the limited API and/or stable ABI.
 
@@ -243,6 +767,14 @@ class Function:
     for compatibility purposes.
     """
 
+    _TABLE: ClassVar[str] = "functions"
+
+    def _table_key(self) -> str:
+        """
+        Returns this entry's key (i.e. its symbol's name) in its table.
+        """
+        return self.symbol.name
+
     symbol: Symbol
     """
     The function's symbol.
@@ -265,9 +797,63 @@ class Function:
     Whether this function is present only in the stable ABI and **not** the limited API.
     """
 
+    def __hash__(self) -> int:
+        """
+        Returns this `Function`'s hash, computing and caching it on first use.
+        """
+        # NOTE: Racing threads compute the same value, so the cache needs no locking.
+        try:
+            return self._hash
+        except AttributeError:
+            value = hash((self.symbol, self.added, self.ifdef, self.abi_only))
+            object.__setattr__(self, "_hash", value)
+            return value
+
+    def __reduce__(
+        self,
+    ) -> tuple[type[Function], tuple[Symbol, PyVersion, FeatureMacro | None, bool]]:
+        """
+        Pickles this `Function` by its fields, so that its hash is recomputed
+        (rather than restored) when unpickling.
+        """
+        return (type(self), (self.symbol, self.added, self.ifdef, self.abi_only))
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Checks the equality of this `Function` against another.
+        """
+        if self is other:
+            return True
+        if not isinstance(other, Function):
+            return NotImplemented
+        return (self.symbol, self.added, self.ifdef, self.abi_only) == (
+            other.symbol,
+            other.added,
+            other.ifdef,
+            other.abi_only,
+        )
+
+    _SETTERS: ClassVar[tuple[_Setter, ...]]
+
+    @classmethod
+    def from_row(cls, row: tuple[Symbol, PyVersion, FeatureMacro | None, bool]) -> Function:
+        """
+        Builds a `Function` from a `(symbol, added, ifdef, abi_only)` row.
+
+        This is equivalent to `Function(*row)`, but faster when building many
+        `Function`s at once (e.g. when loading a table).
+        """
+        self = object.__new__(cls)
+        symbol, added, ifdef, abi_only = cls._SETTERS
+        symbol(self, row[0])
+        added(self, row[1])
+        ifdef(self, row[2])
+        abi_only(self, row[3])
+        return self
 
-@dataclass(frozen=True)
-class Data:
+
+@dataclass(frozen=True, slots=True)
+class Data(_HashedEntry):
     """
     Represents an exported object in the limited API and/or stable ABI.
 
@@ -276,6 +862,14 @@ class Data:
     of a function.
     """
 
+    _TABLE: ClassVar[str] = "datas"
+
+    def _table_key(self) -> str:
+        """
+        Returns this entry's key (i.e. its symbol's name) in its table.
+        """
+        return self.symbol.name
+
     symbol: Symbol
     """
     The data object's symbol.
@@ -298,13 +892,69 @@ class Data:
     Whether this data object is present only in the stable ABI and **not** the limited API.
     """
 
+    def __hash__(self) -> int:
+        """
+        Returns this `Data`'s hash, computing and caching it on first use.
+        """
+        # NOTE: Racing threads compute the same value, so the cache needs no locking.
+        try:
+            return self._hash
+        except AttributeError:
+            value = hash((self.symbol, self.added, self.ifdef, self.abi_only))
+            object.__setattr__(self, "_hash", value)
+            return value
+
+    def __reduce__(
+        self,
+    ) -> tuple[type[Data], tuple[Symbol, PyVersion, FeatureMacro | None, bool]]:
+        """
+        Pickles this `Data` by its fields, so that its hash is recomputed
+        (rather than restored) when unpickling.
+        """
+        return (type(self), (self.symbol, self.added, self.ifdef, self.abi_only))
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Checks the equality of this `Data` against another.
+        """
+        if self is other:
+            return True
+        if not isinstance(other, Data):
+            return NotImplemented
+        return (self.symbol, self.added, self.ifdef, self.abi_only) == (
+            other.symbol,
+            other.added,
+            other.ifdef,
+            other.abi_only,
+        )
+
+    _SETTERS: ClassVar[tuple[_Setter, ...]]
+
+    @classmethod
+    def from_row(cls, row: tuple[Symbol, PyVersion, FeatureMacro | None, bool]) -> Data:
+        """
+        Builds a `Data` from a `(symbol, added, ifdef, abi_only)` row.
+
+        This is equivalent to `Data(*row)`, but faster when building many
+        `Data`s at once (e.g. when loading a table).
+        """
+        self = object.__new__(cls)
+        symbol, added, ifdef, abi_only = cls._SETTERS
+        symbol(self, row[0])
+        added(self, row[1])
+        ifdef(self, row[2])
+        abi_only(self, row[3])
+        return self
+
 
-@dataclass(frozen=True)
-class Typedef:
+@dataclass(frozen=True, slots=True)
+class Typedef(_TableEntry):
     """
     Represents a `typedef`'d type in the limited API.
     """
 
+    _TABLE: ClassVar[str] = "typedefs"
+
     name: str
     """
     The name of this typedef.
@@ -314,3 +964,44 @@ class Typedef:
     """
     When this typedef was added to the limited API.
     """
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Checks the equality of this `Typedef` against another.
+        """
+        if self is other:
+            return True
+        if not isinstance(other, Typedef):
+            return NotImplemented
+        return (self.name, self.added) == (other.name, other.added)
+
+    _SETTERS: ClassVar[tuple[_Setter, ...]]
+
+    @classmethod
+    def from_row(cls, row: tuple[str, PyVersion]) -> Typedef:
+        """
+        Builds a `Typedef` from a `(name, added)` row.
+
+        This is equivalent to `Typedef(*row)`, but faster when building many
+        `Typedef`s at once (e.g. when loading a table).
+        """
+        self = object.__new__(cls)
+        name, added = cls._SETTERS
+        name(self, row[0])
+        added(self, row[1])
+        return self
+
+
+for _model in (
+    Symbol,
+    Macro,
+    OpaqueStruct,
+    PartialStruct,
+    FullStruct,
+    FeatureMacro,
+    Function,
+    Data,
+    Typedef,
+):
+    _model._SETTERS = _slot_setters(_model)
+del _model
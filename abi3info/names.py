@@ -0,0 +1,1340 @@
+"""
+Names of the members of the limited API and stable ABI, as plain sets of strings.
+
+Unlike the tables in `abi3info`, this module doesn't build any models
+(or import `abi3info.models` at all), making it a cheap way to check
+whether a name belongs to the limited API or stable ABI:
+
+```python
+from abi3info import names
+
+"PyType_FromSpec" in names.FUNCTIONS
+```
+"""
+
+from __future__ import annotations
+
+# this file was generated; do not modify it by hand!
+FUNCTIONS: frozenset[str] = frozenset(
+    [
+        "PyABIInfo_Check",
+        "PyAIter_Check",
+        "PyArg_Parse",
+        "PyArg_ParseTuple",
+        "PyArg_ParseTupleAndKeywords",
+        "PyArg_UnpackTuple",
+        "PyArg_VaParse",
+        "PyArg_VaParseTupleAndKeywords",
+        "PyArg_ValidateKeywordArguments",
+        "PyBool_FromLong",
+        "PyBuffer_FillContiguousStrides",
+        "PyBuffer_FillInfo",
+        "PyBuffer_FromContiguous",
+        "PyBuffer_GetPointer",
+        "PyBuffer_IsContiguous",
+        "PyBuffer_Release",
+        "PyBuffer_SizeFromFormat",
+        "PyBuffer_ToContiguous",
+        "PyByteArray_AsString",
+        "PyByteArray_Concat",
+        "PyByteArray_FromObject",
+        "PyByteArray_FromStringAndSize",
+        "PyByteArray_Resize",
+        "PyByteArray_Size",
+        "PyBytes_AsString",
+        "PyBytes_AsStringAndSize",
+        "PyBytes_Concat",
+        "PyBytes_ConcatAndDel",
+        "PyBytes_DecodeEscape",
+        "PyBytes_FromFormat",
+        "PyBytes_FromFormatV",
+        "PyBytes_FromObject",
+        "PyBytes_FromString",
+        "PyBytes_FromStringAndSize",
+        "PyBytes_Repr",
+        "PyBytes_Size",
+        "PyCFunction_Call",
+        "PyCFunction_GetFlags",
+        "PyCFunction_GetFunction",
+        "PyCFunction_GetSelf",
+        "PyCFunction_New",
+        "PyCFunction_NewEx",
+        "PyCMethod_New",
+        "PyCallIter_New",
+        "PyCallable_Check",
+        "PyCapsule_GetContext",
+        "PyCapsule_GetDestructor",
+        "PyCapsule_GetName",
+        "PyCapsule_GetPointer",
+        "PyCapsule_Import",
+        "PyCapsule_IsValid",
+        "PyCapsule_New",
+        "PyCapsule_SetContext",
+        "PyCapsule_SetDestructor",
+        "PyCapsule_SetName",
+        "PyCapsule_SetPointer",
+        "PyCodec_BackslashReplaceErrors",
+        "PyCodec_Decode",
+        "PyCodec_Decoder",
+        "PyCodec_Encode",
+        "PyCodec_Encoder",
+        "PyCodec_IgnoreErrors",
+        "PyCodec_IncrementalDecoder",
+        "PyCodec_IncrementalEncoder",
+        "PyCodec_KnownEncoding",
+        "PyCodec_LookupError",
+        "PyCodec_NameReplaceErrors",
+        "PyCodec_Register",
+        "PyCodec_RegisterError",
+        "PyCodec_ReplaceErrors",
+        "PyCodec_StreamReader",
+        "PyCodec_StreamWriter",
+        "PyCodec_StrictErrors",
+        "PyCodec_Unregister",
+        "PyCodec_XMLCharRefReplaceErrors",
+        "PyComplex_FromDoubles",
+        "PyComplex_ImagAsDouble",
+        "PyComplex_RealAsDouble",
+        "PyDescr_NewClassMethod",
+        "PyDescr_NewGetSet",
+        "PyDescr_NewMember",
+        "PyDescr_NewMethod",
+        "PyDictProxy_New",
+        "PyDict_Clear",
+        "PyDict_Contains",
+        "PyDict_Copy",
+        "PyDict_DelItem",
+        "PyDict_DelItemString",
+        "PyDict_GetItem",
+        "PyDict_GetItemRef",
+        "PyDict_GetItemString",
+        "PyDict_GetItemStringRef",
+        "PyDict_GetItemWithError",
+        "PyDict_Items",
+        "PyDict_Keys",
+        "PyDict_Merge",
+        "PyDict_MergeFromSeq2",
+        "PyDict_New",
+        "PyDict_Next",
+        "PyDict_SetDefaultRef",
+        "PyDict_SetItem",
+        "PyDict_SetItemString",
+        "PyDict_Size",
+        "PyDict_Update",
+        "PyDict_Values",
+        "PyErr_BadArgument",
+        "PyErr_BadInternalCall",
+        "PyErr_CheckSignals",
+        "PyErr_Clear",
+        "PyErr_Display",
+        "PyErr_DisplayException",
+        "PyErr_ExceptionMatches",
+        "PyErr_Fetch",
+        "PyErr_Format",
+        "PyErr_FormatV",
+        "PyErr_GetExcInfo",
+        "PyErr_GetHandledException",
+        "PyErr_GetRaisedException",
+        "PyErr_GivenExceptionMatches",
+        "PyErr_NewException",
+        "PyErr_NewExceptionWithDoc",
+        "PyErr_NoMemory",
+        "PyErr_NormalizeException",
+        "PyErr_Occurred",
+        "PyErr_Print",
+        "PyErr_PrintEx",
+        "PyErr_ProgramText",
+        "PyErr_ResourceWarning",
+        "PyErr_Restore",
+        "PyErr_SetExcFromWindowsErr",
+        "PyErr_SetExcFromWindowsErrWithFilename",
+        "PyErr_SetExcFromWindowsErrWithFilenameObject",
+        "PyErr_SetExcFromWindowsErrWithFilenameObjects",
+        "PyErr_SetExcInfo",
+        "PyErr_SetFromErrno",
+        "PyErr_SetFromErrnoWithFilename",
+        "PyErr_SetFromErrnoWithFilenameObject",
+        "PyErr_SetFromErrnoWithFilenameObjects",
+        "PyErr_SetFromWindowsErr",
+        "PyErr_SetFromWindowsErrWithFilename",
+        "PyErr_SetHandledException",
+        "PyErr_SetImportError",
+        "PyErr_SetImportErrorSubclass",
+        "PyErr_SetInterrupt",
+        "PyErr_SetInterruptEx",
+        "PyErr_SetNone",
+        "PyErr_SetObject",
+        "PyErr_SetRaisedException",
+        "PyErr_SetString",
+        "PyErr_SyntaxLocation",
+        "PyErr_SyntaxLocationEx",
+        "PyErr_WarnEx",
+        "PyErr_WarnExplicit",
+        "PyErr_WarnFormat",
+        "PyErr_WriteUnraisable",
+        "PyEval_AcquireLock",
+        "PyEval_AcquireThread",
+        "PyEval_CallFunction",
+        "PyEval_CallMethod",
+        "PyEval_CallObjectWithKeywords",
+        "PyEval_EvalCode",
+        "PyEval_EvalCodeEx",
+        "PyEval_EvalFrame",
+        "PyEval_EvalFrameEx",
+        "PyEval_GetBuiltins",
+        "PyEval_GetFrame",
+        "PyEval_GetFrameBuiltins",
+        "PyEval_GetFrameGlobals",
+        "PyEval_GetFrameLocals",
+        "PyEval_GetFuncDesc",
+        "PyEval_GetFuncName",
+        "PyEval_GetGlobals",
+        "PyEval_GetLocals",
+        "PyEval_InitThreads",
+        "PyEval_ReleaseLock",
+        "PyEval_ReleaseThread",
+        "PyEval_RestoreThread",
+        "PyEval_SaveThread",
+        "PyEval_ThreadsInitialized",
+        "PyExceptionClass_Name",
+        "PyException_GetArgs",
+        "PyException_GetCause",
+        "PyException_GetContext",
+        "PyException_GetTraceback",
+        "PyException_SetArgs",
+        "PyException_SetCause",
+        "PyException_SetContext",
+        "PyException_SetTraceback",
+        "PyFile_FromFd",
+        "PyFile_GetLine",
+        "PyFile_WriteObject",
+        "PyFile_WriteString",
+        "PyFloat_AsDouble",
+        "PyFloat_FromDouble",
+        "PyFloat_FromString",
+        "PyFloat_GetInfo",
+        "PyFloat_GetMax",
+        "PyFloat_GetMin",
+        "PyFrame_GetCode",
+        "PyFrame_GetLineNumber",
+        "PyFrozenSet_New",
+        "PyGC_Collect",
+        "PyGC_Disable",
+        "PyGC_Enable",
+        "PyGC_IsEnabled",
+        "PyGILState_Ensure",
+        "PyGILState_GetThisThreadState",
+        "PyGILState_Release",
+        "PyImport_AddModule",
+        "PyImport_AddModuleObject",
+        "PyImport_AddModuleRef",
+        "PyImport_AppendInittab",
+        "PyImport_ExecCodeModule",
+        "PyImport_ExecCodeModuleEx",
+        "PyImport_ExecCodeModuleObject",
+        "PyImport_ExecCodeModuleWithPathnames",
+        "PyImport_GetImporter",
+        "PyImport_GetMagicNumber",
+        "PyImport_GetMagicTag",
+        "PyImport_GetModule",
+        "PyImport_GetModuleDict",
+        "PyImport_Import",
+        "PyImport_ImportFrozenModule",
+        "PyImport_ImportFrozenModuleObject",
+        "PyImport_ImportModule",
+        "PyImport_ImportModuleLevel",
+        "PyImport_ImportModuleLevelObject",
+        "PyImport_ImportModuleNoBlock",
+        "PyImport_ReloadModule",
+        "PyIndex_Check",
+        "PyInterpreterState_Clear",
+        "PyInterpreterState_Delete",
+        "PyInterpreterState_Get",
+        "PyInterpreterState_GetDict",
+        "PyInterpreterState_GetID",
+        "PyInterpreterState_New",
+        "PyIter_Check",
+        "PyIter_Next",
+        "PyIter_NextItem",
+        "PyIter_Send",
+        "PyList_Append",
+        "PyList_AsTuple",
+        "PyList_GetItem",
+        "PyList_GetItemRef",
+        "PyList_GetSlice",
+        "PyList_Insert",
+        "PyList_New",
+        "PyList_Reverse",
+        "PyList_SetItem",
+        "PyList_SetSlice",
+        "PyList_Size",
+        "PyList_Sort",
+        "PyLongWriter_Create",
+        "PyLongWriter_Discard",
+        "PyLongWriter_Finish",
+        "PyLong_AsDouble",
+        "PyLong_AsInt",
+        "PyLong_AsInt32",
+        "PyLong_AsInt64",
+        "PyLong_AsLong",
+        "PyLong_AsLongAndOverflow",
+        "PyLong_AsLongLong",
+        "PyLong_AsLongLongAndOverflow",
+        "PyLong_AsNativeBytes",
+        "PyLong_AsSize_t",
+        "PyLong_AsSsize_t",
+        "PyLong_AsUInt32",
+        "PyLong_AsUInt64",
+        "PyLong_AsUnsignedLong",
+        "PyLong_AsUnsignedLongLong",
+        "PyLong_AsUnsignedLongLongMask",
+        "PyLong_AsUnsignedLongMask",
+        "PyLong_AsVoidPtr",
+        "PyLong_Export",
+        "PyLong_FreeExport",
+        "PyLong_FromDouble",
+        "PyLong_FromInt32",
+        "PyLong_FromInt64",
+        "PyLong_FromLong",
+        "PyLong_FromLongLong",
+        "PyLong_FromNativeBytes",
+        "PyLong_FromSize_t",
+        "PyLong_FromSsize_t",
+        "PyLong_FromString",
+        "PyLong_FromUInt32",
+        "PyLong_FromUInt64",
+        "PyLong_FromUnsignedLong",
+        "PyLong_FromUnsignedLongLong",
+        "PyLong_FromUnsignedNativeBytes",
+        "PyLong_FromVoidPtr",
+        "PyLong_GetInfo",
+        "PyLong_GetNativeLayout",
+        "PyMapping_Check",
+        "PyMapping_GetItemString",
+        "PyMapping_GetOptionalItem",
+        "PyMapping_GetOptionalItemString",
+        "PyMapping_HasKey",
+        "PyMapping_HasKeyString",
+        "PyMapping_HasKeyStringWithError",
+        "PyMapping_HasKeyWithError",
+        "PyMapping_Items",
+        "PyMapping_Keys",
+        "PyMapping_Length",
+        "PyMapping_SetItemString",
+        "PyMapping_Size",
+        "PyMapping_Values",
+        "PyMarshal_ReadObjectFromString",
+        "PyMarshal_WriteObjectToString",
+        "PyMem_Calloc",
+        "PyMem_Free",
+        "PyMem_Malloc",
+        "PyMem_RawCalloc",
+        "PyMem_RawFree",
+        "PyMem_RawMalloc",
+        "PyMem_RawRealloc",
+        "PyMem_Realloc",
+        "PyMember_GetOne",
+        "PyMember_SetOne",
+        "PyMemoryView_FromBuffer",
+        "PyMemoryView_FromMemory",
+        "PyMemoryView_FromObject",
+        "PyMemoryView_GetContiguous",
+        "PyModuleDef_Init",
+        "PyModule_Add",
+        "PyModule_AddFunctions",
+        "PyModule_AddIntConstant",
+        "PyModule_AddObject",
+        "PyModule_AddObjectRef",
+        "PyModule_AddStringConstant",
+        "PyModule_AddType",
+        "PyModule_Create2",
+        "PyModule_Exec",
+        "PyModule_ExecDef",
+        "PyModule_FromDefAndSpec2",
+        "PyModule_FromSlotsAndSpec",
+        "PyModule_GetDef",
+        "PyModule_GetDict",
+        "PyModule_GetFilename",
+        "PyModule_GetFilenameObject",
+        "PyModule_GetName",
+        "PyModule_GetNameObject",
+        "PyModule_GetState",
+        "PyModule_GetStateSize",
+        "PyModule_GetState_DuringGC",
+        "PyModule_GetToken",
+        "PyModule_GetToken_DuringGC",
+        "PyModule_New",
+        "PyModule_NewObject",
+        "PyModule_SetDocString",
+        "PyNumber_Absolute",
+        "PyNumber_Add",
+        "PyNumber_And",
+        "PyNumber_AsSsize_t",
+        "PyNumber_Check",
+        "PyNumber_Divmod",
+        "PyNumber_Float",
+        "PyNumber_FloorDivide",
+        "PyNumber_InPlaceAdd",
+        "PyNumber_InPlaceAnd",
+        "PyNumber_InPlaceFloorDivide",
+        "PyNumber_InPlaceLshift",
+        "PyNumber_InPlaceMatrixMultiply",
+        "PyNumber_InPlaceMultiply",
+        "PyNumber_InPlaceOr",
+        "PyNumber_InPlacePower",
+        "PyNumber_InPlaceRemainder",
+        "PyNumber_InPlaceRshift",
+        "PyNumber_InPlaceSubtract",
+        "PyNumber_InPlaceTrueDivide",
+        "PyNumber_InPlaceXor",
+        "PyNumber_Index",
+        "PyNumber_Invert",
+        "PyNumber_Long",
+        "PyNumber_Lshift",
+        "PyNumber_MatrixMultiply",
+        "PyNumber_Multiply",
+        "PyNumber_Negative",
+        "PyNumber_Or",
+        "PyNumber_Positive",
+        "PyNumber_Power",
+        "PyNumber_Remainder",
+        "PyNumber_Rshift",
+        "PyNumber_Subtract",
+        "PyNumber_ToBase",
+        "PyNumber_TrueDivide",
+        "PyNumber_Xor",
+        "PyOS_AfterFork",
+        "PyOS_AfterFork_Child",
+        "PyOS_AfterFork_Parent",
+        "PyOS_BeforeFork",
+        "PyOS_CheckStack",
+        "PyOS_FSPath",
+        "PyOS_InterruptOccurred",
+        "PyOS_double_to_string",
+        "PyOS_getsig",
+        "PyOS_mystricmp",
+        "PyOS_mystrnicmp",
+        "PyOS_setsig",
+        "PyOS_snprintf",
+        "PyOS_string_to_double",
+        "PyOS_strtol",
+        "PyOS_strtoul",
+        "PyOS_vsnprintf",
+        "PyObject_ASCII",
+        "PyObject_AsCharBuffer",
+        "PyObject_AsFileDescriptor",
+        "PyObject_AsReadBuffer",
+        "PyObject_AsWriteBuffer",
+        "PyObject_Bytes",
+        "PyObject_Call",
+        "PyObject_CallFunction",
+        "PyObject_CallFunctionObjArgs",
+        "PyObject_CallMethod",
+        "PyObject_CallMethodObjArgs",
+        "PyObject_CallNoArgs",
+        "PyObject_CallObject",
+        "PyObject_Calloc",
+        "PyObject_CheckBuffer",
+        "PyObject_CheckReadBuffer",
+        "PyObject_ClearWeakRefs",
+        "PyObject_CopyData",
+        "PyObject_DelAttr",
+        "PyObject_DelAttrString",
+        "PyObject_DelItem",
+        "PyObject_DelItemString",
+        "PyObject_Dir",
+        "PyObject_Format",
+        "PyObject_Free",
+        "PyObject_GC_Del",
+        "PyObject_GC_IsFinalized",
+        "PyObject_GC_IsTracked",
+        "PyObject_GC_Track",
+        "PyObject_GC_UnTrack",
+        "PyObject_GenericGetAttr",
+        "PyObject_GenericGetDict",
+        "PyObject_GenericSetAttr",
+        "PyObject_GenericSetDict",
+        "PyObject_GetAIter",
+        "PyObject_GetAttr",
+        "PyObject_GetAttrString",
+        "PyObject_GetBuffer",
+        "PyObject_GetItem",
+        "PyObject_GetIter",
+        "PyObject_GetOptionalAttr",
+        "PyObject_GetOptionalAttrString",
+        "PyObject_GetTypeData",
+        "PyObject_GetTypeData_DuringGC",
+        "PyObject_HasAttr",
+        "PyObject_HasAttrString",
+        "PyObject_HasAttrStringWithError",
+        "PyObject_HasAttrWithError",
+        "PyObject_Hash",
+        "PyObject_HashNotImplemented",
+        "PyObject_Init",
+        "PyObject_InitVar",
+        "PyObject_IsInstance",
+        "PyObject_IsSubclass",
+        "PyObject_IsTrue",
+        "PyObject_Length",
+        "PyObject_Malloc",
+        "PyObject_Not",
+        "PyObject_Realloc",
+        "PyObject_Repr",
+        "PyObject_RichCompare",
+        "PyObject_RichCompareBool",
+        "PyObject_SelfIter",
+        "PyObject_SetAttr",
+        "PyObject_SetAttrString",
+        "PyObject_SetItem",
+        "PyObject_Size",
+        "PyObject_Str",
+        "PyObject_Type",
+        "PyObject_Vectorcall",
+        "PyObject_VectorcallMethod",
+        "PySeqIter_New",
+        "PySequence_Check",
+        "PySequence_Concat",
+        "PySequence_Contains",
+        "PySequence_Count",
+        "PySequence_DelItem",
+        "PySequence_DelSlice",
+        "PySequence_Fast",
+        "PySequence_GetItem",
+        "PySequence_GetSlice",
+        "PySequence_In",
+        "PySequence_InPlaceConcat",
+        "PySequence_InPlaceRepeat",
+        "PySequence_Index",
+        "PySequence_Length",
+        "PySequence_List",
+        "PySequence_Repeat",
+        "PySequence_SetItem",
+        "PySequence_SetSlice",
+        "PySequence_Size",
+        "PySequence_Tuple",
+        "PySet_Add",
+        "PySet_Clear",
+        "PySet_Contains",
+        "PySet_Discard",
+        "PySet_New",
+        "PySet_Pop",
+        "PySet_Size",
+        "PySlice_AdjustIndices",
+        "PySlice_GetIndices",
+        "PySlice_GetIndicesEx",
+        "PySlice_New",
+        "PySlice_Unpack",
+        "PyState_AddModule",
+        "PyState_FindModule",
+        "PyState_RemoveModule",
+        "PyStructSequence_GetItem",
+        "PyStructSequence_New",
+        "PyStructSequence_NewType",
+        "PyStructSequence_SetItem",
+        "PySys_AddWarnOption",
+        "PySys_AddWarnOptionUnicode",
+        "PySys_AddXOption",
+        "PySys_Audit",
+        "PySys_AuditTuple",
+        "PySys_FormatStderr",
+        "PySys_FormatStdout",
+        "PySys_GetAttr",
+        "PySys_GetAttrString",
+        "PySys_GetObject",
+        "PySys_GetOptionalAttr",
+        "PySys_GetOptionalAttrString",
+        "PySys_GetXOptions",
+        "PySys_HasWarnOptions",
+        "PySys_ResetWarnOptions",
+        "PySys_SetArgv",
+        "PySys_SetArgvEx",
+        "PySys_SetObject",
+        "PySys_SetPath",
+        "PySys_WriteStderr",
+        "PySys_WriteStdout",
+        "PyThreadState_Clear",
+        "PyThreadState_Delete",
+        "PyThreadState_DeleteCurrent",
+        "PyThreadState_Get",
+        "PyThreadState_GetDict",
+        "PyThreadState_GetFrame",
+        "PyThreadState_GetID",
+        "PyThreadState_GetInterpreter",
+        "PyThreadState_New",
+        "PyThreadState_SetAsyncExc",
+        "PyThreadState_Swap",
+        "PyThread_GetInfo",
+        "PyThread_ReInitTLS",
+        "PyThread_acquire_lock",
+        "PyThread_acquire_lock_timed",
+        "PyThread_allocate_lock",
+        "PyThread_create_key",
+        "PyThread_delete_key",
+        "PyThread_delete_key_value",
+        "PyThread_exit_thread",
+        "PyThread_free_lock",
+        "PyThread_get_key_value",
+        "PyThread_get_stacksize",
+        "PyThread_get_thread_ident",
+        "PyThread_get_thread_native_id",
+        "PyThread_init_thread",
+        "PyThread_release_lock",
+        "PyThread_set_key_value",
+        "PyThread_set_stacksize",
+        "PyThread_start_new_thread",
+        "PyThread_tss_alloc",
+        "PyThread_tss_create",
+        "PyThread_tss_delete",
+        "PyThread_tss_free",
+        "PyThread_tss_get",
+        "PyThread_tss_is_created",
+        "PyThread_tss_set",
+        "PyTraceBack_Here",
+        "PyTraceBack_Print",
+        "PyTuple_GetItem",
+        "PyTuple_GetSlice",
+        "PyTuple_New",
+        "PyTuple_Pack",
+        "PyTuple_SetItem",
+        "PyTuple_Size",
+        "PyType_ClearCache",
+        "PyType_Freeze",
+        "PyType_FromMetaclass",
+        "PyType_FromModuleAndSpec",
+        "PyType_FromSpec",
+        "PyType_FromSpecWithBases",
+        "PyType_GenericAlloc",
+        "PyType_GenericNew",
+        "PyType_GetBaseByToken",
+        "PyType_GetBaseByToken_DuringGC",
+        "PyType_GetFlags",
+        "PyType_GetFullyQualifiedName",
+        "PyType_GetModule",
+        "PyType_GetModuleByDef",
+        "PyType_GetModuleByToken",
+        "PyType_GetModuleByToken_DuringGC",
+        "PyType_GetModuleName",
+        "PyType_GetModuleState",
+        "PyType_GetModuleState_DuringGC",
+        "PyType_GetModule_DuringGC",
+        "PyType_GetName",
+        "PyType_GetQualName",
+        "PyType_GetSlot",
+        "PyType_GetTypeDataSize",
+        "PyType_IsSubtype",
+        "PyType_Modified",
+        "PyType_Ready",
+        "PyUnicodeDecodeError_Create",
+        "PyUnicodeDecodeError_GetEncoding",
+        "PyUnicodeDecodeError_GetEnd",
+        "PyUnicodeDecodeError_GetObject",
+        "PyUnicodeDecodeError_GetReason",
+        "PyUnicodeDecodeError_GetStart",
+        "PyUnicodeDecodeError_SetEnd",
+        "PyUnicodeDecodeError_SetReason",
+        "PyUnicodeDecodeError_SetStart",
+        "PyUnicodeEncodeError_GetEncoding",
+        "PyUnicodeEncodeError_GetEnd",
+        "PyUnicodeEncodeError_GetObject",
+        "PyUnicodeEncodeError_GetReason",
+        "PyUnicodeEncodeError_GetStart",
+        "PyUnicodeEncodeError_SetEnd",
+        "PyUnicodeEncodeError_SetReason",
+        "PyUnicodeEncodeError_SetStart",
+        "PyUnicodeTranslateError_GetEnd",
+        "PyUnicodeTranslateError_GetObject",
+        "PyUnicodeTranslateError_GetReason",
+        "PyUnicodeTranslateError_GetStart",
+        "PyUnicodeTranslateError_SetEnd",
+        "PyUnicodeTranslateError_SetReason",
+        "PyUnicodeTranslateError_SetStart",
+        "PyUnicode_Append",
+        "PyUnicode_AppendAndDel",
+        "PyUnicode_AsASCIIString",
+        "PyUnicode_AsCharmapString",
+        "PyUnicode_AsDecodedObject",
+        "PyUnicode_AsDecodedUnicode",
+        "PyUnicode_AsEncodedObject",
+        "PyUnicode_AsEncodedString",
+        "PyUnicode_AsEncodedUnicode",
+        "PyUnicode_AsLatin1String",
+        "PyUnicode_AsMBCSString",
+        "PyUnicode_AsRawUnicodeEscapeString",
+        "PyUnicode_AsUCS4",
+        "PyUnicode_AsUCS4Copy",
+        "PyUnicode_AsUTF16String",
+        "PyUnicode_AsUTF32String",
+        "PyUnicode_AsUTF8AndSize",
+        "PyUnicode_AsUTF8String",
+        "PyUnicode_AsUnicodeEscapeString",
+        "PyUnicode_AsWideChar",
+        "PyUnicode_AsWideCharString",
+        "PyUnicode_BuildEncodingMap",
+        "PyUnicode_Compare",
+        "PyUnicode_CompareWithASCIIString",
+        "PyUnicode_Concat",
+        "PyUnicode_Contains",
+        "PyUnicode_Count",
+        "PyUnicode_Decode",
+        "PyUnicode_DecodeASCII",
+        "PyUnicode_DecodeCharmap",
+        "PyUnicode_DecodeCodePageStateful",
+        "PyUnicode_DecodeFSDefault",
+        "PyUnicode_DecodeFSDefaultAndSize",
+        "PyUnicode_DecodeLatin1",
+        "PyUnicode_DecodeLocale",
+        "PyUnicode_DecodeLocaleAndSize",
+        "PyUnicode_DecodeMBCS",
+        "PyUnicode_DecodeMBCSStateful",
+        "PyUnicode_DecodeRawUnicodeEscape",
+        "PyUnicode_DecodeUTF16",
+        "PyUnicode_DecodeUTF16Stateful",
+        "PyUnicode_DecodeUTF32",
+        "PyUnicode_DecodeUTF32Stateful",
+        "PyUnicode_DecodeUTF7",
+        "PyUnicode_DecodeUTF7Stateful",
+        "PyUnicode_DecodeUTF8",
+        "PyUnicode_DecodeUTF8Stateful",
+        "PyUnicode_DecodeUnicodeEscape",
+        "PyUnicode_EncodeCodePage",
+        "PyUnicode_EncodeFSDefault",
+        "PyUnicode_EncodeLocale",
+        "PyUnicode_Equal",
+        "PyUnicode_EqualToUTF8",
+        "PyUnicode_EqualToUTF8AndSize",
+        "PyUnicode_FSConverter",
+        "PyUnicode_FSDecoder",
+        "PyUnicode_Find",
+        "PyUnicode_FindChar",
+        "PyUnicode_Format",
+        "PyUnicode_FromEncodedObject",
+        "PyUnicode_FromFormat",
+        "PyUnicode_FromFormatV",
+        "PyUnicode_FromObject",
+        "PyUnicode_FromOrdinal",
+        "PyUnicode_FromString",
+        "PyUnicode_FromStringAndSize",
+        "PyUnicode_FromWideChar",
+        "PyUnicode_GetDefaultEncoding",
+        "PyUnicode_GetLength",
+        "PyUnicode_GetSize",
+        "PyUnicode_InternFromString",
+        "PyUnicode_InternImmortal",
+        "PyUnicode_InternInPlace",
+        "PyUnicode_IsIdentifier",
+        "PyUnicode_Join",
+        "PyUnicode_Partition",
+        "PyUnicode_RPartition",
+        "PyUnicode_RSplit",
+        "PyUnicode_ReadChar",
+        "PyUnicode_Replace",
+        "PyUnicode_Resize",
+        "PyUnicode_RichCompare",
+        "PyUnicode_Split",
+        "PyUnicode_Splitlines",
+        "PyUnicode_Substring",
+        "PyUnicode_Tailmatch",
+        "PyUnicode_Translate",
+        "PyUnicode_WriteChar",
+        "PyVectorcall_Call",
+        "PyVectorcall_NARGS",
+        "PyWeakref_GetObject",
+        "PyWeakref_GetRef",
+        "PyWeakref_NewProxy",
+        "PyWeakref_NewRef",
+        "PyWrapper_New",
+        "Py_AddPendingCall",
+        "Py_AtExit",
+        "Py_BuildValue",
+        "Py_BytesMain",
+        "Py_CompileString",
+        "Py_DecRef",
+        "Py_DecodeLocale",
+        "Py_EncodeLocale",
+        "Py_EndInterpreter",
+        "Py_EnterRecursiveCall",
+        "Py_Exit",
+        "Py_FatalError",
+        "Py_Finalize",
+        "Py_FinalizeEx",
+        "Py_GenericAlias",
+        "Py_GetArgcArgv",
+        "Py_GetBuildInfo",
+        "Py_GetCompiler",
+        "Py_GetConstant",
+        "Py_GetConstantBorrowed",
+        "Py_GetCopyright",
+        "Py_GetExecPrefix",
+        "Py_GetPath",
+        "Py_GetPlatform",
+        "Py_GetPrefix",
+        "Py_GetProgramFullPath",
+        "Py_GetProgramName",
+        "Py_GetPythonHome",
+        "Py_GetRecursionLimit",
+        "Py_GetVersion",
+        "Py_IS_TYPE",
+        "Py_IncRef",
+        "Py_Initialize",
+        "Py_InitializeEx",
+        "Py_Is",
+        "Py_IsFalse",
+        "Py_IsFinalizing",
+        "Py_IsInitialized",
+        "Py_IsNone",
+        "Py_IsTrue",
+        "Py_LeaveRecursiveCall",
+        "Py_Main",
+        "Py_MakePendingCalls",
+        "Py_NewInterpreter",
+        "Py_NewRef",
+        "Py_PACK_FULL_VERSION",
+        "Py_PACK_VERSION",
+        "Py_REFCNT",
+        "Py_ReprEnter",
+        "Py_ReprLeave",
+        "Py_SET_SIZE",
+        "Py_SIZE",
+        "Py_SetPath",
+        "Py_SetProgramName",
+        "Py_SetPythonHome",
+        "Py_SetRecursionLimit",
+        "Py_TYPE",
+        "Py_VaBuildValue",
+        "Py_XNewRef",
+        "_PyArg_ParseTupleAndKeywords_SizeT",
+        "_PyArg_ParseTuple_SizeT",
+        "_PyArg_Parse_SizeT",
+        "_PyArg_VaParseTupleAndKeywords_SizeT",
+        "_PyArg_VaParse_SizeT",
+        "_PyErr_BadInternalCall",
+        "_PyObject_CallFunction_SizeT",
+        "_PyObject_CallMethod_SizeT",
+        "_PyObject_GC_New",
+        "_PyObject_GC_NewVar",
+        "_PyObject_GC_Resize",
+        "_PyObject_New",
+        "_PyObject_NewVar",
+        "_PyState_AddModule",
+        "_PyThreadState_Init",
+        "_PyThreadState_Prealloc",
+        "_Py_BuildValue_SizeT",
+        "_Py_CheckRecursiveCall",
+        "_Py_Dealloc",
+        "_Py_DecRef",
+        "_Py_IncRef",
+        "_Py_NegativeRefcount",
+        "_Py_SetRefcnt",
+        "_Py_VaBuildValue_SizeT",
+    ]
+)
+"""
+Names of function members of the limited API and stable ABI.
+"""
+
+DATAS: frozenset[str] = frozenset(
+    [
+        "PyBaseObject_Type",
+        "PyBool_Type",
+        "PyByteArrayIter_Type",
+        "PyByteArray_Type",
+        "PyBytesIter_Type",
+        "PyBytes_Type",
+        "PyCFunction_Type",
+        "PyCallIter_Type",
+        "PyCapsule_Type",
+        "PyClassMethodDescr_Type",
+        "PyComplex_Type",
+        "PyDictItems_Type",
+        "PyDictIterItem_Type",
+        "PyDictIterKey_Type",
+        "PyDictIterValue_Type",
+        "PyDictKeys_Type",
+        "PyDictProxy_Type",
+        "PyDictRevIterItem_Type",
+        "PyDictRevIterKey_Type",
+        "PyDictRevIterValue_Type",
+        "PyDictValues_Type",
+        "PyDict_Type",
+        "PyEllipsis_Type",
+        "PyEnum_Type",
+        "PyExc_ArithmeticError",
+        "PyExc_AssertionError",
+        "PyExc_AttributeError",
+        "PyExc_BaseException",
+        "PyExc_BaseExceptionGroup",
+        "PyExc_BlockingIOError",
+        "PyExc_BrokenPipeError",
+        "PyExc_BufferError",
+        "PyExc_BytesWarning",
+        "PyExc_ChildProcessError",
+        "PyExc_ConnectionAbortedError",
+        "PyExc_ConnectionError",
+        "PyExc_ConnectionRefusedError",
+        "PyExc_ConnectionResetError",
+        "PyExc_DeprecationWarning",
+        "PyExc_EOFError",
+        "PyExc_EncodingWarning",
+        "PyExc_EnvironmentError",
+        "PyExc_Exception",
+        "PyExc_FileExistsError",
+        "PyExc_FileNotFoundError",
+        "PyExc_FloatingPointError",
+        "PyExc_FutureWarning",
+        "PyExc_GeneratorExit",
+        "PyExc_IOError",
+        "PyExc_ImportError",
+        "PyExc_ImportWarning",
+        "PyExc_IndentationError",
+        "PyExc_IndexError",
+        "PyExc_InterruptedError",
+        "PyExc_IsADirectoryError",
+        "PyExc_KeyError",
+        "PyExc_KeyboardInterrupt",
+        "PyExc_LookupError",
+        "PyExc_MemoryError",
+        "PyExc_ModuleNotFoundError",
+        "PyExc_NameError",
+        "PyExc_NotADirectoryError",
+        "PyExc_NotImplementedError",
+        "PyExc_OSError",
+        "PyExc_OverflowError",
+        "PyExc_PendingDeprecationWarning",
+        "PyExc_PermissionError",
+        "PyExc_ProcessLookupError",
+        "PyExc_RecursionError",
+        "PyExc_ReferenceError",
+        "PyExc_ResourceWarning",
+        "PyExc_RuntimeError",
+        "PyExc_RuntimeWarning",
+        "PyExc_StopAsyncIteration",
+        "PyExc_StopIteration",
+        "PyExc_SyntaxError",
+        "PyExc_SyntaxWarning",
+        "PyExc_SystemError",
+        "PyExc_SystemExit",
+        "PyExc_TabError",
+        "PyExc_TimeoutError",
+        "PyExc_TypeError",
+        "PyExc_UnboundLocalError",
+        "PyExc_UnicodeDecodeError",
+        "PyExc_UnicodeEncodeError",
+        "PyExc_UnicodeError",
+        "PyExc_UnicodeTranslateError",
+        "PyExc_UnicodeWarning",
+        "PyExc_UserWarning",
+        "PyExc_ValueError",
+        "PyExc_Warning",
+        "PyExc_WindowsError",
+        "PyExc_ZeroDivisionError",
+        "PyFilter_Type",
+        "PyFloat_Type",
+        "PyFrozenSet_Type",
+        "PyGetSetDescr_Type",
+        "PyListIter_Type",
+        "PyListRevIter_Type",
+        "PyList_Type",
+        "PyLongRangeIter_Type",
+        "PyLong_Type",
+        "PyMap_Type",
+        "PyMemberDescr_Type",
+        "PyMemoryView_Type",
+        "PyMethodDescr_Type",
+        "PyModuleDef_Type",
+        "PyModule_Type",
+        "PyOS_InputHook",
+        "PyProperty_Type",
+        "PyRangeIter_Type",
+        "PyRange_Type",
+        "PyReversed_Type",
+        "PySeqIter_Type",
+        "PySetIter_Type",
+        "PySet_Type",
+        "PySlice_Type",
+        "PyStructSequence_UnnamedField",
+        "PySuper_Type",
+        "PyTraceBack_Type",
+        "PyTupleIter_Type",
+        "PyTuple_Type",
+        "PyType_Type",
+        "PyUnicodeIter_Type",
+        "PyUnicode_Type",
+        "PyWrapperDescr_Type",
+        "PyZip_Type",
+        "Py_FileSystemDefaultEncodeErrors",
+        "Py_FileSystemDefaultEncoding",
+        "Py_GenericAliasType",
+        "Py_HasFileSystemDefaultEncoding",
+        "Py_UTF8Mode",
+        "Py_Version",
+        "_PyWeakref_CallableProxyType",
+        "_PyWeakref_ProxyType",
+        "_PyWeakref_RefType",
+        "_Py_EllipsisObject",
+        "_Py_FalseStruct",
+        "_Py_NoneStruct",
+        "_Py_NotImplementedStruct",
+        "_Py_RefTotal",
+        "_Py_SwappedOp",
+        "_Py_TrueStruct",
+    ]
+)
+"""
+Names of data object members of the limited API and stable ABI.
+"""
+
+ABI_ONLY: frozenset[str] = frozenset(
+    [
+        "PyCFunction_Call",
+        "PyEval_AcquireLock",
+        "PyEval_CallFunction",
+        "PyEval_CallMethod",
+        "PyEval_CallObjectWithKeywords",
+        "PyEval_ReleaseLock",
+        "PyEval_ThreadsInitialized",
+        "PyImport_ImportModuleNoBlock",
+        "PyMarshal_ReadObjectFromString",
+        "PyMarshal_WriteObjectToString",
+        "PyObject_AsCharBuffer",
+        "PyObject_AsReadBuffer",
+        "PyObject_AsWriteBuffer",
+        "PyObject_CheckReadBuffer",
+        "PySys_AddWarnOption",
+        "PySys_AddWarnOptionUnicode",
+        "PySys_AddXOption",
+        "PySys_HasWarnOptions",
+        "PySys_ResetWarnOptions",
+        "PySys_SetPath",
+        "PyThreadState_DeleteCurrent",
+        "PyUnicode_AsDecodedObject",
+        "PyUnicode_AsDecodedUnicode",
+        "PyUnicode_AsEncodedObject",
+        "PyUnicode_AsEncodedUnicode",
+        "PyUnicode_GetSize",
+        "PyUnicode_InternImmortal",
+        "PyWeakref_GetObject",
+        "Py_GetArgcArgv",
+        "Py_GetExecPrefix",
+        "Py_GetPath",
+        "Py_GetPrefix",
+        "Py_GetProgramFullPath",
+        "Py_GetProgramName",
+        "Py_GetPythonHome",
+        "Py_SetPath",
+        "_PyArg_ParseTupleAndKeywords_SizeT",
+        "_PyArg_ParseTuple_SizeT",
+        "_PyArg_Parse_SizeT",
+        "_PyArg_VaParseTupleAndKeywords_SizeT",
+        "_PyArg_VaParse_SizeT",
+        "_PyErr_BadInternalCall",
+        "_PyObject_CallFunction_SizeT",
+        "_PyObject_CallMethod_SizeT",
+        "_PyObject_GC_New",
+        "_PyObject_GC_NewVar",
+        "_PyObject_GC_Resize",
+        "_PyObject_New",
+        "_PyObject_NewVar",
+        "_PyState_AddModule",
+        "_PyThreadState_Init",
+        "_PyThreadState_Prealloc",
+        "_PyWeakref_CallableProxyType",
+        "_PyWeakref_ProxyType",
+        "_PyWeakref_RefType",
+        "_Py_BuildValue_SizeT",
+        "_Py_CheckRecursiveCall",
+        "_Py_Dealloc",
+        "_Py_DecRef",
+        "_Py_EllipsisObject",
+        "_Py_FalseStruct",
+        "_Py_IncRef",
+        "_Py_NegativeRefcount",
+        "_Py_NoneStruct",
+        "_Py_NotImplementedStruct",
+        "_Py_RefTotal",
+        "_Py_SetRefcnt",
+        "_Py_SwappedOp",
+        "_Py_TrueStruct",
+        "_Py_VaBuildValue_SizeT",
+    ]
+)
+"""
+Names of functions and data objects that are only part of the stable ABI.
+"""
+
+FEATURE_MACROS: frozenset[str] = frozenset(
+    [
+        "HAVE_FORK",
+        "MS_WINDOWS",
+        "PY_HAVE_THREAD_NATIVE_ID",
+        "Py_REF_DEBUG",
+        "Py_TRACE_REFS",
+        "USE_STACKCHECK",
+    ]
+)
+"""
+Names of feature macros that control the availability of limited API members.
+"""
+
+MACROS: frozenset[str] = frozenset(
+    [
+        "METH_CLASS",
+        "METH_COEXIST",
+        "METH_FASTCALL",
+        "METH_METHOD",
+        "METH_NOARGS",
+        "METH_O",
+        "METH_STATIC",
+        "METH_VARARGS",
+        "PY_VECTORCALL_ARGUMENTS_OFFSET",
+        "PyABIInfo_DEFAULT_ABI_VERSION",
+        "PyABIInfo_DEFAULT_FLAGS",
+        "PyABIInfo_FREETHREADED",
+        "PyABIInfo_FREETHREADING_AGNOSTIC",
+        "PyABIInfo_GIL",
+        "PyABIInfo_STABLE",
+        "PyABIInfo_VAR",
+        "PyBUF_ANY_CONTIGUOUS",
+        "PyBUF_CONTIG",
+        "PyBUF_CONTIG_RO",
+        "PyBUF_C_CONTIGUOUS",
+        "PyBUF_FORMAT",
+        "PyBUF_FULL",
+        "PyBUF_FULL_RO",
+        "PyBUF_F_CONTIGUOUS",
+        "PyBUF_INDIRECT",
+        "PyBUF_MAX_NDIM",
+        "PyBUF_ND",
+        "PyBUF_READ",
+        "PyBUF_RECORDS",
+        "PyBUF_RECORDS_RO",
+        "PyBUF_SIMPLE",
+        "PyBUF_STRIDED",
+        "PyBUF_STRIDED_RO",
+        "PyBUF_STRIDES",
+        "PyBUF_WRITABLE",
+        "PyBUF_WRITE",
+        "PyMODEXPORT_FUNC",
+        "Py_ASNATIVEBYTES_ALLOW_INDEX",
+        "Py_ASNATIVEBYTES_BIG_ENDIAN",
+        "Py_ASNATIVEBYTES_DEFAULTS",
+        "Py_ASNATIVEBYTES_LITTLE_ENDIAN",
+        "Py_ASNATIVEBYTES_NATIVE_ENDIAN",
+        "Py_ASNATIVEBYTES_REJECT_NEGATIVE",
+        "Py_ASNATIVEBYTES_UNSIGNED_BUFFER",
+        "Py_AUDIT_READ",
+        "Py_BEGIN_ALLOW_THREADS",
+        "Py_BLOCK_THREADS",
+        "Py_END_ALLOW_THREADS",
+        "Py_READONLY",
+        "Py_RELATIVE_OFFSET",
+        "Py_TPFLAGS_BASETYPE",
+        "Py_TPFLAGS_DEFAULT",
+        "Py_TPFLAGS_HAVE_GC",
+        "Py_TPFLAGS_HAVE_VECTORCALL",
+        "Py_TPFLAGS_ITEMS_AT_END",
+        "Py_TPFLAGS_METHOD_DESCRIPTOR",
+        "Py_TP_USE_SPEC",
+        "Py_T_BOOL",
+        "Py_T_BYTE",
+        "Py_T_CHAR",
+        "Py_T_DOUBLE",
+        "Py_T_FLOAT",
+        "Py_T_INT",
+        "Py_T_LONG",
+        "Py_T_LONGLONG",
+        "Py_T_OBJECT_EX",
+        "Py_T_PYSSIZET",
+        "Py_T_SHORT",
+        "Py_T_STRING",
+        "Py_T_STRING_INPLACE",
+        "Py_T_UBYTE",
+        "Py_T_UINT",
+        "Py_T_ULONG",
+        "Py_T_ULONGLONG",
+        "Py_T_USHORT",
+        "Py_UNBLOCK_THREADS",
+        "Py_am_aiter",
+        "Py_am_anext",
+        "Py_am_await",
+        "Py_am_send",
+        "Py_bf_getbuffer",
+        "Py_bf_releasebuffer",
+        "Py_mod_abi",
+        "Py_mod_create",
+        "Py_mod_doc",
+        "Py_mod_exec",
+        "Py_mod_gil",
+        "Py_mod_methods",
+        "Py_mod_multiple_interpreters",
+        "Py_mod_name",
+        "Py_mod_state_clear",
+        "Py_mod_state_free",
+        "Py_mod_state_size",
+        "Py_mod_state_traverse",
+        "Py_mod_token",
+        "Py_mp_ass_subscript",
+        "Py_mp_length",
+        "Py_mp_subscript",
+        "Py_nb_absolute",
+        "Py_nb_add",
+        "Py_nb_and",
+        "Py_nb_bool",
+        "Py_nb_divmod",
+        "Py_nb_float",
+        "Py_nb_floor_divide",
+        "Py_nb_index",
+        "Py_nb_inplace_add",
+        "Py_nb_inplace_and",
+        "Py_nb_inplace_floor_divide",
+        "Py_nb_inplace_lshift",
+        "Py_nb_inplace_matrix_multiply",
+        "Py_nb_inplace_multiply",
+        "Py_nb_inplace_or",
+        "Py_nb_inplace_power",
+        "Py_nb_inplace_remainder",
+        "Py_nb_inplace_rshift",
+        "Py_nb_inplace_subtract",
+        "Py_nb_inplace_true_divide",
+        "Py_nb_inplace_xor",
+        "Py_nb_int",
+        "Py_nb_invert",
+        "Py_nb_lshift",
+        "Py_nb_matrix_multiply",
+        "Py_nb_multiply",
+        "Py_nb_negative",
+        "Py_nb_or",
+        "Py_nb_positive",
+        "Py_nb_power",
+        "Py_nb_remainder",
+        "Py_nb_rshift",
+        "Py_nb_subtract",
+        "Py_nb_true_divide",
+        "Py_nb_xor",
+        "Py_sq_ass_item",
+        "Py_sq_concat",
+        "Py_sq_contains",
+        "Py_sq_inplace_concat",
+        "Py_sq_inplace_repeat",
+        "Py_sq_item",
+        "Py_sq_length",
+        "Py_sq_repeat",
+        "Py_tp_alloc",
+        "Py_tp_base",
+        "Py_tp_bases",
+        "Py_tp_call",
+        "Py_tp_clear",
+        "Py_tp_dealloc",
+        "Py_tp_del",
+        "Py_tp_descr_get",
+        "Py_tp_descr_set",
+        "Py_tp_doc",
+        "Py_tp_finalize",
+        "Py_tp_free",
+        "Py_tp_getattr",
+        "Py_tp_getattro",
+        "Py_tp_getset",
+        "Py_tp_hash",
+        "Py_tp_init",
+        "Py_tp_is_gc",
+        "Py_tp_iter",
+        "Py_tp_iternext",
+        "Py_tp_members",
+        "Py_tp_methods",
+        "Py_tp_new",
+        "Py_tp_repr",
+        "Py_tp_richcompare",
+        "Py_tp_setattr",
+        "Py_tp_setattro",
+        "Py_tp_str",
+        "Py_tp_token",
+        "Py_tp_traverse",
+        "Py_tp_vectorcall",
+    ]
+)
+"""
+Names of macro members of the limited API.
+"""
+
+STRUCTS: frozenset[str] = frozenset(
+    [
+        "PyABIInfo",
+        "PyFrameObject",
+        "PyGetSetDef",
+        "PyInterpreterState",
+        "PyLongExport",
+        "PyLongLayout",
+        "PyLongObject",
+        "PyLongWriter",
+        "PyMemberDef",
+        "PyMethodDef",
+        "PyModuleDef",
+        "PyModuleDef_Base",
+        "PyModuleDef_Slot",
+        "PyObject",
+        "PyStructSequence_Desc",
+        "PyStructSequence_Field",
+        "PyThreadState",
+        "PyTypeObject",
+        "PyType_Slot",
+        "PyType_Spec",
+        "PyVarObject",
+        "PyWeakReference",
+        "Py_buffer",
+        "symtable",
+    ]
+)
+"""
+Names of struct members of the limited API.
+"""
+
+TYPEDEFS: frozenset[str] = frozenset(
+    [
+        "PyCFunction",
+        "PyCFunctionFast",
+        "PyCFunctionFastWithKeywords",
+        "PyCFunctionWithKeywords",
+        "PyCapsule_Destructor",
+        "PyGILState_STATE",
+        "PyOS_sighandler_t",
+        "Py_UCS4",
+        "Py_intptr_t",
+        "Py_ssize_t",
+        "Py_uintptr_t",
+        "allocfunc",
+        "binaryfunc",
+        "descrgetfunc",
+        "descrsetfunc",
+        "destructor",
+        "getattrfunc",
+        "getattrofunc",
+        "getbufferproc",
+        "getiterfunc",
+        "getter",
+        "hashfunc",
+        "initproc",
+        "inquiry",
+        "iternextfunc",
+        "lenfunc",
+        "newfunc",
+        "objobjargproc",
+        "objobjproc",
+        "releasebufferproc",
+        "reprfunc",
+        "richcmpfunc",
+        "setattrfunc",
+        "setattrofunc",
+        "setter",
+        "ssizeargfunc",
+        "ssizeobjargproc",
+        "ssizessizeargfunc",
+        "ssizessizeobjargproc",
+        "ternaryfunc",
+        "traverseproc",
+        "unaryfunc",
+        "vectorcallfunc",
+        "visitproc",
+    ]
+)
+"""
+Names of typedef members of the limited API.
+"""
@@ -0,0 +1,51 @@
+"""
+Searches over the names of the members of the limited API and stable ABI.
+
+Searches cover `abi3info.FUNCTIONS`, `abi3info.DATAS`, `abi3info.MACROS`,
+`abi3info.TYPEDEFS` and `abi3info.STRUCTS`, and are answered from an index of
+their names, sorted once (the first time it's searched), rather than by scanning
+the tables: each search only visits the names that share its literal prefix.
+
+Results are lazy iterators, in name order, over the matching members' models,
+which are only built as they're reached:
+
+```python
+from abi3info.models import Function
+from abi3info.search import glob, prefix
+
+unicode_functions = [f for f in prefix("PyUnicode_") if isinstance(f, Function)]
+print([f.symbol.name for f in unicode_functions])
+print(list(glob("PyType_*Slot*")))
+```
+
+Members with the same name in more than one table (e.g. a struct and a typedef)
+are each included, in the order of the tables above.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+from abi3info import _snapshot
+from abi3info.models import Data, Function, Macro, Struct, Typedef
+
+
+def prefix(prefix: str) -> Iterator[Function | Data | Macro | Typedef | Struct]:
+    """
+    Returns an iterator over the members whose names start with `prefix`.
+
+    For functions and data objects, the name is the symbol's (i.e. `Symbol.name`).
+    """
+    return _snapshot.name_index().prefix(prefix)
+
+
+def glob(pattern: str) -> Iterator[Function | Data | Macro | Typedef | Struct]:
+    """
+    Returns an iterator over the members whose names match the shell-style
+    `pattern`, e.g. `PyType_*Slot*`.
+
+    Matching is case-sensitive, as with `fnmatch.fnmatchcase`. Searches are
+    fastest when `pattern` starts with a literal prefix (e.g. `PyType_`) rather
+    than a wildcard, since only the names sharing that prefix are matched.
+    """
+    return _snapshot.name_index().glob(pattern)
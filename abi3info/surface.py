@@ -0,0 +1,281 @@
+"""
+Queries over the limited API and stable ABI by version.
+
+Each query is answered from a per-table index, sorted by the version that each
+member was added in, rather than by scanning the tables: a query returning `k`
+members takes `O(log n + k)` time. The indexes are built lazily, the first time
+they're queried.
+
+```python
+from abi3info.models import PyVersion
+from abi3info.surface import added_between, surface_at
+
+# Everything available in the limited API and stable ABI as of 3.9.
+surface = surface_at(PyVersion(3, 9))
+print(len(surface.functions), len(surface.datas))
+
+# Everything new in 3.10 and 3.11.
+print(added_between(PyVersion(3, 9), PyVersion(3, 11)).functions)
+```
+
+`required_version` goes the other way, from the symbols that an extension uses
+to the oldest version that provides all of them:
+
+```python
+from abi3info.surface import required_version
+
+required = required_version(["Py_Initialize", b"PyType_FromSpec", "not_a_symbol"])
+print(required.version, required.floor, required.non_abi)
+```
+
+For set algebra over many sets of symbols (e.g. the symbols used by thousands
+of wheels), each function and data object in the stable ABI also has a dense
+integer ID (see `symbol_id`), and any set of them can be represented as a bitmask:
+an `int` with bit `n` set for symbol ID `n`. Unions, intersections, differences
+and counts are then single integer operations:
+
+```python
+from abi3info.models import PyVersion
+from abi3info.surface import mask_at, to_mask, to_names
+
+used = to_mask(["Py_Initialize", "PyType_GetModuleByDef"])
+print(to_names(used & ~mask_at(PyVersion(3, 9))), used.bit_count())
+```
+"""
+
+from __future__ import annotations
+
+import bisect
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from abi3info import _snapshot
+from abi3info._table import _symbol_name
+from abi3info.models import Data, Function, Macro, PyVersion, Struct, Symbol, Typedef
+
+
+@dataclass(frozen=True, slots=True)
+class Surface:
+    """
+    The members of each table in `abi3info` that match a version query.
+
+    Each table's members are ordered by the version that they were added in,
+    and then in table order.
+    """
+
+    functions: tuple[Function, ...]
+    """
+    The matching members of `abi3info.FUNCTIONS`.
+    """
+
+    datas: tuple[Data, ...]
+    """
+    The matching members of `abi3info.DATAS`.
+    """
+
+    macros: tuple[Macro, ...]
+    """
+    The matching members of `abi3info.MACROS`.
+    """
+
+    typedefs: tuple[Typedef, ...]
+    """
+    The matching members of `abi3info.TYPEDEFS`.
+    """
+
+    structs: tuple[Struct, ...]
+    """
+    The matching members of `abi3info.STRUCTS`.
+    """
+
+
+@dataclass(frozen=True, slots=True)
+class RequiredVersion:
+    """
+    The result of `required_version`.
+    """
+
+    version: PyVersion | None
+    """
+    The oldest version of the stable ABI that provides every ABI symbol given,
+    i.e. the newest version that any of them was added in, or `None` if none of
+    the symbols given are in the stable ABI.
+    """
+
+    floor: tuple[str, ...]
+    """
+    The names of the symbols that were added in `version`, i.e. the ones that
+    require it, in the order that they were first given.
+    """
+
+    non_abi: tuple[str, ...]
+    """
+    The names of the symbols that aren't in the stable ABI, in the order that
+    they were first given.
+    """
+
+
+def surface_at(version: PyVersion) -> Surface:
+    """
+    Returns every member of the limited API and stable ABI that was added in or
+    before `version`, i.e. everything available when targeting `version`.
+    """
+    return Surface(
+        *(_snapshot.version_index(loader).at(version) for loader in _snapshot._VERSIONED_LOADERS)
+    )
+
+
+def added_between(start: PyVersion, end: PyVersion) -> Surface:
+    """
+    Returns every member of the limited API and stable ABI that was added after
+    `start`, up to and including `end`.
+
+    For example, `added_between(PyVersion(3, 9), PyVersion(3, 11))` returns the
+    members added in 3.10 and 3.11. If `end` isn't after `start`, nothing matches.
+    """
+    return Surface(
+        *(
+            _snapshot.version_index(loader).between(start, end)
+            for loader in _snapshot._VERSIONED_LOADERS
+        )
+    )
+
+
+def required_version(symbols: Iterable[str | bytes | Symbol]) -> RequiredVersion:
+    """
+    Computes the oldest version of the stable ABI that provides all of `symbols`,
+    in a single pass.
+
+    Each symbol is either a bare symbol name (i.e. `Symbol.name`, rather than a
+    platform-mangled name), as `str` or as `bytes` (e.g. as read from a binary's
+    symbol table, which are decoded as UTF-8), or a `Symbol`. Symbols that are
+    in neither `abi3info.FUNCTIONS` nor `abi3info.DATAS` are reported in
+    `RequiredVersion.non_abi`, rather than raising.
+
+    This is equivalent to looking up each symbol in those tables and taking the
+    newest `added`, but compares precomputed integer versions (see
+    `PyVersion.to_hex`) and doesn't build any `Function`s or `Data`s.
+    """
+    versions = _snapshot.symbol_versions()
+    code = -1
+    floor: dict[str, None] = {}
+    non_abi: dict[str, None] = {}
+    for symbol in symbols:
+        name = _symbol_name(symbol)
+        added = versions.get(name)
+        if added is None:
+            non_abi[name] = None
+        elif added > code:
+            code = added
+            floor = {name: None}
+        elif added == code:
+            floor[name] = None
+
+    return RequiredVersion(
+        version=PyVersion.from_hex(code) if floor else None,
+        floor=tuple(floor),
+        non_abi=tuple(non_abi),
+    )
+
+
+def symbol_id(symbol: str | bytes | Symbol) -> int | None:
+    """
+    Returns the symbol ID of `symbol` (given as for `required_version`), or `None`
+    if it isn't in the stable ABI.
+
+    Symbol IDs are dense: the functions in `abi3info.FUNCTIONS` are numbered from
+    zero in table order, followed by the data objects in `abi3info.DATAS`. They're
+    stable for a given version of abi3info, but not across versions.
+    """
+    return _snapshot.symbol_ids().get(_symbol_name(symbol))
+
+
+def symbol_count() -> int:
+    """
+    Returns the number of symbol IDs, i.e. one more than the highest symbol ID.
+    """
+    return len(_snapshot.symbol_names())
+
+
+def _check_mask(mask: int) -> None:
+    """
+    Raises `ValueError` if `mask` has bits set for anything but symbol IDs.
+    """
+    if mask < 0 or mask.bit_length() > symbol_count():
+        raise ValueError(f"invalid symbol mask: {mask:#x}")
+
+
+def to_mask(symbols: Iterable[str | bytes | Symbol]) -> int:
+    """
+    Returns the bitmask of `symbols` (given as for `required_version`).
+
+    Symbols that aren't in the stable ABI have no symbol ID, and are ignored;
+    use `required_version` to find them.
+    """
+    ids = _snapshot.symbol_ids()
+    mask = 0
+    for symbol in symbols:
+        idx = ids.get(_symbol_name(symbol))
+        if idx is not None:
+            mask |= 1 << idx
+    return mask
+
+
+def to_names(mask: int) -> tuple[str, ...]:
+    """
+    Returns the names of the symbols in the bitmask `mask`, in symbol ID order.
+
+    Raises `ValueError` if `mask` isn't a valid bitmask.
+    """
+    _check_mask(mask)
+    names = _snapshot.symbol_names()
+    # NOTE: `bin` is by far the cheapest way to visit every set bit of an `int`.
+    # Reversed, it starts at bit 0 (and ends at the `b` of the `0b` prefix).
+    bits = bin(mask)[:1:-1]
+    return tuple(names[idx] for idx, bit in enumerate(bits) if bit == "1")
+
+
+def to_bitmap(mask: int) -> bytearray:
+    """
+    Returns the bitmask `mask` as a little-endian bitmap, i.e. with symbol ID `n`
+    at bit `n % 8` of byte `n // 8`, `symbol_count()` bits (rounded up) long.
+
+    Raises `ValueError` if `mask` isn't a valid bitmask.
+    """
+    _check_mask(mask)
+    return bytearray(mask.to_bytes((symbol_count() + 7) // 8, "little"))
+
+
+def from_bitmap(bitmap: bytes | bytearray) -> int:
+    """
+    Returns the bitmask for the bitmap `bitmap`; the inverse of `to_bitmap`.
+
+    Raises `ValueError` if `bitmap` has bits set for anything but symbol IDs.
+    """
+    mask = int.from_bytes(bitmap, "little")
+    _check_mask(mask)
+    return mask
+
+
+def mask_at(version: PyVersion) -> int:
+    """
+    Returns the bitmask of the symbols that were added in or before `version`,
+    i.e. the symbols in `surface_at(version)`.
+
+    The masks are precomputed for every version, so this is a single bisection.
+    Symbols added after `start`, up to and including `end`, are
+    `mask_at(end) & ~mask_at(start)`.
+    """
+    versions, masks = _snapshot.version_masks()
+    idx = bisect.bisect_right(versions, version.to_hex())
+    return masks[idx - 1] if idx else 0
+
+
+def feature_macro_mask(name: str) -> int:
+    """
+    Returns the bitmask of the symbols that are only available when the feature
+    macro named `name` (e.g. `HAVE_FORK`) is defined; see `Function.ifdef`.
+
+    Raises `KeyError` if `name` isn't in `abi3info.FEATURE_MACROS`.
+    """
+    return _snapshot.feature_macro_masks()[name]
@@ -0,0 +1,111 @@
+"""
+Batch parsing of PEP 425 compatibility tags, e.g. from wheel filenames.
+
+Unlike `PyVersion.parse_python_tag`, which parses a single `cpXY` tag and
+raises on anything else, `parse_wheel_tags` parses many filenames (or tag
+triples) at once, handles compressed tag sets (e.g. `cp38.cp39`) and
+underscore-separated tags (e.g. `cp3_10`), and reports unparseable inputs as
+`None` rather than raising:
+
+```python
+from abi3info.tags import parse_wheel_tags
+
+[tags] = parse_wheel_tags(["foo-1.0-cp38.cp39-abi3-manylinux_2_17_x86_64.whl"])
+print(tags.python, tags.abis, tags.abi3)
+```
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from abi3info.models import PyVersion
+
+# A CPython tag with both a major and a minor version, e.g. `cp310` or `cp3_10`.
+# Other tags (e.g. `py3`, `pp39`, or major-only `cp3`) don't match, and neither
+# do minor versions that `PyVersion` can't represent (i.e. above 255).
+_CPYTHON_TAG = re.compile(r"cp(\d)_?(\d{1,2}|1\d\d|2[0-4]\d|25[0-5])")
+
+
+@dataclass(frozen=True, slots=True)
+class WheelTags:
+    """
+    The compatibility tags of a single wheel (or tag triple).
+    """
+
+    python: tuple[PyVersion, ...]
+    """
+    The CPython versions in the Python tag set, in tag order.
+
+    Non-CPython tags (e.g. `py3`), major-only tags (e.g. `cp3`), and tags with
+    minor versions above 255 (which `PyVersion` can't represent) are not included.
+    """
+
+    abis: tuple[str, ...]
+    """
+    The ABI tags, in tag order, e.g. `("abi3",)` or `("cp310",)`.
+    """
+
+    platforms: tuple[str, ...]
+    """
+    The platform tags, in tag order.
+    """
+
+    abi3: PyVersion | None
+    """
+    The minimum Python version claimed by an `abi3` wheel, i.e. the oldest version
+    in `python`, or `None` if the ABI tags don't include `abi3` (or no CPython
+    version is given).
+    """
+
+
+def _parse_triple(python: str, abi: str, platform: str) -> WheelTags:
+    """
+    Parses a single (Python, ABI, platform) tag triple.
+    """
+    versions = tuple(
+        PyVersion.intern(int(match[1]), int(match[2]))
+        for match in map(_CPYTHON_TAG.fullmatch, python.split("."))
+        if match
+    )
+    abis = tuple(abi.split("."))
+    return WheelTags(
+        python=versions,
+        abis=abis,
+        platforms=tuple(platform.split(".")),
+        abi3=min(versions) if versions and "abi3" in abis else None,
+    )
+
+
+def parse_wheel_tags(items: Iterable[str | tuple[str, str, str]]) -> list[WheelTags | None]:
+    """
+    Parses the compatibility tags for each of `items`, in a single pass.
+
+    Each item is either a wheel filename (e.g. `foo-1.0-cp38-abi3-linux_x86_64.whl`)
+    or a (Python, ABI, platform) tag triple (e.g. `("cp38", "abi3", "linux_x86_64")`).
+
+    Returns a list with one entry per item, in order: either the item's
+    `WheelTags`, or `None` if the item isn't a well-formed wheel filename.
+    Items with identical tags share a single `WheelTags`.
+    """
+    parsed: dict[tuple[str, str, str], WheelTags] = {}
+    results: list[WheelTags | None] = []
+    for item in items:
+        if isinstance(item, str):
+            # {distribution}-{version}(-{build})?-{python}-{abi}-{platform}.whl
+            parts = item.removesuffix(".whl").rsplit("-", 3)
+            if not item.endswith(".whl") or len(parts) != 4 or "-" not in parts[0]:
+                results.append(None)
+                continue
+            triple = (parts[1], parts[2], parts[3])
+        else:
+            triple = item
+
+        tags = parsed.get(triple)
+        if tags is None:
+            tags = parsed[triple] = _parse_triple(*triple)
+        results.append(tags)
+
+    return results
@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+
+# bitsets.py: set algebra over many symbol sets, as sets of `Symbol`s versus
+# the bitmasks from `abi3info.surface`.
+#
+# Simulates a corpus of wheels, each using a random subset of the stable ABI's
+# symbols, and measures (in this process, taking the best of several repeats)
+# the time in microseconds to compute, over the whole corpus:
+#
+# * `union`: the symbols used by any wheel
+# * `intersection`: the symbols used by every wheel
+# * `difference`: for each wheel, the symbols newer than 3.9
+# * `count`: the total number of symbols used, summed over every wheel
+#
+# Each as `*_set_us` (with `frozenset`s of `Symbol`s) and `*_mask_us` (with
+# bitmasks). The results are written as JSON.
+
+import argparse
+import functools
+import json
+import operator
+import random
+import timeit
+
+import abi3info
+from abi3info.models import PyVersion
+from abi3info.surface import mask_at, to_mask
+
+_WHEELS = 2000
+_SYMBOLS_PER_WHEEL = 200
+
+
+def measure(repeat: int) -> dict[str, int]:
+    rng = random.Random(0)
+    symbols = [*abi3info.FUNCTIONS, *abi3info.DATAS]
+    sets = [frozenset(rng.sample(symbols, _SYMBOLS_PER_WHEEL)) for _ in range(_WHEELS)]
+    masks = [to_mask(used) for used in sets]
+
+    version = PyVersion(3, 9)
+    old_set = frozenset(
+        entry.symbol
+        for entry in (*abi3info.FUNCTIONS.values(), *abi3info.DATAS.values())
+        if entry.added <= version
+    )
+    old_mask = mask_at(version)
+
+    def _us(func) -> int:
+        return int(min(timeit.repeat(func, number=10, repeat=repeat)) / 10 * 1e6)
+
+    return {
+        "union_set_us": _us(lambda: frozenset().union(*sets)),
+        "union_mask_us": _us(lambda: functools.reduce(operator.or_, masks)),
+        "intersection_set_us": _us(lambda: sets[0].intersection(*sets[1:])),
+        "intersection_mask_us": _us(lambda: functools.reduce(operator.and_, masks)),
+        "difference_set_us": _us(lambda: [used - old_set for used in sets]),
+        "difference_mask_us": _us(lambda: [used & ~old_mask for used in masks]),
+        "count_set_us": _us(lambda: sum(map(len, sets))),
+        "count_mask_us": _us(lambda: sum(mask.bit_count() for mask in masks)),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(json.dumps(measure(args.repeat), indent=2))
+
+
+if __name__ == "__main__":
+    main()
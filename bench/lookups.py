@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+
+# lookups.py: lookup and hashing microbenchmarks for abi3info.
+#
+# Measures (in this process, taking the best of several repeats), in
+# nanoseconds per operation over 10^6 operations:
+#
+# * `table_lookup_ns`: `FUNCTIONS[Symbol(...)]`, with keys that aren't the
+#   table's own `Symbol` objects
+# * `symbol_construct_lookup_ns`: `FUNCTIONS[Symbol(name)]`, i.e. the `Symbol`-keyed
+#   path from a raw name, including constructing the `Symbol`
+# * `str_lookup_ns`: `lookup_function(name)`, for the same names
+# * `bytes_lookup_ns`: `lookup_function(name)`, for the same names as `bytes`
+# * `symbol_dict_lookup_ns`: looking up `Symbol`s in a user-built dict keyed by
+#   `Symbol`, which hashes each key on every probe
+# * `function_set_ns`: adding every `Function` to a set, which hashes each
+#   `Function` (and, transitively, its `Symbol`, `PyVersion` and `FeatureMacro`)
+#
+# The results are written as JSON.
+
+import argparse
+import json
+import timeit
+
+import abi3info
+from abi3info.models import Symbol
+
+_OPERATIONS = 10**6
+
+
+def _ns_per_op(func, ops_per_call: int, repeat: int) -> int:
+    number = max(1, _OPERATIONS // ops_per_call)
+    best = min(timeit.repeat(func, number=number, repeat=repeat))
+    return int(best / (number * ops_per_call) * 1e9)
+
+
+def measure(repeat: int) -> dict[str, int]:
+    functions = abi3info.FUNCTIONS
+    keys = [Symbol(symbol.name) for symbol in functions]
+    names = [symbol.name for symbol in functions]
+    raw_names = [name.encode() for name in names]
+    lookup_function = abi3info.lookup_function
+    by_symbol = dict.fromkeys(functions, None)
+    values = list(functions.values())
+
+    return {
+        "table_lookup_ns": _ns_per_op(lambda: [functions[k] for k in keys], len(keys), repeat),
+        "symbol_construct_lookup_ns": _ns_per_op(
+            lambda: [functions[Symbol(name)] for name in names], len(names), repeat
+        ),
+        "str_lookup_ns": _ns_per_op(
+            lambda: [lookup_function(name) for name in names], len(names), repeat
+        ),
+        "bytes_lookup_ns": _ns_per_op(
+            lambda: [lookup_function(name) for name in raw_names], len(names), repeat
+        ),
+        "symbol_dict_lookup_ns": _ns_per_op(
+            lambda: [by_symbol[k] for k in keys], len(keys), repeat
+        ),
+        "function_set_ns": _ns_per_op(lambda: set(values), len(values), repeat),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(json.dumps(measure(args.repeat), indent=2))
+
+
+if __name__ == "__main__":
+    main()
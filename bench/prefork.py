@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+
+# prefork.py: per-worker memory of forked worker pools, with and without
+# `abi3info.prepare_for_fork()`.
+#
+# For each mode, a fresh parent process imports `abi3info` (and, in the
+# `prepare_for_fork` mode, calls `abi3info.prepare_for_fork()`), and then forks
+# a pool of workers (32 by default). Each worker reads every model in every
+# table, runs a garbage collection (as any long-lived worker eventually will),
+# and then reports its memory from `/proc/self/smaps_rollup`:
+#
+# * `rss_kib`: the worker's resident set, including pages shared with the parent
+# * `pss_kib`: the worker's proportional share of its resident set
+# * `private_kib`: the pages that belong to the worker alone (i.e. that it has
+#   either allocated itself, or copied from the parent on write)
+#
+# The medians over all workers are written as JSON. Linux only.
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+_WORKERS = """
+import gc
+import json
+import os
+import statistics
+import sys
+
+import abi3info
+
+if sys.argv[2] == "prepare_for_fork":
+    abi3info.prepare_for_fork()
+
+
+def _smaps():
+    fields = {}
+    with open("/proc/self/smaps_rollup") as io:
+        for line in io:
+            key, _, value = line.partition(":")
+            if value.strip().endswith("kB"):
+                fields[key] = int(value.split()[0])
+    return {
+        "rss_kib": fields["Rss"],
+        "pss_kib": fields["Pss"],
+        "private_kib": fields["Private_Clean"] + fields["Private_Dirty"],
+    }
+
+
+def _work():
+    for name in abi3info._TABLES:
+        for key, value in getattr(abi3info, name).items():
+            hash(key), repr(value)
+    gc.collect()
+    return _smaps()
+
+
+# Each worker reports back once it's done, but doesn't exit until every worker
+# has reported, so that shared pages are counted while all of them are alive.
+results, done = os.pipe()
+release, wait = os.pipe()
+pids = []
+for _ in range(int(sys.argv[1])):
+    if (pid := os.fork()) == 0:
+        os.write(done, (json.dumps(_work()) + "\\n").encode())
+        os.read(release, 1)
+        os._exit(0)
+    pids.append(pid)
+
+samples = []
+with os.fdopen(results) as io:
+    while len(samples) < len(pids):
+        samples.append(json.loads(io.readline()))
+os.write(wait, b"x" * len(pids))
+for pid in pids:
+    os.waitpid(pid, 0)
+
+print(json.dumps({k: int(statistics.median(s[k] for s in samples)) for k in samples[0]}))
+"""
+
+# NOTE: Workers must be able to write (and then reuse) bytecode caches,
+# or we end up measuring compilation instead.
+_ENV = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+
+
+def measure(workers: int, mode: str) -> dict[str, int]:
+    result = subprocess.run(
+        [sys.executable, "-c", _WORKERS, str(workers), mode],
+        check=True,
+        capture_output=True,
+        text=True,
+        env=_ENV,
+    )
+    return json.loads(result.stdout)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-w", "--workers", type=int, default=32)
+    args = parser.parse_args()
+
+    if not sys.platform.startswith("linux"):
+        parser.error("this benchmark requires Linux")
+
+    # Warm the bytecode caches first.
+    subprocess.run([sys.executable, "-c", "import abi3info"], check=True, env=_ENV)
+
+    results = {mode: measure(args.workers, mode) for mode in ("default", "prepare_for_fork")}
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
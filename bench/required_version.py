@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+
+# required_version.py: benchmarks `abi3info.surface.required_version`.
+#
+# Measures (in this process, taking the best of several repeats) the time to
+# compute the required version for a simulated extension's imports, i.e. every
+# function and data object name plus an equal number of non-ABI names:
+#
+# * `loop_us`: the per-caller loop over `FUNCTIONS[Symbol(name)]` (and `DATAS`),
+#   in microseconds per batch
+# * `batch_us`: `required_version(names)`, in microseconds per batch
+#
+# The results are written as JSON.
+
+import argparse
+import json
+import timeit
+
+import abi3info
+from abi3info.models import Symbol
+from abi3info.surface import required_version
+
+
+def _loop(names):
+    functions, datas = abi3info.FUNCTIONS, abi3info.DATAS
+    version, non_abi = None, []
+    for name in names:
+        symbol = Symbol(name)
+        entry = functions.get(symbol) or datas.get(symbol)
+        if entry is None:
+            non_abi.append(name)
+        elif version is None or entry.added > version:
+            version = entry.added
+    return version, non_abi
+
+
+def measure(repeat: int) -> dict[str, int]:
+    names = [symbol.name for symbol in (*abi3info.FUNCTIONS, *abi3info.DATAS)]
+    names += [f"_not_abi_{idx}" for idx in range(len(names))]
+    assert _loop(names)[0] == required_version(names).version
+
+    def _us(func) -> int:
+        return int(min(timeit.repeat(func, number=100, repeat=repeat)) / 100 * 1e6)
+
+    return {
+        "loop_us": _us(lambda: _loop(names)),
+        "batch_us": _us(lambda: required_version(names)),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(json.dumps(measure(args.repeat), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+
+# search.py: name searches with `abi3info.search`, versus scanning the tables.
+#
+# Measures (in this process, taking the best of several repeats), in
+# microseconds per search, for each pattern below:
+#
+# * `scan_us`: `fnmatch.fnmatchcase` over every name in `FUNCTIONS`, `DATAS`,
+#   `MACROS`, `TYPEDEFS` and `STRUCTS`, building only the matches
+# * `search_us`: `list(glob(pattern))`
+#
+# The results are written as JSON.
+
+import argparse
+import fnmatch
+import json
+import timeit
+
+import abi3info
+from abi3info.models import Data, Function
+from abi3info.search import glob
+
+_PATTERNS = ("PyUnicode_*", "PyType_*Slot*", "Py_*", "*Slot*")
+
+
+def _scan(pattern):
+    results = []
+    for table in (abi3info.FUNCTIONS, abi3info.DATAS):
+        results.extend(v for k, v in table.items() if fnmatch.fnmatchcase(k.name, pattern))
+    for table in (abi3info.MACROS, abi3info.TYPEDEFS, abi3info.STRUCTS):
+        results.extend(v for k, v in table.items() if fnmatch.fnmatchcase(k, pattern))
+    return results
+
+
+def _name(member):
+    return member.symbol.name if isinstance(member, (Function, Data)) else member.name
+
+
+def measure(repeat: int) -> dict[str, dict[str, int]]:
+    abi3info.prepare_for_fork()
+
+    def _us(func) -> int:
+        return int(min(timeit.repeat(func, number=100, repeat=repeat)) / 100 * 1e6)
+
+    results = {}
+    for pattern in _PATTERNS:
+        assert sorted(map(_name, _scan(pattern))) == list(map(_name, glob(pattern)))
+        results[pattern] = {
+            "scan_us": _us(lambda: _scan(pattern)),
+            "search_us": _us(lambda: list(glob(pattern))),
+        }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(json.dumps(measure(args.repeat), indent=2))
+
+
+if __name__ == "__main__":
+    main()
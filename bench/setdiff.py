@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+
+# setdiff.py: set operations over audit results, i.e. sets of `Function`s
+# and `Data`s, as when diffing the stable ABI usage of two builds.
+#
+# Measures (in this process, taking the best of several repeats), in
+# nanoseconds per element:
+#
+# * `diff_shared_ns`: `a - b` for two overlapping sets of the canonical table
+#   entries, where equal elements are also identical
+# * `diff_copied_ns`: `a - b` where `b` holds equal copies of the entries
+#   (e.g. results built outside of `abi3info`), so equal elements aren't identical
+# * `eq_shared_ns`/`eq_copied_ns`: `a == b` for the same two pairings, with
+#   sets that are equal
+# * `eq_direct_ns`: `x == x` for each entry, as when comparing individual results
+# * `deepcopy_ns`: `copy.deepcopy` of a list of every entry
+#
+# The results are written as JSON.
+
+import argparse
+import copy
+import dataclasses
+import json
+import timeit
+
+import abi3info
+
+
+def _ns_per_op(func, ops_per_call: int, repeat: int) -> int:
+    number = max(1, 10**6 // ops_per_call)
+    best = min(timeit.repeat(func, number=number, repeat=repeat))
+    return int(best / (number * ops_per_call) * 1e9)
+
+
+def measure(repeat: int) -> dict[str, int]:
+    entries = [*abi3info.FUNCTIONS.values(), *abi3info.DATAS.values()]
+    copies = [dataclasses.replace(entry) for entry in entries]
+
+    # Two audits that share every other entry.
+    a, b = set(entries), set(entries[::2])
+    b_copied = set(copies[::2])
+    a_copied = set(copies)
+    a_shared = set(entries)
+
+    return {
+        "diff_shared_ns": _ns_per_op(lambda: a - b, len(a), repeat),
+        "diff_copied_ns": _ns_per_op(lambda: a - b_copied, len(a), repeat),
+        "eq_shared_ns": _ns_per_op(lambda: a == a_shared, len(a), repeat),
+        "eq_copied_ns": _ns_per_op(lambda: a == a_copied, len(a), repeat),
+        "eq_direct_ns": _ns_per_op(lambda: [x == x for x in entries], len(entries), repeat),
+        "deepcopy_ns": _ns_per_op(lambda: copy.deepcopy(entries), len(entries), repeat),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(json.dumps(measure(args.repeat), indent=2))
+
+
+if __name__ == "__main__":
+    main()
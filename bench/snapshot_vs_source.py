@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+
+# snapshot_vs_source.py: compare the cost of building every table from the
+# generated Python source (`abi3info._internal`) against the binary snapshot.
+#
+# Each sample runs in a fresh interpreter, so that we measure cold loads.
+# Both paths build every entry in every table, and `abi3info.models` is imported
+# before timing starts, since both paths pay for it equally. Bytecode caches
+# are warmed first, so the source path isn't penalized for compilation.
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+_SOURCE = """
+import time
+import abi3info.models
+start = time.perf_counter()
+from abi3info._internal import _datas, _feature_macros, _functions, _macros, _structs, _typedefs
+print(time.perf_counter() - start)
+"""
+
+_SNAPSHOT = """
+import time
+import abi3info.models
+start = time.perf_counter()
+from abi3info import _snapshot
+for loader in (
+    _snapshot.datas,
+    _snapshot.feature_macros,
+    _snapshot.functions,
+    _snapshot.macros,
+    _snapshot.structs,
+    _snapshot.typedefs,
+):
+    for _ in loader().values():
+        pass
+print(time.perf_counter() - start)
+"""
+
+
+# NOTE: Samples must be able to write (and then reuse) bytecode caches,
+# or we end up measuring compilation instead.
+_ENV = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+
+
+def _sample(code: str) -> float:
+    result = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True, env=_ENV
+    )
+    return float(result.stdout)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", "--samples", type=int, default=20)
+    args = parser.parse_args()
+
+    # Warm the bytecode caches.
+    _sample(_SOURCE)
+    _sample(_SNAPSHOT)
+
+    for label, code in (("source", _SOURCE), ("snapshot", _SNAPSHOT)):
+        samples = [_sample(code) for _ in range(args.samples)]
+        print(
+            f"{label:>8}: min={min(samples) * 1000:.2f}ms "
+            f"median={statistics.median(samples) * 1000:.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+
+# startup.py: startup benchmarks for abi3info, with regression checks.
+#
+# Measures (each in fresh interpreters, taking the median over several samples):
+#
+# * `import_time_us`: the cumulative cold import time of `abi3info`,
+#   as reported by `-X importtime`
+# * `first_lookup_us`: the latency of the first `FUNCTIONS[Symbol(...)]` lookup
+#   after import, including building the table
+# * `peak_rss_kib`: the peak RSS of a process that has only imported `abi3info`
+#
+# The results are written as JSON and compared against a stored baseline
+# (`bench/baseline.json` by default). A metric regresses when it exceeds its
+# baseline value by more than its threshold ratio; thresholds can be
+# overridden with `--threshold METRIC=RATIO`.
+#
+# Baselines are machine-specific: regenerate them with `--update-baseline`
+# when changing machines.
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+_HERE = Path(__file__).resolve().parent
+
+_DEFAULT_THRESHOLDS = {
+    "import_time_us": 1.25,
+    "first_lookup_us": 1.25,
+    "peak_rss_kib": 1.10,
+}
+
+_FIRST_LOOKUP = """
+import time
+import abi3info
+from abi3info.models import Symbol
+start = time.perf_counter_ns()
+abi3info.FUNCTIONS[Symbol("PyType_FromSpec")]
+print((time.perf_counter_ns() - start) // 1000)
+"""
+
+_PEAK_RSS = """
+import resource
+import sys
+import abi3info
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+# NOTE: macOS reports ru_maxrss in bytes, everything else in KiB.
+print(rss // 1024 if sys.platform == "darwin" else rss)
+"""
+
+
+# NOTE: Samples must be able to write (and then reuse) bytecode caches,
+# or we end up measuring compilation instead.
+_ENV = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+
+
+def _python(*args: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, *args], check=True, capture_output=True, text=True, env=_ENV
+    )
+
+
+def _import_time_us() -> int:
+    result = _python("-X", "importtime", "-c", "import abi3info")
+    for line in result.stderr.splitlines():
+        # Format: "import time: <self us> | <cumulative us> | <indented module name>"
+        _, cumulative, module = line.split("|")
+        if module.strip() == "abi3info":
+            return int(cumulative)
+    raise ValueError("no import time reported for abi3info")
+
+
+def measure(samples: int) -> dict[str, int]:
+    # Warm the bytecode caches first; we're interested in cold process
+    # startup, not in compilation.
+    _python("-c", "import abi3info")
+
+    return {
+        "import_time_us": int(statistics.median(_import_time_us() for _ in range(samples))),
+        "first_lookup_us": int(
+            statistics.median(int(_python("-c", _FIRST_LOOKUP).stdout) for _ in range(samples))
+        ),
+        "peak_rss_kib": int(
+            statistics.median(int(_python("-c", _PEAK_RSS).stdout) for _ in range(samples))
+        ),
+    }
+
+
+def compare(
+    results: dict[str, int], baseline: dict[str, int], thresholds: dict[str, float]
+) -> list[str]:
+    regressions = []
+    for metric, value in results.items():
+        if metric not in baseline:
+            continue
+        limit = baseline[metric] * thresholds[metric]
+        if value > limit:
+            regressions.append(
+                f"{metric}: {value} exceeds baseline {baseline[metric]} "
+                f"by more than {thresholds[metric]}x"
+            )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", "--samples", type=int, default=15)
+    parser.add_argument("-o", "--output", type=Path, help="write the results as JSON to this file")
+    parser.add_argument("--baseline", type=Path, default=_HERE / "baseline.json")
+    parser.add_argument(
+        "--update-baseline", action="store_true", help="overwrite the baseline with these results"
+    )
+    parser.add_argument(
+        "--threshold",
+        action="append",
+        default=[],
+        metavar="METRIC=RATIO",
+        help="maximum allowed ratio of a metric to its baseline",
+    )
+    args = parser.parse_args()
+
+    thresholds = dict(_DEFAULT_THRESHOLDS)
+    for threshold in args.threshold:
+        metric, ratio = threshold.split("=", 1)
+        if metric not in thresholds:
+            parser.error(f"unknown metric: {metric}")
+        thresholds[metric] = float(ratio)
+
+    results = measure(args.samples)
+    rendered = json.dumps(results, indent=2)
+    print(rendered)
+    if args.output:
+        args.output.write_text(rendered + "\n")
+
+    if args.update_baseline:
+        args.baseline.write_text(rendered + "\n")
+        return
+
+    if not args.baseline.is_file():
+        print(f"no baseline at {args.baseline}; skipping comparison", file=sys.stderr)
+        return
+
+    regressions = compare(results, json.loads(args.baseline.read_text()), thresholds)
+    for regression in regressions:
+        print(f"regression: {regression}", file=sys.stderr)
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
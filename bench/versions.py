@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+
+# versions.py: `PyVersion` comparison microbenchmarks.
+#
+# Measures (in this process, taking the best of several repeats), in
+# nanoseconds per element over a list of 10^6 versions drawn from the
+# versions used in the tables:
+#
+# * `sort_ns`: `sorted(versions)`
+# * `max_ns`: `max(versions)`, i.e. finding the minimum required version
+#   across a corpus of symbols
+# * `set_ns`: `set(versions)`, which hashes every version
+#
+# The results are written as JSON.
+
+import argparse
+import json
+import random
+import timeit
+
+import abi3info
+
+_VERSIONS = 10**6
+
+
+def _ns_per_op(func, repeat: int) -> int:
+    best = min(timeit.repeat(func, number=1, repeat=repeat))
+    return int(best / _VERSIONS * 1e9)
+
+
+def measure(repeat: int) -> dict[str, int]:
+    rng = random.Random(0)
+    added = [function.added for function in abi3info.FUNCTIONS.values()]
+    versions = [rng.choice(added) for _ in range(_VERSIONS)]
+
+    return {
+        "sort_ns": _ns_per_op(lambda: sorted(versions), repeat),
+        "max_ns": _ns_per_op(lambda: max(versions), repeat),
+        "set_ns": _ns_per_op(lambda: set(versions), repeat),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(json.dumps(measure(args.repeat), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+
+# wheel_tags.py: `PyVersion` parsing over a simulated wheelhouse scan.
+#
+# Parses the Python tag (with `PyVersion.parse_python_tag`) and a
+# `Requires-Python`-style dotted version (with `PyVersion.parse_dotted`) for
+# each of 500k synthetic wheels, first with the memoized parsers and then with
+# the underlying uncached parsers, and reports the time per wheel for each
+# along with the memoized parsers' hit and miss statistics.
+#
+# The results are written as JSON.
+
+import argparse
+import json
+import random
+import time
+
+from abi3info.models import PyVersion
+
+_MINORS = range(2, 15)
+
+
+def _wheels(count: int) -> list[tuple[str, str]]:
+    rng = random.Random(0)
+    wheels = []
+    for _ in range(count):
+        minor = rng.choice(_MINORS)
+        filename = f"pkg-1.0-cp3{minor}-abi3-manylinux_2_17_x86_64.whl"
+        wheels.append((filename.split("-")[2], f"3.{rng.choice(_MINORS)}"))
+    return wheels
+
+
+def _scan(wheels: list[tuple[str, str]], parse_python_tag, parse_dotted) -> int:
+    start = time.perf_counter_ns()
+    for python_tag, requires_python in wheels:
+        parse_python_tag(python_tag)
+        parse_dotted(requires_python)
+    return (time.perf_counter_ns() - start) // len(wheels)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-w", "--wheels", type=int, default=500_000)
+    args = parser.parse_args()
+
+    wheels = _wheels(args.wheels)
+
+    PyVersion.parser_cache_clear()
+    cached_ns = _scan(wheels, PyVersion.parse_python_tag, PyVersion.parse_dotted)
+    info = PyVersion.parser_cache_info()
+
+    uncached_ns = _scan(
+        wheels,
+        lambda tag: PyVersion.parse_python_tag.__wrapped__(PyVersion, tag),
+        lambda version: PyVersion.parse_dotted.__wrapped__(PyVersion, version),
+    )
+
+    results = {
+        "cached_ns_per_wheel": cached_ns,
+        "uncached_ns_per_wheel": uncached_ns,
+        "cache_info": {name: info[name]._asdict() for name in ("parse_python_tag", "parse_dotted")},
+    }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
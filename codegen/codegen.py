@@ -3,14 +3,17 @@
 # codegen.py: codegen for abi3info
 
 import os
+import re
 import shutil
 import subprocess
 import sys
 from hashlib import sha256
 from pathlib import Path
+from struct import pack
 
 import toml
 
+from abi3info import _snapshot
 from abi3info.models import (
     Data,
     FeatureMacro,
@@ -45,10 +48,14 @@ if _STABLE_ABI_CHECKSUM_FILE.is_file():
     old_checksum = _STABLE_ABI_CHECKSUM_FILE.read_text().rstrip()
     stable_abi_changed = new_checksum != old_checksum
 
-_INTERNAL = _ABI3INFO / "_internal.py"
+_INTERNAL = _ABI3INFO / "_internal"
+_SNAPSHOT = _ABI3INFO / "_snapshot.bin"
+_NAMES = _ABI3INFO / "names.py"
 internal_outdated = False
-if _INTERNAL.is_file():
-    internal_mtime = _INTERNAL.stat().st_mtime
+if _INTERNAL.is_dir() and _SNAPSHOT.is_file() and _NAMES.is_file():
+    internal_mtime = min(
+        path.stat().st_mtime for path in [*_INTERNAL.glob("*.py"), _SNAPSHOT, _NAMES]
+    )
     codegen_mtime = _THIS.stat().st_mtime
     internal_outdated = codegen_mtime >= internal_mtime
 
@@ -58,7 +65,7 @@ print(f"[+] {stable_abi_changed=} {internal_outdated=} {force_codegen=}")
 
 # We skip codegen if all of the following are true:
 # * `stable_abi.toml` has not changed since the last run
-# * `_internal.py` is newer than this file (meaning we haven't tweaked it)
+# * all generated files are newer than this file (meaning we haven't tweaked it)
 # * `FORCE_CODEGEN` is not set
 if not stable_abi_changed and not internal_outdated and not force_codegen:
     print("[!] codegen: exiting early because nothing has changed", file=sys.stderr)
@@ -72,42 +79,63 @@ for key in ("struct", "function", "data"):
     val = _STABLE_ABI_DATA[key]
     assert isinstance(val, dict), "stable ABI data doesn't look right (format changed?)"
 
-_OUT = _INTERNAL.open(mode="w")
+_INTERNAL.mkdir(exist_ok=True)
 
-# All generated code goes into `abi3info/_internal.py`.
+# All generated code goes into the `abi3info/_internal/` package, with one
+# module per table. This lets `abi3info` load each table independently,
+# on first access.
 #
 # The way we actually do the codegen is a little cheeky: rather than
 # building up things like instantiations manually, we reuse each model's `repr()`.
-
-print(
-    """
-'''
-Generated definitions and data structures for abi3info.
-
-This module should not be used directly; it is not a public API.
-'''
-""",
-    file=_OUT,
-)
-
-print("from __future__ import annotations", file=_OUT)
-print(file=_OUT)
-print("from typing import Final", file=_OUT)
-print(file=_OUT)
-print(
-    "from abi3info.models import Data, FeatureMacro, FullStruct, Function, "
-    "Macro, OpaqueStruct, PartialStruct, PyVersion, Struct, Symbol, Typedef",
-    file=_OUT,
-)
-
-print("# this file was generated; do not modify it by hand!", file=_OUT)
+# The only adjustment we make is to route every `PyVersion` through
+# `PyVersion.intern`, so that each table shares a single object per version.
+_PY_VERSION_REPR = re.compile(r"\bPyVersion\(")
+
+
+def _emit(module: str, doc: str, imports: list[str], body: str, *, extra_imports: str = "") -> None:
+    path = _INTERNAL / f"{module}.py"
+    with path.open(mode="w") as out:
+        print(
+            f"'''\n{doc}\n\nThis module should not be used directly; it is not a public API.\n'''",
+            file=out,
+        )
+        print("from __future__ import annotations", file=out)
+        if body:
+            print(file=out)
+            print("from typing import Final", file=out)
+            print(file=out)
+            if extra_imports:
+                print(extra_imports, file=out)
+            print(f"from abi3info.models import {', '.join(imports)}", file=out)
+            print("# this file was generated; do not modify it by hand!", file=out)
+            print(_PY_VERSION_REPR.sub("PyVersion.intern(", body), file=out)
+
+
+_emit("__init__", "Generated definitions and data structures for abi3info.", [], "")
 
 print("[+] codegen: feature macros", file=sys.stderr)
 feature_macros = {
     name: FeatureMacro(name, body["doc"], body.get("windows", False))
     for name, body in _STABLE_ABI_DATA["feature_macro"].items()
 }
-print(f"_FEATURE_MACROS: Final[dict[str, FeatureMacro]] = {feature_macros}", file=_OUT)
+_emit(
+    "_feature_macros",
+    "Generated feature macro definitions for abi3info.",
+    ["FeatureMacro"],
+    f"_FEATURE_MACROS: Final[dict[str, FeatureMacro]] = {feature_macros}",
+)
+
+
+# Functions and data objects refer to their feature macros by reference
+# into `_FEATURE_MACROS`, rather than each carrying a copy of the macro.
+_FEATURE_MACROS_IMPORT = "from abi3info._internal._feature_macros import _FEATURE_MACROS"
+
+
+def _share_feature_macros(body: str) -> str:
+    for name, feature_macro in feature_macros.items():
+        body = body.replace(repr(feature_macro), f"_FEATURE_MACROS[{name!r}]")
+    return body
+
 
 print("[+] codegen: structs", file=sys.stderr)
 structs = {}
@@ -118,12 +146,17 @@ for name, body in _STABLE_ABI_DATA["struct"].items():
     elif body_abi_kind == "full-abi":
         struct = FullStruct(name, PyVersion.parse_dotted(body["added"]))
     elif body_abi_kind == "members":
-        struct = PartialStruct(name, PyVersion.parse_dotted(body["added"]), body["members"])
+        struct = PartialStruct(name, PyVersion.parse_dotted(body["added"]), tuple(body["members"]))
     else:
         assert False, f"unexpected struct_abi_kind={body_abi_kind}"
 
     structs[struct.name] = struct
-print(f"_STRUCTS: Final[dict[str, Struct]] = {structs}", file=_OUT)
+_emit(
+    "_structs",
+    "Generated struct definitions for abi3info.",
+    ["FullStruct", "OpaqueStruct", "PartialStruct", "PyVersion", "Struct"],
+    f"_STRUCTS: Final[dict[str, Struct]] = {structs}",
+)
 
 print("[+] codegen: functions", file=sys.stderr)
 functions = {
@@ -135,13 +168,24 @@ functions = {
     )
     for name, body in _STABLE_ABI_DATA["function"].items()
 }
-print(f"_FUNCTIONS: Final[dict[Symbol, Function]] = {functions}", file=_OUT)
+_emit(
+    "_functions",
+    "Generated function definitions for abi3info.",
+    ["Function", "PyVersion", "Symbol"],
+    _share_feature_macros(f"_FUNCTIONS: Final[dict[Symbol, Function]] = {functions}"),
+    extra_imports=_FEATURE_MACROS_IMPORT,
+)
 
 print("[+] codegen: macros", file=sys.stderr)
 macros = {}
 for name, body in {**_STABLE_ABI_DATA["const"], **_STABLE_ABI_DATA["macro"]}.items():
     macros[name] = Macro(name, PyVersion.parse_dotted(body["added"]))
-print(f"_MACROS: Final[dict[str, Macro]] = {macros}", file=_OUT)
+_emit(
+    "_macros",
+    "Generated macro definitions for abi3info.",
+    ["Macro", "PyVersion"],
+    f"_MACROS: Final[dict[str, Macro]] = {macros}",
+)
 
 print("[+] codegen: data objects", file=sys.stderr)
 datas = {
@@ -153,18 +197,180 @@ datas = {
     )
     for name, body in _STABLE_ABI_DATA["data"].items()
 }
-print(f"_DATAS: Final[dict[Symbol, Data]] = {datas}", file=_OUT)
+_emit(
+    "_datas",
+    "Generated data object definitions for abi3info.",
+    ["Data", "PyVersion", "Symbol"],
+    _share_feature_macros(f"_DATAS: Final[dict[Symbol, Data]] = {datas}"),
+    extra_imports=_FEATURE_MACROS_IMPORT,
+)
 
 print("[+] codegen: typedefs", file=sys.stderr)
 typedefs = {
     name: Typedef(name, PyVersion.parse_dotted(body["added"]))
     for name, body in _STABLE_ABI_DATA["typedef"].items()
 }
-print(f"_TYPEDEFS: Final[dict[str, Typedef]] = {typedefs}", file=_OUT)
+_emit(
+    "_typedefs",
+    "Generated typedef definitions for abi3info.",
+    ["PyVersion", "Typedef"],
+    f"_TYPEDEFS: Final[dict[str, Typedef]] = {typedefs}",
+)
+
+# Alongside the generated source, we also emit a compact binary snapshot of
+# the same tables. This is what `abi3info` actually loads (and `mmap`s) at runtime,
+# since reading the tables from it is much cheaper than compiling and executing
+# the generated source.
+#
+# Each table is stored in columns: parallel arrays of names, versions
+# (as `PY_VERSION_HEX`-style integers), feature macro indices (or -1), etc.
+# See `abi3info._snapshot` for the file's layout and the loaders.
+print("[+] codegen: snapshot", file=sys.stderr)
+_FEATURE_MACRO_INDICES = {name: idx for idx, name in enumerate(feature_macros)}
+_STRUCT_KINDS = {OpaqueStruct: "opaque", FullStruct: "full-abi", PartialStruct: "members"}
+
+
+def _symbol_columns(
+    table: dict[Symbol, Function] | dict[Symbol, Data],
+) -> dict[str, tuple[str, tuple]]:
+    return {
+        "names": ("S", tuple(sym.name for sym in table)),
+        "added": ("I", tuple(item.added.to_hex() for item in table.values())),
+        "ifdef": (
+            "h",
+            tuple(
+                _FEATURE_MACRO_INDICES[item.ifdef.name] if item.ifdef else -1
+                for item in table.values()
+            ),
+        ),
+        "abi_only": ("?", tuple(item.abi_only for item in table.values())),
+    }
+
+
+def _name_columns(table: dict[str, Macro] | dict[str, Typedef]) -> dict[str, tuple[str, tuple]]:
+    return {
+        "names": ("S", tuple(table)),
+        "added": ("I", tuple(item.added.to_hex() for item in table.values())),
+    }
+
+
+def _pack_snapshot(tables: dict[str, dict[str, tuple[str, tuple]]]) -> bytes:
+    directory_size = _snapshot._HEADER.size + sum(
+        _snapshot._TABLE.size + _snapshot._COLUMN.size * len(columns) for columns in tables.values()
+    )
 
-_OUT.close()
+    directory = bytearray()
+    data = bytearray()
+    pool = bytearray()
+    for table, columns in tables.items():
+        (count,) = {len(values) for _, values in columns.values()}
+        directory += _snapshot._TABLE.pack(table.encode(), count, len(columns))
+        for name, (fmt, values) in columns.items():
+            # Keep each column 8-byte aligned.
+            data += bytes(-len(data) % 8)
+            directory += _snapshot._COLUMN.pack(
+                name.encode(), fmt.encode(), directory_size + len(data)
+            )
+
+            if fmt == "S":
+                for value in values:
+                    encoded = value.encode()
+                    data += _snapshot._STRING.pack(len(pool), len(encoded))
+                    pool += encoded + b"\0"
+            else:
+                data += pack(f"<{len(values)}{fmt}", *values)
+
+    header = _snapshot._HEADER.pack(
+        _snapshot._MAGIC, _snapshot._VERSION, len(tables), directory_size + len(data)
+    )
+    return bytes(header + directory + data + pool)
+
+
+snapshot = {
+    "feature_macros": {
+        "names": ("S", tuple(feature_macros)),
+        "doc": ("S", tuple(fm.doc for fm in feature_macros.values())),
+        "windows": (
+            "B",
+            tuple(_snapshot._WINDOWS.index(fm.windows) for fm in feature_macros.values()),
+        ),
+    },
+    "structs": {
+        "names": ("S", tuple(structs)),
+        "kind": (
+            "B",
+            tuple(
+                _snapshot._STRUCT_KINDS.index(_STRUCT_KINDS[type(struct)])
+                for struct in structs.values()
+            ),
+        ),
+        "added": ("I", tuple(struct.added.to_hex() for struct in structs.values())),
+        "members": (
+            "S",
+            tuple(
+                " ".join(struct.members) if isinstance(struct, PartialStruct) else ""
+                for struct in structs.values()
+            ),
+        ),
+    },
+    "functions": _symbol_columns(functions),
+    "macros": _name_columns(macros),
+    "datas": _symbol_columns(datas),
+    "typedefs": _name_columns(typedefs),
+}
+_SNAPSHOT.write_bytes(_pack_snapshot(snapshot))
+
+# Finally, we emit `abi3info.names`: just the names in each table, as frozensets.
+# This module is public, and deliberately doesn't depend on `abi3info.models`.
+print("[+] codegen: names", file=sys.stderr)
+_NAME_SETS = {
+    "FUNCTIONS": (
+        "Names of function members of the limited API and stable ABI.",
+        {sym.name for sym in functions},
+    ),
+    "DATAS": (
+        "Names of data object members of the limited API and stable ABI.",
+        {sym.name for sym in datas},
+    ),
+    "ABI_ONLY": (
+        "Names of functions and data objects that are only part of the stable ABI.",
+        {item.symbol.name for item in [*functions.values(), *datas.values()] if item.abi_only},
+    ),
+    "FEATURE_MACROS": (
+        "Names of feature macros that control the availability of limited API members.",
+        set(feature_macros),
+    ),
+    "MACROS": ("Names of macro members of the limited API.", set(macros)),
+    "STRUCTS": ("Names of struct members of the limited API.", set(structs)),
+    "TYPEDEFS": ("Names of typedef members of the limited API.", set(typedefs)),
+}
+with _NAMES.open(mode="w") as out:
+    print(
+        """'''
+Names of the members of the limited API and stable ABI, as plain sets of strings.
+
+Unlike the tables in `abi3info`, this module doesn't build any models
+(or import `abi3info.models` at all), making it a cheap way to check
+whether a name belongs to the limited API or stable ABI:
+
+```python
+from abi3info import names
+
+"PyType_FromSpec" in names.FUNCTIONS
+```
+'''""",
+        file=out,
+    )
+    print("from __future__ import annotations", file=out)
+    print(file=out)
+    # NOTE: No `Final` here, since even importing `typing` would dwarf
+    # the cost of importing this module.
+    print("# this file was generated; do not modify it by hand!", file=out)
+    for name, (doc, members) in _NAME_SETS.items():
+        print(f"{name}: frozenset[str] = frozenset({sorted(members)})", file=out)
+        print(f'''"""\n{doc}\n"""\n''', file=out)
 
 print("[+] codegen: reformatting", file=sys.stderr)
-subprocess.run(["ruff", "format", _INTERNAL], check=True)
+subprocess.run(["ruff", "format", _INTERNAL, _NAMES], check=True)
 
 print("[+] codegen: all done!", file=sys.stderr)
@@ -0,0 +1,321 @@
+import copy
+import dataclasses
+import gc
+import os
+import pickle
+import subprocess
+import sys
+from collections.abc import Mapping
+
+import pytest
+
+import abi3info
+from abi3info import _snapshot
+from abi3info._table import MangledTable, SymbolTable
+from abi3info.models import PartialStruct, PyVersion, Symbol
+
+
+def _run(code: str) -> str:
+    return subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout
+
+
+class TestTables:
+    def test_tables(self):
+        for name in abi3info._TABLES:
+            table = getattr(abi3info, name)
+            assert isinstance(table, Mapping)
+            assert len(table) > 0
+
+            # Subsequent accesses return the same (cached) table.
+            assert getattr(abi3info, name) is table
+
+    def test_lookup(self):
+        func = abi3info.FUNCTIONS[Symbol("PyType_FromSpec")]
+        assert func.symbol == Symbol("PyType_FromSpec")
+        assert str(func.added) == "3.2"
+
+    def test_shared_feature_macros(self):
+        func = abi3info.FUNCTIONS[Symbol("PyOS_AfterFork_Child")]
+        assert func.ifdef is abi3info.FEATURE_MACROS["HAVE_FORK"]
+
+    def test_mangled_symbols(self):
+        func = abi3info.FUNCTIONS[Symbol("PyType_FromSpec")]
+        data = abi3info.DATAS[Symbol("PyExc_TypeError")]
+
+        assert abi3info.LINUX_SYMBOLS["PyType_FromSpec"] is func
+        assert abi3info.MACOS_SYMBOLS["_PyType_FromSpec"] is func
+        assert abi3info.WINDOWS_SYMBOLS["PyType_FromSpec"] is func
+        assert abi3info.WINDOWS_IMPORT_SYMBOLS["__imp_PyType_FromSpec"] is func
+        assert abi3info.MACOS_SYMBOLS["_PyExc_TypeError"] is data
+
+        assert "PyType_FromSpec" not in abi3info.MACOS_SYMBOLS
+        assert len(abi3info.MACOS_SYMBOLS) == len(abi3info.FUNCTIONS) + len(abi3info.DATAS)
+
+    def test_symbol_keys_in_str_tables(self):
+        # `Symbol`s probing `str`-keyed tables (and vice versa) are just missing keys.
+        assert Symbol("PyBUF_READ") not in abi3info.MACROS
+        assert abi3info.MACROS.get(Symbol("PyBUF_READ")) is None
+        assert "Py_Initialize" not in set(abi3info.FUNCTIONS)
+        assert Symbol("Py_Initialize") not in set(abi3info.MACROS)
+
+    def test_lookup_by_name(self):
+        func = abi3info.FUNCTIONS[Symbol("PyType_FromSpec")]
+        assert abi3info.lookup_function("PyType_FromSpec") is func
+        assert abi3info.lookup_function(b"PyType_FromSpec") is func
+        assert abi3info.lookup_function(Symbol("PyType_FromSpec")) is func
+        assert abi3info.lookup_function(Symbol("PyExc_TypeError")) is None
+
+        data = abi3info.DATAS[Symbol("PyExc_TypeError")]
+        assert abi3info.lookup_data("PyExc_TypeError") is data
+        assert abi3info.lookup_data(b"PyExc_TypeError") is data
+        assert abi3info.lookup_data(Symbol("PyExc_TypeError")) is data
+
+        # Functions aren't data, and vice versa.
+        assert abi3info.lookup_function("PyExc_TypeError") is None
+        assert abi3info.lookup_data("PyType_FromSpec") is None
+
+        for name in ("NotASymbol", b"NotASymbol", b"\xff", "_PyType_FromSpec"):
+            assert abi3info.lookup_function(name) is None
+
+    def test_struct_members(self):
+        pyobject = abi3info.STRUCTS["PyObject"]
+        assert abi3info.STRUCT_MEMBERS["ob_refcnt"] == (pyobject,)
+        assert abi3info.STRUCT_MEMBERS["ob_refcnt"][0] is pyobject
+        assert "tp_name" not in abi3info.STRUCT_MEMBERS
+
+        # Every member of every partial struct is indexed, and nothing else.
+        expected = {
+            member: tuple(
+                struct
+                for struct in abi3info.STRUCTS.values()
+                if isinstance(struct, PartialStruct) and member in struct.members
+            )
+            for struct in abi3info.STRUCTS.values()
+            if isinstance(struct, PartialStruct)
+            for member in struct.members
+        }
+        assert dict(abi3info.STRUCT_MEMBERS) == expected
+
+        # Partial structs can be hashed.
+        assert pyobject in set(abi3info.STRUCTS.values())
+
+    def test_unknown_attribute(self):
+        with pytest.raises(AttributeError, match="has no attribute 'NOT_A_TABLE'"):
+            abi3info.NOT_A_TABLE
+
+    def test_models(self):
+        from abi3info import models
+
+        assert abi3info.Symbol is models.Symbol
+        assert abi3info.Function is models.Function
+
+    def test_dir(self):
+        attrs = dir(abi3info)
+        for name in abi3info._TABLES:
+            assert name in attrs
+
+    def test_star_import(self):
+        namespace: dict[str, object] = {}
+        exec("from abi3info import *", namespace)
+        namespace.pop("__builtins__")
+
+        assert namespace.keys() == {
+            *abi3info._TABLES,
+            *abi3info._MODELS,
+            "lookup_function",
+            "lookup_data",
+            "prepare_for_fork",
+        }
+        assert namespace["FUNCTIONS"] is abi3info.FUNCTIONS
+        assert namespace["Symbol"] is abi3info.Symbol
+
+    def test_lazy_import(self):
+        loaded = _run(
+            "import abi3info\n"
+            "from abi3info import FUNCTIONS\n"
+            "print(sorted(t for t in abi3info._TABLES if t in vars(abi3info)))\n"
+        )
+        assert loaded.strip() == "['FUNCTIONS']"
+
+    def test_no_tables_on_import(self):
+        loaded = _run(
+            "import sys\n"
+            "import abi3info\n"
+            "print(sorted(t for t in abi3info._TABLES if t in vars(abi3info)))\n"
+            "print('abi3info._internal' in sys.modules)\n"
+        )
+        assert loaded.split() == ["[]", "False"]
+
+    def test_no_indexes_on_lookup(self):
+        loaded = _run(
+            "import sys\n"
+            "import abi3info\n"
+            "abi3info.lookup_function('PyType_FromSpec')\n"
+            "print('abi3info._index' in sys.modules)\n"
+        )
+        assert loaded.strip() == "False"
+
+
+class TestPrepareForFork:
+    def test_prepare_for_fork(self, monkeypatch):
+        # Make sure we exercise both loaded and not-yet-loaded tables.
+        abi3info.FUNCTIONS
+        monkeypatch.delitem(vars(abi3info), "MACROS", raising=False)
+
+        try:
+            abi3info.prepare_for_fork()
+            assert gc.get_freeze_count() > 0
+        finally:
+            gc.unfreeze()
+
+        assert "abi3info.names" in sys.modules
+        for loader in _snapshot._VERSIONED_LOADERS:
+            assert None in _snapshot.version_index(loader)._sorted
+        for index in (
+            "symbol_versions",
+            "symbol_ids",
+            "version_masks",
+            "feature_macro_masks",
+            "name_index",
+        ):
+            assert index in _snapshot._CACHE
+        for name in abi3info._TABLES:
+            table = vars(abi3info)[name]
+            if isinstance(table, MangledTable):
+                # Every mangled name (and entry) has already been built.
+                assert len(table._entries) == len(table)
+                for symbol in abi3info.FUNCTIONS:
+                    assert hasattr(symbol, "_macos")
+                    assert hasattr(symbol, "_windows_import")
+                continue
+
+            # Every value (and every key) has already been built.
+            assert len(table._values) == len(table)
+            if name in ("FUNCTIONS", "DATAS"):
+                # ...and hashed.
+                assert all(hasattr(value, "_hash") for value in table.values())
+            if isinstance(table, SymbolTable):
+                assert len(table._symbols) == len(table)
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork")
+    def test_no_mutation_after_fork(self):
+        # Forked children see fully built tables, and reading them populates nothing.
+        output = _run(
+            "import os\n"
+            "import abi3info\n"
+            "abi3info.prepare_for_fork()\n"
+            "tables = [getattr(abi3info, name) for name in abi3info._TABLES]\n"
+            "def state(t):\n"
+            "    values = getattr(t, '_values', {}).values()\n"
+            "    hashed = sum(hasattr(value, '_hash') for value in values)\n"
+            "    return len(values), len(getattr(t, '_symbols', ())), hashed\n"
+            "def sizes(t):\n"
+            "    return state(t), len(getattr(t, '_entries', ()))\n"
+            "before = list(map(sizes, tables))\n"
+            "read, write = os.pipe()\n"
+            "if (pid := os.fork()) == 0:\n"
+            "    for table in tables:\n"
+            "        dict(table.items())\n"
+            "        set(table.values())\n"
+            "    after = list(map(sizes, tables))\n"
+            "    os.write(write, str(after == before).encode())\n"
+            "    os._exit(0)\n"
+            "os.waitpid(pid, 0)\n"
+            "print(os.read(read, 16).decode())\n"
+        )
+        assert output.strip() == "True"
+
+
+class TestPickle:
+    @pytest.mark.parametrize(
+        ("table", "key"),
+        [
+            ("DATAS", Symbol("PyExc_TypeError")),
+            ("FEATURE_MACROS", "HAVE_FORK"),
+            ("FUNCTIONS", Symbol("PyOS_AfterFork_Child")),
+            ("MACROS", "PyBUF_READ"),
+            ("STRUCTS", "PyObject"),
+            ("STRUCTS", "PyModuleDef"),
+            ("STRUCTS", "PyThreadState"),
+            ("TYPEDEFS", "allocfunc"),
+        ],
+    )
+    def test_canonical_by_reference(self, table, key):
+        entry = getattr(abi3info, table)[key]
+
+        pickled = pickle.dumps(entry)
+        assert pickle.loads(pickled) is entry
+
+        # The pickle is just a reference, and much smaller than a copy's.
+        copied = dataclasses.replace(entry)
+        assert copied == entry
+        assert len(pickled) < len(pickle.dumps(copied))
+        assert pickle.loads(pickle.dumps(copied)) is not entry
+
+    def test_canonical_across_processes(self):
+        entries = [
+            abi3info.FUNCTIONS[Symbol("PyOS_AfterFork_Child")],
+            abi3info.FEATURE_MACROS["HAVE_FORK"],
+        ]
+        output = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import pickle, sys\n"
+                "import abi3info\n"
+                "from abi3info.models import Symbol\n"
+                "func, macro = pickle.load(sys.stdin.buffer)\n"
+                "print(func is abi3info.FUNCTIONS[Symbol('PyOS_AfterFork_Child')])\n"
+                "print(macro is abi3info.FEATURE_MACROS['HAVE_FORK'] is func.ifdef)\n",
+            ],
+            input=pickle.dumps(entries),
+            check=True,
+            capture_output=True,
+        ).stdout
+        assert output.split() == [b"True", b"True"]
+
+    def test_versions(self):
+        interned = PyVersion.intern(3, 2)
+        assert pickle.loads(pickle.dumps(interned)) is interned
+
+        version = PyVersion(3, 2)
+        assert version is not interned
+        unpickled = pickle.loads(pickle.dumps(version))
+        assert unpickled == version
+        assert unpickled is not version
+        assert unpickled is not interned
+
+    @pytest.mark.parametrize("name", list(abi3info._TABLES))
+    def test_tables_by_reference(self, name):
+        table = getattr(abi3info, name)
+
+        assert copy.copy(table) is table
+        assert copy.deepcopy(table) is table
+
+        pickled = pickle.dumps(table)
+        assert pickle.loads(pickled) is table
+        assert len(pickled) < 100
+
+    def test_indexes_by_reference(self):
+        for index in [_snapshot.version_index("functions"), _snapshot.name_index()]:
+            assert copy.deepcopy(index) is index
+            assert pickle.loads(pickle.dumps(index)) is index
+
+    def test_tables_across_processes(self):
+        output = _run(
+            "import pickle, sys\n"
+            "import abi3info\n"
+            f"functions = pickle.loads({pickle.dumps(abi3info.FUNCTIONS)!r})\n"
+            "print(functions is abi3info.FUNCTIONS)\n"
+        )
+        assert output.strip() == "True"
+
+    def test_bad_reference(self):
+        with pytest.raises(ValueError, match="not a table"):
+            _snapshot._entry("_load", "foo")
+
+        for key in ["_load", "foo", "foo_by_version", "functions_by_version_"]:
+            with pytest.raises(ValueError, match="not a table"):
+                _snapshot._restore(key)
@@ -0,0 +1,61 @@
+import threading
+
+import pytest
+
+import abi3info
+from abi3info import _snapshot
+
+# Enough threads and rounds to reliably provoke races on free-threaded builds,
+# while staying fast on GIL builds.
+_THREADS = 16
+_ROUNDS = 20
+
+
+def _race(func):
+    """
+    Runs `func` from many threads at once, returning each thread's result.
+    """
+    barrier = threading.Barrier(_THREADS)
+    results = [None] * _THREADS
+
+    def worker(idx):
+        barrier.wait()
+        results[idx] = func()
+
+    threads = [threading.Thread(target=worker, args=(idx,)) for idx in range(_THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return results
+
+
+@pytest.mark.parametrize("_round", range(_ROUNDS))
+def test_concurrent_table_reads(_round):
+    table = _snapshot.functions()
+
+    results = _race(lambda: [table[key] for key in list(table)])
+
+    # Every thread saw the same model objects.
+    first = results[0]
+    for result in results[1:]:
+        assert len(result) == len(first)
+        assert all(a is b for a, b in zip(result, first))
+
+
+@pytest.mark.parametrize("_round", range(_ROUNDS))
+def test_concurrent_cached_loads(monkeypatch, _round):
+    monkeypatch.setattr(_snapshot, "_CACHE", {})
+
+    results = _race(_snapshot.feature_macros)
+    assert all(result is results[0] for result in results)
+
+
+@pytest.mark.parametrize("_round", range(_ROUNDS))
+def test_concurrent_top_level_loads(monkeypatch, _round):
+    monkeypatch.delitem(vars(abi3info), "MACROS", raising=False)
+
+    results = _race(lambda: abi3info.MACROS)
+    assert all(result is results[0] for result in results)
+    assert abi3info.MACROS is results[0]
@@ -0,0 +1,86 @@
+import pytest
+
+from abi3info._index import NameIndex, VersionIndex
+from abi3info._table import Table
+from abi3info.models import PyVersion
+
+
+class TestVersionIndex:
+    def _index(self):
+        table = Table(("a", "b", "c", "d"), lambda idx, name: name)
+        added = [PyVersion(3, 5), PyVersion(3, 2), PyVersion(3, 5), PyVersion(3, 3)]
+        return VersionIndex(table, [version.to_hex() for version in added])
+
+    def test_at(self):
+        index = self._index()
+
+        assert index.at(PyVersion(3, 1)) == ()
+        assert index.at(PyVersion(3, 2)) == ("b",)
+        assert index.at(PyVersion(3, 4)) == ("b", "d")
+        # Rows added in the same version stay in table order.
+        assert index.at(PyVersion(3, 5)) == ("b", "d", "a", "c")
+
+    def test_between(self):
+        index = self._index()
+
+        assert index.between(PyVersion(3, 2), PyVersion(3, 5)) == ("d", "a", "c")
+        assert index.between(PyVersion(3, 3), PyVersion(3, 4)) == ()
+        assert index.between(PyVersion(3, 5), PyVersion(3, 2)) == ()
+
+    def test_lazy(self):
+        index = self._index()
+        assert index._table._values == {}
+
+        index.at(PyVersion(3, 2))
+        assert len(index._table._values) == 4
+        assert index._values() is index._values()
+
+    def test_immutable(self):
+        with pytest.raises(AttributeError, match="VersionIndex is immutable"):
+            self._index()._codes = ()
+
+
+class TestNameIndex:
+    def _tables(self):
+        return (
+            Table(("PyFoo_Bar", "PyFoo", "Baz"), lambda idx, name: ("a", name)),
+            Table(("PyFoo", "\U0010ffff", "PyFop"), lambda idx, name: ("b", name)),
+        )
+
+    def _index(self):
+        return NameIndex(self._tables())
+
+    def test_prefix(self):
+        index = self._index()
+
+        # Names in both tables are ordered by table.
+        assert list(index.prefix("PyFoo")) == [("a", "PyFoo"), ("b", "PyFoo"), ("a", "PyFoo_Bar")]
+        assert list(index.prefix("PyFo")) == [
+            ("a", "PyFoo"),
+            ("b", "PyFoo"),
+            ("a", "PyFoo_Bar"),
+            ("b", "PyFop"),
+        ]
+        assert list(index.prefix("PyFoo_Baz")) == []
+        assert list(index.prefix("\U0010ffff")) == [("b", "\U0010ffff")]
+        assert len(list(index.prefix(""))) == 6
+
+    def test_glob(self):
+        index = self._index()
+
+        assert list(index.glob("PyFo?")) == [("a", "PyFoo"), ("b", "PyFoo"), ("b", "PyFop")]
+        assert list(index.glob("*a*")) == [("a", "Baz"), ("a", "PyFoo_Bar")]
+        assert list(index.glob("PyFoo[_]*")) == [("a", "PyFoo_Bar")]
+        assert list(index.glob("pyfoo")) == []
+
+    def test_lazy(self):
+        tables = self._tables()
+        results = NameIndex(tables).prefix("PyFoo")
+        assert [table._values for table in tables] == [{}, {}]
+
+        assert next(results) == ("a", "PyFoo")
+        assert [table._values for table in tables] == [{1: ("a", "PyFoo")}, {}]
+
+    def test_immutable(self):
+        with pytest.raises(AttributeError, match="NameIndex is immutable"):
+            self._index()._names = ()
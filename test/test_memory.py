@@ -0,0 +1,54 @@
+import gc
+import sysconfig
+import tracemalloc
+
+import pytest
+
+from abi3info import _snapshot
+
+# The maximum number of bytes that each fully built table may allocate,
+# including its keys, its models, and its caches (but not the snapshot itself,
+# or interned `PyVersion`s and shared `FeatureMacro`s already built elsewhere).
+#
+# These leave roughly 20% headroom over the largest of the measured sizes on
+# CPython 3.10 through 3.13, which is small enough that losing `__slots__` on
+# the models (or otherwise adding per-row overhead) pushes each table over budget.
+_BUDGETS = {
+    "datas": 63_000,
+    "feature_macros": 3_500,
+    "functions": 421_000,
+    "macros": 48_500,
+    "structs": 8_000,
+    "typedefs": 12_700,
+}
+
+
+# NOTE: Free-threaded builds have larger object headers (and so larger tables),
+# and the budgets haven't been measured on them.
+@pytest.mark.skipif(
+    bool(sysconfig.get_config_var("Py_GIL_DISABLED")),
+    reason="budgets are only measured on default (GIL) builds",
+)
+@pytest.mark.parametrize(("name", "budget"), _BUDGETS.items())
+def test_table_memory_budget(name, budget):
+    # Load the snapshot (and shared feature macros) outside of the measurement,
+    # along with the table itself, so that every `PyVersion` it refers to is
+    # already interned (and cached by `PyVersion.decode_version`).
+    _snapshot._load()
+    _snapshot.feature_macros()
+    getattr(_snapshot, name)()._build_all()
+
+    # Bypass the cache, so that we measure a freshly loaded table.
+    loader = getattr(_snapshot, name).__wrapped__
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        table = loader()
+        table._build_all()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert len(table) > 0
+    assert size <= budget, f"{name}: {size} bytes exceeds budget of {budget} bytes"
@@ -1,7 +1,12 @@
+import copy
+import dataclasses
 import itertools
+import operator
+import pickle
 
 import pytest
 
+from abi3info import models
 from abi3info.models import (
     Data,
     FeatureMacro,
@@ -26,6 +31,25 @@ class TestSymbol:
         assert sym.name == "foo"
         assert sym.macos == "_foo"
         assert sym.linux == "foo"
+        assert sym.windows == "foo"
+        assert sym.windows_import == "__imp_foo"
+
+    def test_symbol_mangled_names_cached(self):
+        sym = Symbol("foo")
+        assert not hasattr(sym, "_macos")
+        assert not hasattr(sym, "_windows_import")
+
+        # Mangled names are only built once.
+        assert sym.macos is sym.macos
+        assert sym.windows_import is sym.windows_import
+        assert sym._macos == "_foo"
+        assert sym._windows_import == "__imp_foo"
+
+        # ...and don't affect equality, hashing, the repr, or the fields.
+        assert sym == Symbol("foo")
+        assert hash(sym) == hash(Symbol("foo"))
+        assert repr(sym) == repr(Symbol("foo"))
+        assert dataclasses.asdict(sym) == {"name": "foo", "visibility": None}
 
     def test_symbol_equality(self):
         foo1, foo2 = Symbol("foo"), Symbol("foo")
@@ -37,6 +61,29 @@ class TestSymbol:
         with pytest.raises(TypeError):
             assert foo1 == "foo"
 
+    def test_symbol_hash(self):
+        sym = Symbol("foo")
+        assert not hasattr(sym, "_hash")
+        assert hash(sym) == hash(("foo",))
+        assert sym._hash == hash(("foo",))
+        assert hash(sym) == hash(("foo",))
+
+        # Symbols built for tables have their hashes precomputed.
+        assert Symbol.from_row(("foo", None))._hash == hash(("foo",))
+
+        # Symbols never hash like their names, so probing `str`-keyed
+        # collections with them never compares a `Symbol` against a `str`.
+        assert hash(Symbol("foo")) != hash("foo")
+        assert Symbol("foo") not in {"foo"}
+        assert "foo" not in {Symbol("foo")}
+
+    def test_symbol_pickle(self):
+        sym = Symbol("foo", visibility="weak")
+        clone = pickle.loads(pickle.dumps(sym))
+        assert clone == sym
+        assert clone.visibility == "weak"
+        assert hash(clone) == hash(sym)
+
     def test_symbol_hashing_visibility_invariance(self):
         sym1 = Symbol("foo")
         sym2 = Symbol("foo", visibility="hidden")
@@ -78,6 +125,91 @@ class TestPyVersion:
         assert older_major >= older_major
         assert older_major <= older_major
 
+    def test_comparison_other_types(self):
+        version = PyVersion(3, 2)
+        for op in (operator.lt, operator.le, operator.gt, operator.ge):
+            with pytest.raises(TypeError):
+                op(version, (3, 2))
+
+    def test_sort(self):
+        versions = [PyVersion(3, 10), PyVersion(2, 7), PyVersion(3, 9), PyVersion(3, 2)]
+        assert sorted(versions) == [
+            PyVersion(2, 7),
+            PyVersion(3, 2),
+            PyVersion(3, 9),
+            PyVersion(3, 10),
+        ]
+        assert max(versions) == PyVersion(3, 10)
+        assert min(versions) == PyVersion(2, 7)
+
+    def test_hash(self):
+        assert hash(PyVersion(3, 10)) == hash(PyVersion.intern(3, 10))
+        assert len({PyVersion(3, 10), PyVersion.intern(3, 10), PyVersion(3, 9)}) == 2
+
+    def test_hex(self):
+        assert PyVersion(3, 10).to_hex() == 0x030A0000
+        assert PyVersion(2, 7).to_hex() == 0x02070000
+        assert PyVersion.from_hex(0x030AFFFF) is PyVersion.intern(3, 10)
+
+        for version in (PyVersion(2, 7), PyVersion(3, 2), PyVersion(3, 14)):
+            assert PyVersion.from_hex(version.to_hex()) == version
+            assert PyVersion.decode_version(version.to_hex()) == version
+
+    @pytest.mark.parametrize(("major", "minor"), [(3, 256), (256, 0), (-1, 0), (3, -1)])
+    def test_out_of_range(self, major, minor):
+        with pytest.raises(ValueError, match="version out of range"):
+            PyVersion(major, minor)
+        with pytest.raises(ValueError, match="version out of range"):
+            PyVersion.intern(major, minor)
+
+        assert PyVersion(255, 255).to_hex() == 0xFFFF0000
+
+    def test_fields(self):
+        version = PyVersion(3, 2)
+        assert [f.name for f in dataclasses.fields(version)] == ["major", "minor"]
+        assert dataclasses.astuple(version) == (3, 2)
+        assert dataclasses.asdict(version) == {"major": 3, "minor": 2}
+
+    def test_parser_cache(self):
+        PyVersion.parser_cache_clear()
+        try:
+            for _ in range(3):
+                assert PyVersion.parse_dotted("3.2") is PyVersion.intern(3, 2)
+                assert PyVersion.parse_python_tag("cp38") is PyVersion.intern(3, 8)
+                assert PyVersion.decode_version(0x030800F0) is PyVersion.intern(3, 8)
+
+            # Failures aren't cached.
+            with pytest.raises(ValueError):
+                PyVersion.parse_dotted("3")
+
+            info = PyVersion.parser_cache_info()
+            assert set(info) == {"decode_version", "parse_dotted", "parse_python_tag"}
+            for name, stats in info.items():
+                assert stats.maxsize == models._PARSER_CACHE_SIZE
+                assert stats.hits == 2
+                assert stats.misses == (2 if name == "parse_dotted" else 1)
+                assert stats.currsize == 1
+
+            PyVersion.parser_cache_clear()
+            for stats in PyVersion.parser_cache_info().values():
+                assert stats.hits == stats.misses == stats.currsize == 0
+
+            # Clearing the caches doesn't affect interning.
+            assert PyVersion.parse_dotted("3.2") is PyVersion.intern(3, 2)
+        finally:
+            PyVersion.parser_cache_clear()
+
+    def test_parser_cache_bounded(self):
+        PyVersion.parser_cache_clear()
+        try:
+            for n in range(models._PARSER_CACHE_SIZE * 2):
+                PyVersion.parse_dotted(f"{n // 256}.{n % 256}")
+
+            info = PyVersion.parser_cache_info()["parse_dotted"]
+            assert info.currsize == models._PARSER_CACHE_SIZE
+        finally:
+            PyVersion.parser_cache_clear()
+
     def test_decode_version(self):
         assert PyVersion.decode_version(0x030401A2) == PyVersion(3, 4)
         assert PyVersion.decode_version(0x0304FFFF) == PyVersion(3, 4)
@@ -115,6 +247,22 @@ class TestPyVersion:
         with pytest.raises(ValueError):
             PyVersion.parse_python_tag("cp10_11")
 
+    def test_intern(self):
+        v3_2 = PyVersion.intern(3, 2)
+        assert v3_2 == PyVersion(3, 2)
+        assert v3_2 is PyVersion.intern(3, 2)
+        assert v3_2 is not PyVersion(3, 2)
+
+    def test_parsers_intern(self):
+        v3_8 = PyVersion.intern(3, 8)
+        assert PyVersion.parse_dotted("3.8") is v3_8
+        assert PyVersion.parse_python_tag("cp38") is v3_8
+        assert PyVersion.decode_version(0x030800F0) is v3_8
+
+    def test_equality_other_types(self):
+        assert PyVersion(3, 2) != (3, 2)
+        assert PyVersion(3, 2) != "3.2"
+
     def test_version_to_str(self):
         assert str(PyVersion(3, 2)) == "3.2"
         assert f"{PyVersion(3, 2)}" == "3.2"
@@ -139,6 +287,24 @@ class TestPartialStruct:
                 "foo", PyVersion(3, 10), members
             )
 
+    def test_hashable(self):
+        struct = PartialStruct("foo", PyVersion(3, 10), ("bar", "baz"))
+        assert hash(struct) == hash(PartialStruct("foo", PyVersion(3, 10), ("bar", "baz")))
+        assert len({struct, PartialStruct("foo", PyVersion(3, 10), ("bar", "baz"))}) == 1
+
+    def test_members_tuple(self):
+        members = ["bar", "baz"]
+        struct = PartialStruct("foo", PyVersion(3, 10), members)
+
+        assert struct.members == ("bar", "baz")
+        assert struct == PartialStruct("foo", PyVersion(3, 10), ("bar", "baz"))
+        assert hash(struct) == hash(PartialStruct("foo", PyVersion(3, 10), ("bar", "baz")))
+
+        # The struct doesn't share (or follow) the caller's list.
+        members.append("qux")
+        assert struct.members == ("bar", "baz")
+        assert copy.deepcopy(struct).members == ("bar", "baz")
+
 
 class TestFullStruct:
     def test_homoiconic(self):
@@ -178,3 +344,116 @@ class TestData:
 class TestTypedef:
     def test_homoiconic(self):
         assert eval(repr(Typedef("foo", PyVersion(3, 10)))) == Typedef("foo", PyVersion(3, 10))
+
+
+_MODELS = [
+    Symbol("foo"),
+    PyVersion(3, 2),
+    Macro("foo", PyVersion(3, 2)),
+    OpaqueStruct("foo", PyVersion(3, 2)),
+    PartialStruct("foo", PyVersion(3, 2), ("bar",)),
+    FullStruct("foo", PyVersion(3, 2)),
+    FeatureMacro("foo", "bar", False),
+    Function(Symbol("foo"), PyVersion(3, 2), None, False),
+    Data(Symbol("foo"), PyVersion(3, 2), None, False),
+    Typedef("foo", PyVersion(3, 2)),
+]
+
+
+@pytest.mark.parametrize("model", _MODELS)
+def test_slotted(model):
+    assert not hasattr(model, "__dict__")
+    assert eval(repr(model)) == model
+
+
+@pytest.mark.parametrize("model", _MODELS)
+def test_copy_is_identity(model):
+    assert copy.copy(model) is model
+    assert copy.deepcopy(model) is model
+    assert copy.deepcopy([model, model]) == [model, model]
+
+
+@pytest.mark.parametrize("model", _MODELS)
+def test_equality(model):
+    assert model == model
+
+    # Equal (but not identical) models still compare equal.
+    if not isinstance(model, (Symbol, PyVersion)):
+        assert model != object()
+        other = dataclasses.replace(model)
+        assert other is not model
+        assert model == other
+
+
+@pytest.mark.parametrize("cls", [Function, Data])
+def test_cached_hash(cls):
+    model = cls(Symbol("foo"), PyVersion(3, 2), FeatureMacro("bar", "baz", True), False)
+    assert not hasattr(model, "_hash")
+
+    expected = hash((model.symbol, model.added, model.ifdef, model.abi_only))
+    assert hash(model) == expected
+    assert model._hash == expected
+    assert hash(model) == expected
+
+    # The cached hash doesn't participate in equality.
+    assert model == cls(model.symbol, model.added, model.ifdef, model.abi_only)
+
+    # Pickles are rebuilt from their fields, and rehash from scratch.
+    clone = pickle.loads(pickle.dumps(model))
+    assert clone == model
+    assert not hasattr(clone, "_hash")
+    assert hash(clone) == expected
+
+
+@pytest.mark.parametrize(
+    ("model", "fields"),
+    [
+        (Symbol("foo"), ("foo", None)),
+        (
+            Function(Symbol("foo"), PyVersion(3, 2), None, False),
+            (Symbol("foo"), PyVersion(3, 2), None, False),
+        ),
+        (
+            Data(Symbol("foo"), PyVersion(3, 2), None, True),
+            (Symbol("foo"), PyVersion(3, 2), None, True),
+        ),
+    ],
+)
+def test_caches_are_not_fields(model, fields):
+    # Populate the caches.
+    hash(model)
+
+    assert "_hash" not in {f.name for f in dataclasses.fields(model)}
+    assert dataclasses.astuple(model) == dataclasses.astuple(type(model)(*fields))
+    assert "_hash" not in dataclasses.asdict(model)
+    assert "_hash" not in repr(model)
+
+
+@pytest.mark.parametrize(
+    ("cls", "row"),
+    [
+        (Symbol, ("foo", None)),
+        (Symbol, ("foo", "weak")),
+        (Macro, ("foo", PyVersion(3, 2))),
+        (OpaqueStruct, ("foo", PyVersion(3, 2))),
+        (PartialStruct, ("foo", PyVersion(3, 2), ("bar", "baz"))),
+        (PartialStruct, ("foo", PyVersion(3, 2), ["bar", "baz"])),
+        (FullStruct, ("foo", PyVersion(3, 2))),
+        (FeatureMacro, ("foo", "some doc", "maybe")),
+        (Function, (Symbol("foo"), PyVersion(3, 2), FeatureMacro("bar", "baz", True), False)),
+        (Data, (Symbol("foo"), PyVersion(3, 2), None, True)),
+        (Typedef, ("foo", PyVersion(3, 2))),
+    ],
+)
+def test_from_row(cls, row):
+    model = cls.from_row(row)
+    expected = cls(*row)
+
+    # Every slot (including the non-`__init__` ones) is set, to the same value.
+    for f in dataclasses.fields(cls):
+        assert getattr(model, f.name) == getattr(expected, f.name)
+
+    assert type(model) is cls
+    assert model == expected
+    assert repr(model) == repr(expected)
+    assert hash(model) == hash(expected)
@@ -0,0 +1,41 @@
+import subprocess
+import sys
+
+import abi3info
+from abi3info import names
+
+
+def test_names_match_tables():
+    assert {sym.name for sym in abi3info.FUNCTIONS} == names.FUNCTIONS
+    assert {sym.name for sym in abi3info.DATAS} == names.DATAS
+    assert {
+        item.symbol.name
+        for item in [*abi3info.FUNCTIONS.values(), *abi3info.DATAS.values()]
+        if item.abi_only
+    } == names.ABI_ONLY
+    assert set(abi3info.FEATURE_MACROS) == names.FEATURE_MACROS
+    assert set(abi3info.MACROS) == names.MACROS
+    assert set(abi3info.STRUCTS) == names.STRUCTS
+    assert set(abi3info.TYPEDEFS) == names.TYPEDEFS
+
+
+def test_names_membership():
+    assert "PyType_FromSpec" in names.FUNCTIONS
+    assert "PyType_FromSpec" not in names.DATAS
+    assert "_Py_NegativeRefcount" in names.ABI_ONLY
+
+
+def test_names_import_is_cheap():
+    loaded = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys\n"
+            "import abi3info.names\n"
+            "print(sorted(m for m in ('abi3info.models', 'typing') if m in sys.modules))\n",
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    assert loaded.strip() == "[]"
@@ -0,0 +1,48 @@
+import fnmatch
+
+import pytest
+
+import abi3info
+from abi3info.models import Data, Function
+from abi3info.search import glob, prefix
+
+
+def _name(member):
+    return member.symbol.name if isinstance(member, (Function, Data)) else member.name
+
+
+def _scan(matches):
+    # The brute-force equivalent of each search, ordered the same way.
+    members = [
+        member
+        for table in ("FUNCTIONS", "DATAS", "MACROS", "TYPEDEFS", "STRUCTS")
+        for member in getattr(abi3info, table).values()
+        if matches(_name(member))
+    ]
+    return sorted(members, key=_name)
+
+
+@pytest.mark.parametrize("value", ["PyUnicode_", "PyObject", "Py", "", "Py_", "PyFoo", "~"])
+def test_prefix(value):
+    results = prefix(value)
+    assert iter(results) is results
+
+    results = list(results)
+    assert results == _scan(lambda name: name.startswith(value))
+    for a, b in zip(results, _scan(lambda name: name.startswith(value))):
+        assert a is b
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    ["PyType_*Slot*", "PyUnicode_*", "*Slot*", "Py?ype_*", "Py[LT]*_New", "PyType_Slot", "*", "x*"],
+)
+def test_glob(pattern):
+    results = glob(pattern)
+    assert iter(results) is results
+    assert list(results) == _scan(lambda name: fnmatch.fnmatchcase(name, pattern))
+
+
+def test_glob_case_sensitive():
+    assert list(glob("pytype_*")) == []
+    assert list(glob("PyType_*"))
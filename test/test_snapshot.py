@@ -0,0 +1,126 @@
+import mmap
+import subprocess
+import sys
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from abi3info import _snapshot
+from abi3info._internal import (
+    _datas,
+    _feature_macros,
+    _functions,
+    _macros,
+    _structs,
+    _typedefs,
+)
+from abi3info.models import PyVersion
+
+
+@pytest.mark.parametrize(
+    ("loader", "expected"),
+    [
+        (_snapshot.feature_macros, _feature_macros._FEATURE_MACROS),
+        (_snapshot.structs, _structs._STRUCTS),
+        (_snapshot.functions, _functions._FUNCTIONS),
+        (_snapshot.macros, _macros._MACROS),
+        (_snapshot.datas, _datas._DATAS),
+        (_snapshot.typedefs, _typedefs._TYPEDEFS),
+    ],
+)
+def test_snapshot_matches_source(loader, expected):
+    table = loader()
+
+    # NOTE: Compared as lists of items to also check that the tables are
+    # in the same order.
+    assert list(table.items()) == list(expected.items())
+
+
+def test_snapshot_interns_versions():
+    for table in (_snapshot.structs(), _snapshot.functions(), _snapshot.macros()):
+        for item in table.values():
+            assert item.added is PyVersion.intern(item.added.major, item.added.minor)
+
+
+def test_snapshot_shares_feature_macros():
+    feature_macros = _snapshot.feature_macros()
+    for table in (_snapshot.functions(), _snapshot.datas()):
+        for item in table.values():
+            if item.ifdef is not None:
+                assert item.ifdef is feature_macros[item.ifdef.name]
+
+
+def test_source_shares_feature_macros():
+    feature_macros = _feature_macros._FEATURE_MACROS
+    for table in (_functions._FUNCTIONS, _datas._DATAS):
+        for item in table.values():
+            if item.ifdef is not None:
+                assert item.ifdef is feature_macros[item.ifdef.name]
+
+
+def test_snapshot_struct_members(monkeypatch):
+    added = PyVersion(3, 2).to_hex()
+    columns = {
+        "names": ("PyFoo", "PyBar", "PyBaz"),
+        "kind": (2, 2, 0),
+        "added": (added, added, added),
+        "members": ("", "bar baz", ""),
+    }
+    monkeypatch.setattr(_snapshot, "_load", lambda: {"structs": columns})
+    monkeypatch.setattr(_snapshot, "_CACHE", {})
+
+    # A partial struct with no stable members has no members, not an empty one.
+    structs = _snapshot.structs()
+    assert structs["PyFoo"].members == ()
+    assert structs["PyBar"].members == ("bar", "baz")
+
+    members = _snapshot.struct_members()
+    assert dict(members) == {"bar": (structs["PyBar"],), "baz": (structs["PyBar"],)}
+
+
+def test_snapshot_is_mapped():
+    assert isinstance(_snapshot._open(), mmap.mmap)
+
+
+def test_snapshot_resources_fallback(monkeypatch):
+    # Simulate an install where the snapshot isn't a file on disk.
+    monkeypatch.setattr(_snapshot.os.path, "dirname", lambda _: "/nonexistent")
+
+    buf = _snapshot._open()
+    assert isinstance(buf, bytes)
+    assert buf.startswith(_snapshot._MAGIC)
+
+
+def test_snapshot_bad_header(monkeypatch):
+    monkeypatch.setattr(_snapshot, "_open", lambda: bytes(_snapshot._HEADER.size))
+    monkeypatch.setattr(_snapshot, "_CACHE", {})
+
+    with pytest.raises(ValueError, match="unsupported snapshot"):
+        _snapshot._load()
+
+
+def test_snapshot_zipimport(tmp_path):
+    package = Path(_snapshot.__file__).parent
+    archive = tmp_path / "abi3info.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        for path in package.rglob("*"):
+            if path.suffix in (".py", ".bin"):
+                zf.write(path, path.relative_to(package.parent))
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import abi3info\n"
+            "from abi3info.models import Symbol\n"
+            "assert '.zip' in abi3info.__file__\n"
+            "print(abi3info.FUNCTIONS[Symbol('PyType_FromSpec')].added)\n",
+        ],
+        env={"PYTHONPATH": str(archive)},
+        cwd=tmp_path,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    assert result.stdout.strip() == "3.2"
@@ -0,0 +1,204 @@
+import itertools
+
+import pytest
+
+import abi3info
+from abi3info import _snapshot
+from abi3info.models import PyVersion, Symbol
+from abi3info.surface import (
+    RequiredVersion,
+    Surface,
+    added_between,
+    feature_macro_mask,
+    from_bitmap,
+    mask_at,
+    required_version,
+    surface_at,
+    symbol_count,
+    symbol_id,
+    to_bitmap,
+    to_mask,
+    to_names,
+)
+
+_VERSIONS = [PyVersion(3, minor) for minor in range(0, 16)]
+
+_TABLES = {
+    "functions": "FUNCTIONS",
+    "datas": "DATAS",
+    "macros": "MACROS",
+    "typedefs": "TYPEDEFS",
+    "structs": "STRUCTS",
+}
+
+
+def _scan(matches) -> Surface:
+    # The brute-force equivalent of each query, ordered the same way.
+    return Surface(
+        **{
+            field: tuple(
+                sorted(
+                    (entry for entry in getattr(abi3info, table).values() if matches(entry.added)),
+                    key=lambda entry: entry.added,
+                )
+            )
+            for field, table in _TABLES.items()
+        }
+    )
+
+
+@pytest.mark.parametrize("version", _VERSIONS)
+def test_surface_at(version):
+    surface = surface_at(version)
+    assert surface == _scan(lambda added: added <= version)
+
+    # The results are the tables' own entries.
+    for field, table in _TABLES.items():
+        entries = getattr(abi3info, table)
+        for entry in getattr(surface, field):
+            key = entry.symbol if field in ("functions", "datas") else entry.name
+            assert entries[key] is entry
+
+
+def test_surface_at_bounds():
+    assert surface_at(PyVersion(2, 7)) == Surface((), (), (), (), ())
+
+    latest = surface_at(PyVersion(4, 0))
+    for field, table in _TABLES.items():
+        assert len(getattr(latest, field)) == len(getattr(abi3info, table))
+
+
+@pytest.mark.parametrize(("start", "end"), list(itertools.combinations(_VERSIONS[::3], 2)))
+def test_added_between(start, end):
+    assert added_between(start, end) == _scan(lambda added: start < added <= end)
+
+
+def test_added_between_empty():
+    assert added_between(PyVersion(3, 10), PyVersion(3, 9)) == Surface((), (), (), (), ())
+    assert added_between(PyVersion(3, 10), PyVersion(3, 10)) == Surface((), (), (), (), ())
+
+
+def test_version_index_cached():
+    for loader in _snapshot._VERSIONED_LOADERS:
+        assert _snapshot.version_index(loader) is _snapshot.version_index(loader)
+
+
+def test_required_version():
+    symbols = ["Py_Initialize", b"PyType_FromSpec", "not_a_symbol", Symbol("PyExc_TypeError")]
+    required = required_version(symbols)
+
+    assert required.version == max(
+        abi3info.FUNCTIONS[Symbol("Py_Initialize")].added,
+        abi3info.FUNCTIONS[Symbol("PyType_FromSpec")].added,
+        abi3info.DATAS[Symbol("PyExc_TypeError")].added,
+    )
+    assert required.non_abi == ("not_a_symbol",)
+
+
+def test_required_version_floor():
+    table = abi3info.FUNCTIONS
+    latest = max(function.added for function in table.values())
+    expected = tuple(symbol.name for symbol, function in table.items() if function.added == latest)
+
+    # Every function, in every accepted form, with duplicates.
+    symbols = [
+        *table,
+        *(symbol.name for symbol in table),
+        *(symbol.name.encode() for symbol in table),
+        b"\xff",
+        "PyFoo",
+    ]
+    required = required_version(symbols)
+
+    assert required.version == latest
+    assert required.version is PyVersion.intern(latest.major, latest.minor)
+    assert required.floor == expected
+    assert required.non_abi == ("\ufffd", "PyFoo")
+
+
+def test_required_version_empty():
+    assert required_version(iter([])) == RequiredVersion(None, (), ())
+    assert required_version(["PyFoo", b"PyFoo"]) == RequiredVersion(None, (), ("PyFoo",))
+
+
+def _symbols():
+    return [*abi3info.FUNCTIONS.values(), *abi3info.DATAS.values()]
+
+
+def test_symbol_id():
+    symbols = _symbols()
+    assert symbol_count() == len(symbols)
+
+    for idx, entry in enumerate(symbols):
+        assert symbol_id(entry.symbol) == idx
+        assert symbol_id(entry.symbol.name) == idx
+        assert symbol_id(entry.symbol.name.encode()) == idx
+
+    assert symbol_id("PyFoo") is None
+
+
+def test_mask_roundtrip():
+    names = ("Py_Initialize", "PyType_FromSpec", "PyExc_TypeError")
+    mask = to_mask([*names, b"Py_Initialize", "PyFoo"])
+
+    assert mask.bit_count() == len(names)
+    assert set(to_names(mask)) == set(names)
+    # Names come back in symbol ID order.
+    assert to_names(mask) == tuple(sorted(names, key=symbol_id))
+    assert to_names(0) == ()
+
+    everything = (1 << symbol_count()) - 1
+    assert to_names(everything) == tuple(entry.symbol.name for entry in _symbols())
+
+
+def test_bitmap_roundtrip():
+    mask = to_mask(["Py_Initialize", "PyExc_TypeError"])
+    bitmap = to_bitmap(mask)
+
+    assert isinstance(bitmap, bytearray)
+    assert len(bitmap) == (symbol_count() + 7) // 8
+    idx = symbol_id("PyExc_TypeError")
+    assert bitmap[idx // 8] & 1 << idx % 8
+
+    assert from_bitmap(bitmap) == mask
+    assert from_bitmap(bytes(bitmap)) == mask
+    assert from_bitmap(b"") == 0
+
+
+@pytest.mark.parametrize("mask", [-1, 1 << 10_000])
+def test_invalid_mask(mask):
+    with pytest.raises(ValueError, match="invalid symbol mask"):
+        to_names(mask)
+    with pytest.raises(ValueError, match="invalid symbol mask"):
+        to_bitmap(mask)
+
+
+def test_invalid_bitmap():
+    with pytest.raises(ValueError, match="invalid symbol mask"):
+        from_bitmap(b"\xff" * (symbol_count() // 8 + 2))
+
+
+@pytest.mark.parametrize("version", _VERSIONS)
+def test_mask_at(version):
+    surface = surface_at(version)
+    assert mask_at(version) == to_mask(
+        entry.symbol for entry in (*surface.functions, *surface.datas)
+    )
+
+
+def test_mask_at_bounds():
+    assert mask_at(PyVersion(2, 7)) == 0
+    assert mask_at(PyVersion(4, 0)) == (1 << symbol_count()) - 1
+
+
+def test_feature_macro_mask():
+    for name in abi3info.FEATURE_MACROS:
+        assert feature_macro_mask(name) == to_mask(
+            entry.symbol
+            for entry in _symbols()
+            if entry.ifdef is not None and entry.ifdef.name == name
+        )
+
+    assert feature_macro_mask("HAVE_FORK")
+    with pytest.raises(KeyError):
+        feature_macro_mask("PyFoo")
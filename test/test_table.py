@@ -0,0 +1,203 @@
+import copy
+import pickle
+
+import pytest
+
+from abi3info._table import MangledTable, SymbolTable, Table
+from abi3info.models import Macro, PyVersion, Symbol
+
+
+def _macros() -> Table[str, Macro]:
+    return Table(("foo", "bar"), lambda idx, name: Macro(name, PyVersion.intern(3, idx)))
+
+
+def _symbols() -> SymbolTable[Symbol]:
+    return SymbolTable(("foo", "bar"), lambda idx, symbol: symbol)
+
+
+def _mangled() -> MangledTable[Symbol]:
+    return MangledTable("macos", (_symbols(), SymbolTable(("baz",), lambda idx, s: s)))
+
+
+class TestTable:
+    def test_mapping(self):
+        table = _macros()
+
+        assert len(table) == 2
+        assert list(table) == ["foo", "bar"]
+        assert table["bar"] == Macro("bar", PyVersion(3, 1))
+        assert table.get("baz") is None
+        assert dict(table) == {
+            "foo": Macro("foo", PyVersion(3, 0)),
+            "bar": Macro("bar", PyVersion(3, 1)),
+        }
+
+        with pytest.raises(KeyError):
+            table["baz"]
+
+    def test_lazy(self):
+        table = _macros()
+
+        assert "foo" in table
+        assert "baz" not in table
+        assert table._values == {}
+
+        foo = table["foo"]
+        assert table._values == {0: foo}
+        assert table["foo"] is foo
+
+    def test_immutable(self):
+        table = _macros()
+
+        with pytest.raises(TypeError):
+            table["foo"] = Macro("foo", PyVersion(3, 2))
+
+        with pytest.raises(TypeError):
+            del table["foo"]
+
+        with pytest.raises(AttributeError, match="Table is immutable"):
+            table._values = {}
+
+        with pytest.raises(AttributeError, match="Table is immutable"):
+            del table._values
+
+        with pytest.raises(AttributeError):
+            table.__dict__
+
+    @pytest.mark.parametrize("build", [_macros, _symbols, _mangled])
+    def test_copy(self, build):
+        table = build()
+
+        assert copy.copy(table) is table
+        assert copy.deepcopy(table) is table
+        assert copy.deepcopy([table, table]) == [table, table]
+
+        # Only tables loaded by `abi3info` can be pickled (by reference).
+        with pytest.raises(TypeError, match="not loaded by abi3info"):
+            pickle.dumps(table)
+
+    def test_views(self):
+        table = _macros()
+
+        assert list(table.values()) == [table["foo"], table["bar"]]
+        assert list(table.items()) == [("foo", table["foo"]), ("bar", table["bar"])]
+        assert len(table.values()) == len(table.items()) == 2
+        assert table["foo"] in table.values()
+        assert ("bar", table["bar"]) in table.items()
+
+    def test_repr(self):
+        assert repr(_macros()) == (
+            "Table({'foo': Macro(name='foo', added=PyVersion(major=3, minor=0)), "
+            "'bar': Macro(name='bar', added=PyVersion(major=3, minor=1))})"
+        )
+
+
+class TestSymbolTable:
+    def test_mapping(self):
+        table = _symbols()
+
+        assert list(table) == [Symbol("foo"), Symbol("bar")]
+        assert Symbol("foo") in table
+        assert Symbol("baz") not in table
+
+        # Only `Symbol`s can be keys.
+        assert "foo" not in table
+        with pytest.raises(KeyError):
+            table["foo"]
+
+    def test_get_name(self):
+        table = _symbols()
+
+        assert table._get_name("foo") == Symbol("foo")
+        assert table._get_name(b"bar") == Symbol("bar")
+        assert table._get_name(Symbol("bar")) is table._get_name("bar")
+        assert table._get_name("baz") is None
+        assert table._get_name(b"\xff") is None
+
+        # Lookups by name build the same values as lookups by `Symbol`.
+        assert table._get_name("foo") is table[Symbol("foo")]
+
+    def test_shared_symbols(self):
+        table = _symbols()
+
+        (foo, _) = table
+        assert table[Symbol("foo")] is foo
+
+        # Iterating over the values or items builds each `Symbol` only once.
+        assert [key for key, _ in table.items()] == list(table.values())
+        assert all(key is value for key, value in table.items())
+        assert table._symbols == {0: foo, 1: table._key(1)}
+
+
+class TestMangledTable:
+    def test_mapping(self):
+        table = _mangled()
+
+        assert len(table) == 3
+        assert list(table) == ["_foo", "_bar", "_baz"]
+        assert table["_foo"] == Symbol("foo")
+        assert table["_baz"] == Symbol("baz")
+        assert "_bar" in table
+
+        # Keys must be mangled names, from one of the underlying tables.
+        for key in ("foo", "_qux", "", Symbol("_foo")):
+            assert key not in table
+            with pytest.raises(KeyError):
+                table[key]
+
+    def test_shared_values(self):
+        symbols = _symbols()
+        table = MangledTable("windows_import", (symbols,))
+
+        (foo, _) = symbols
+        assert table["__imp_foo"] is symbols[foo]
+        assert next(iter(table)) is foo.windows_import
+
+    def test_unprefixed(self):
+        table = MangledTable("linux", (_symbols(),))
+        assert list(table) == ["foo", "bar"]
+        assert table["bar"] == Symbol("bar")
+
+    def test_lazy(self):
+        table = _mangled()
+        assert table._indexes == {}
+        assert len(table) == 3
+        assert table._indexes == {}
+
+        # Lookups build each table's reverse index once, but not the values.
+        assert "_bar" in table
+        indexes = table._indexes[None]
+        assert indexes == ({"_foo": 0, "_bar": 1}, {"_baz": 0})
+        assert [len(symbols._values) for symbols in table._tables] == [0, 0]
+
+        # ...and each value that's looked up is cached by its mangled name.
+        baz = table["_baz"]
+        assert table._indexes[None] is indexes
+        assert table._entries == {"_baz": baz}
+        assert table["_baz"] is baz
+
+    def test_build_all(self):
+        table = _mangled()
+        table._build_all()
+        assert None in table._indexes
+        assert table._entries == dict(zip(table, table.values()))
+
+        for symbols in table._tables:
+            assert len(symbols._values) == len(symbols)
+            for symbol in symbols:
+                assert hasattr(symbol, "_macos")
+
+    def test_immutable(self):
+        table = _mangled()
+
+        with pytest.raises(AttributeError, match="MangledTable is immutable"):
+            table._platform = "linux"
+
+        with pytest.raises(AttributeError, match="MangledTable is immutable"):
+            del table._tables
+
+    def test_repr(self):
+        assert repr(MangledTable("macos", (_symbols(),))) == (
+            "MangledTable({'_foo': Symbol(name='foo', visibility=None), "
+            "'_bar': Symbol(name='bar', visibility=None)})"
+        )
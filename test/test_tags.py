@@ -0,0 +1,94 @@
+import pytest
+
+from abi3info.models import PyVersion
+from abi3info.tags import WheelTags, parse_wheel_tags
+
+
+@pytest.mark.parametrize(
+    ("item", "expected"),
+    [
+        (
+            "foo-1.0-cp38-abi3-manylinux_2_17_x86_64.whl",
+            WheelTags((PyVersion(3, 8),), ("abi3",), ("manylinux_2_17_x86_64",), PyVersion(3, 8)),
+        ),
+        (
+            "foo-1.0-1build-cp310-cp310-win_amd64.whl",
+            WheelTags((PyVersion(3, 10),), ("cp310",), ("win_amd64",), None),
+        ),
+        (
+            "foo-1.0-cp39.cp38-abi3-macosx_11_0_arm64.macosx_10_9_x86_64.whl",
+            WheelTags(
+                (PyVersion(3, 9), PyVersion(3, 8)),
+                ("abi3",),
+                ("macosx_11_0_arm64", "macosx_10_9_x86_64"),
+                PyVersion(3, 8),
+            ),
+        ),
+        (
+            "foo-1.0-cp3_10-abi3-any.whl",
+            WheelTags((PyVersion(3, 10),), ("abi3",), ("any",), PyVersion(3, 10)),
+        ),
+        (
+            "foo-1.0-cp3999.cp3256.cp38-abi3-any.whl",
+            WheelTags((PyVersion(3, 8),), ("abi3",), ("any",), PyVersion(3, 8)),
+        ),
+        (
+            "foo-1.0-cp3255-abi3-any.whl",
+            WheelTags((PyVersion(3, 255),), ("abi3",), ("any",), PyVersion(3, 255)),
+        ),
+        (
+            "foo-1.0-cp3999-abi3-any.whl",
+            WheelTags((), ("abi3",), ("any",), None),
+        ),
+        (
+            "foo-1.0-py3-none-any.whl",
+            WheelTags((), ("none",), ("any",), None),
+        ),
+        (
+            "foo-1.0-py3.cp3.pp39-abi3-any.whl",
+            WheelTags((), ("abi3",), ("any",), None),
+        ),
+        (
+            ("cp37.cp312", "abi3.none", "any"),
+            WheelTags(
+                (PyVersion(3, 7), PyVersion(3, 12)), ("abi3", "none"), ("any",), PyVersion(3, 7)
+            ),
+        ),
+    ],
+)
+def test_parse_wheel_tags(item, expected):
+    [tags] = parse_wheel_tags([item])
+    assert tags == expected
+
+    # Parsed versions are interned.
+    for version in tags.python:
+        assert version is PyVersion.intern(version.major, version.minor)
+
+
+@pytest.mark.parametrize(
+    "item",
+    [
+        "foo-1.0-cp38-abi3-any.tar.gz",
+        "foo-cp38-abi3-any.whl",
+        "cp38-abi3-any.whl",
+        "",
+    ],
+)
+def test_parse_wheel_tags_invalid(item):
+    assert parse_wheel_tags([item]) == [None]
+
+
+def test_parse_wheel_tags_batch():
+    items = [
+        "foo-1.0-cp38-abi3-any.whl",
+        "not-a-wheel",
+        "bar-2.0-cp38-abi3-any.whl",
+        ("cp38", "abi3", "any"),
+    ]
+
+    results = parse_wheel_tags(iter(items))
+    assert len(results) == len(items)
+    assert results[1] is None
+
+    # Identical tags are only parsed once, and shared.
+    assert results[0] is results[2] is results[3]